@@ -0,0 +1,339 @@
+"""
+Local replay server for offline benchmarks.
+
+``FakeCDN`` serves recorded platform responses (post pages, API JSON,
+script bundles, HLS playlists) from ``benchmark/fixtures`` and synthetic
+media payloads, with configurable time to first byte, bandwidth and Range
+support.  ``routes.json`` maps (host, path) patterns to fixtures:
+
+* ``file`` - a recorded response; ``{{name}}`` placeholders are filled from
+  the named groups of the path pattern, the query string, the form body
+  (and its JSON ``variables``), plus ``expires`` / ``oe`` (a signature
+  expiry one day ahead, decimal / hex),
+* ``redirect`` - a 302 to the filled-in URL,
+* ``media`` - ``file`` serves the whole payload, ``segment`` one of
+  ``segments`` equal slices of it (HLS ``.ts`` segments),
+* ``doc_id`` - a GraphQL route that answers ``errors`` without ``data`` for
+  any other doc id, like Threads does for a stale one.
+
+``route_through(cdn)`` points the process's HTTP clients (the shared
+urllib3 pool and every ``requests`` session) at the server: a request for
+``https://www.douyin.com/video/1`` is sent to
+``http://127.0.0.1:<port>/www.douyin.com/video/1``.  yt-dlp has its own
+network stack and is not redirected, so the yt-dlp extractors cannot be
+benchmarked offline.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit, urlunsplit
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+RANGE_RE = re.compile(r"bytes=(\d*)-(\d*)$")
+WRITE_CHUNK = 64 * 1024
+
+
+def make_payload(size: int) -> bytes:
+    """Deterministic media bytes (an ``ftyp`` box followed by noise)."""
+    head = b"\x00\x00\x00\x18ftypmp42\x00\x00\x00\x00mp42isom"
+    block = hashlib.sha256(b"fake-cdn").digest() * 2048
+    body = (block * (size // len(block) + 1))[: max(size - len(head), 0)]
+    return head + body
+
+
+class Route:
+    def __init__(self, spec: Dict, fixtures_dir: str) -> None:
+        self.spec = spec
+        self.host = re.compile(spec["host"] + r"$")
+        self.path = re.compile(spec["path"])
+        self.method = spec.get("method", "GET")
+        self.body: Optional[str] = None
+        if "file" in spec:
+            with open(os.path.join(fixtures_dir, spec["file"]), "r", encoding="utf-8") as f:
+                self.body = f.read()
+
+    def match(self, method: str, host: str, path: str) -> Optional[re.Match]:
+        if method not in (self.method, "HEAD") or not self.host.match(host):
+            return None
+        return self.path.search(path)
+
+
+class FakeCDN:
+    """Threaded HTTP server replaying the fixtures under ``routes.json``."""
+
+    def __init__(
+        self,
+        fixtures_dir: str = FIXTURES_DIR,
+        latency: float = 0.0,
+        bandwidth: Optional[float] = None,
+        ranges: bool = True,
+        media_size: int = 12 * 1024 * 1024,
+    ) -> None:
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.ranges = ranges
+        self.payload = make_payload(media_size)
+        self.etag = '"%s"' % hashlib.md5(self.payload).hexdigest()
+        with open(os.path.join(fixtures_dir, "routes.json"), "r", encoding="utf-8") as f:
+            self.routes = [Route(spec, fixtures_dir) for spec in json.load(f)]
+        self._lock = threading.Lock()
+        self.requests: Dict[str, int] = {}
+        self.bytes_sent = 0
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    # ------------------------------------------------------------------
+
+    def start(self) -> "FakeCDN":
+        cdn = self
+
+        class Handler(_Handler):
+            server_cdn = cdn
+
+        self._server = _Server(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self._server.serve_forever, name="fake-cdn", daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def rewrite(self, url: str) -> str:
+        """Map an upstream URL onto this server (local URLs are left alone)."""
+        parts = urlsplit(url)
+        if not parts.hostname or parts.hostname in ("127.0.0.1", "localhost"):
+            return url
+        local = urlsplit(self.url)
+        return urlunsplit(("http", local.netloc, f"/{parts.hostname}{parts.path or '/'}", parts.query, ""))
+
+    def _count(self, route: str, sent: int = 0) -> None:
+        with self._lock:
+            self.requests[route] = self.requests.get(route, 0) + 1
+            self.bytes_sent += sent
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {"requests": dict(self.requests), "bytes_sent": self.bytes_sent}
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address) -> None:
+        # 클라이언트가 연결을 먼저 끊는 것은 정상 (취소된 구간 요청 등)
+        pass
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_cdn: FakeCDN
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        self._serve("GET")
+
+    def do_POST(self) -> None:
+        self._serve("POST")
+
+    def do_HEAD(self) -> None:
+        self._serve("HEAD")
+
+    # ------------------------------------------------------------------
+
+    def _serve(self, method: str) -> None:
+        cdn = self.server_cdn
+        parts = urlsplit(self.path)
+        host, _, path = parts.path.lstrip("/").partition("/")
+        path = "/" + path
+        form = self._read_form()
+
+        for route in cdn.routes:
+            match = route.match(method, host, path)
+            if match:
+                break
+        else:
+            cdn._count("unmatched")
+            return self._send(404, b"no fixture for this URL", "text/plain")
+
+        if cdn.latency:
+            time.sleep(cdn.latency)
+
+        spec = route.spec
+        values = self._template_values(match, parts.query, form, spec.get("vars") or {})
+        name = spec.get("file") or spec.get("media") or "redirect"
+
+        if "redirect" in spec:
+            cdn._count(name)
+            return self._send(302, b"", "text/plain", {"Location": _fill(spec["redirect"], values)})
+        if "doc_id" in spec and form.get("doc_id") != spec["doc_id"]:
+            cdn._count(f"{name} (stale doc_id)")
+            body = json.dumps({"errors": [{"message": "Query not found"}], "data": None}).encode()
+            return self._send(200, body, spec["type"])
+        if spec.get("media") == "segment":
+            count = int(spec.get("segments", 1))
+            index = min(int(values.get("segment") or 0), count - 1)
+            size = len(cdn.payload) // count
+            end = len(cdn.payload) if index == count - 1 else (index + 1) * size
+            return self._send_media(name, cdn.payload[index * size:end], spec["type"])
+        if spec.get("media"):
+            return self._send_media(name, cdn.payload, spec["type"])
+
+        body = _fill(route.body, values).encode("utf-8")
+        cdn._count(name, len(body))
+        self._send(200, body, spec["type"])
+
+    def _read_form(self) -> Dict[str, str]:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        raw = self.rfile.read(length).decode("utf-8", errors="ignore")
+        form = dict(parse_qsl(raw))
+        try:
+            variables = json.loads(form.get("variables") or "{}")
+        except ValueError:
+            variables = {}
+        if isinstance(variables, dict):
+            form.update({k: str(v) for k, v in variables.items()})
+        return form
+
+    @staticmethod
+    def _template_values(match: re.Match, query: str, form: Dict[str, str], aliases: Dict[str, str]) -> Dict[str, str]:
+        expires = int(time.time()) + 86400
+        values = {"expires": str(expires), "oe": format(expires, "X")}
+        values.update(parse_qsl(query))
+        values.update(form)
+        values.update({k: v for k, v in match.groupdict().items() if v is not None})
+        for name, source in aliases.items():
+            if source in values:
+                values[name] = values[source]
+        return values
+
+    def _send_media(self, name: str, data: bytes, content_type: str) -> None:
+        cdn = self.server_cdn
+        status, start, end = 200, 0, len(data) - 1
+        headers = {"ETag": cdn.etag, "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}
+        if cdn.ranges:
+            headers["Accept-Ranges"] = "bytes"
+            byte_range = _parse_range(self.headers.get("Range"), len(data))
+            if byte_range == "invalid":
+                headers["Content-Range"] = f"bytes */{len(data)}"
+                cdn._count(name)
+                return self._send(416, b"", content_type, headers)
+            if byte_range:
+                status, (start, end) = 206, byte_range
+                headers["Content-Range"] = f"bytes {start}-{end}/{len(data)}"
+        body = memoryview(data)[start:end + 1]
+        cdn._count(name, 0 if self.command == "HEAD" else len(body))
+        self._send(status, body, content_type, headers)
+
+    def _send(self, status: int, body, content_type: str, headers: Optional[Dict[str, str]] = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        if self.command == "HEAD" or not body:
+            return
+        try:
+            self._write_throttled(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def _write_throttled(self, body) -> None:
+        bandwidth = self.server_cdn.bandwidth
+        started = time.monotonic()
+        sent = 0
+        for offset in range(0, len(body), WRITE_CHUNK):
+            chunk = body[offset:offset + WRITE_CHUNK]
+            self.wfile.write(chunk)
+            sent += len(chunk)
+            if bandwidth:
+                # 연결마다 대역폭 제한 (실제 CDN의 연결당 속도와 비슷하게)
+                ahead = sent / bandwidth - (time.monotonic() - started)
+                if ahead > 0:
+                    time.sleep(ahead)
+
+
+def _parse_range(header: Optional[str], size: int):
+    if not header:
+        return None
+    match = RANGE_RE.match(header.strip())
+    if not match:
+        return None
+    first, last = match.groups()
+    if not first:
+        if not last:
+            return None
+        start, end = max(size - int(last), 0), size - 1
+    else:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        return "invalid"
+    return start, end
+
+
+def _fill(template: str, values: Dict[str, str]) -> str:
+    return PLACEHOLDER_RE.sub(lambda m: values.get(m.group(1), m.group(0)), template)
+
+
+# ----------------------------------------------------------------------
+# 프로세스의 HTTP 클라이언트를 가짜 CDN으로 돌린다
+
+_installed: List[Tuple[object, str, object]] = []
+
+
+def route_through(cdn: FakeCDN) -> None:
+    """Send every outgoing urllib3/requests request to *cdn* until ``restore()``."""
+    import requests.adapters
+    import urllib3
+
+    restore()
+    pool_urlopen = urllib3.PoolManager.urlopen
+    adapter_send = requests.adapters.HTTPAdapter.send
+
+    def urlopen(self, method, url, redirect=True, **kw):
+        return pool_urlopen(self, method, cdn.rewrite(url), redirect=redirect, **kw)
+
+    def send(self, request, **kw):
+        original = request.url
+        local = request.copy()
+        local.url = cdn.rewrite(original)
+        response = adapter_send(self, local, **kw)
+        # requests가 리다이렉트/쿠키를 원래 URL 기준으로 처리하도록 되돌린다
+        response.url = original
+        response.request = request
+        return response
+
+    _installed.append((urllib3.PoolManager, "urlopen", pool_urlopen))
+    _installed.append((requests.adapters.HTTPAdapter, "send", adapter_send))
+    urllib3.PoolManager.urlopen = urlopen
+    requests.adapters.HTTPAdapter.send = send
+
+
+def restore() -> None:
+    """Undo ``route_through``."""
+    while _installed:
+        owner, name, original = _installed.pop()
+        setattr(owner, name, original)
+
+
+__all__ = ["FakeCDN", "FIXTURES_DIR", "make_payload", "route_through", "restore"]
@@ -0,0 +1,108 @@
+"""
+Micro-benchmark for ``Tool.pick_best_url`` on large candidate lists.
+
+The Douyin/TikTok HTML fallbacks pass every URL found on the page to
+``pick_best_url``; on a multi-MB page that is thousands of candidates,
+mostly scripts, styles and images, with many repeats.  This builds such a
+page from ``benchmark/fixtures/douyin_video.html`` plus synthetic assets
+and play URLs, extracts the candidates the way the fallback does and
+times the ranking:
+
+* ``cold`` - the per-URL rank cache is cleared before every call (a new page),
+* ``warm`` - the same list again (a retry, or another worker's page).
+
+    python -m benchmark.bench_pick_best_url
+    python -m benchmark.bench_pick_best_url --sizes 1000 10000 --repeat 10 --json pick.json
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import time
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmark.FakeCDN import FIXTURES_DIR  # noqa: E402
+from common import Tool  # noqa: E402
+
+URL_RE = re.compile(r"https?://[^\"'<>\s]+")
+
+
+def build_page(size: int, seed: int = 7) -> str:
+    """HTML with about *size* URLs: the fixture page plus synthetic filler."""
+    rnd = random.Random(seed)
+    with open(os.path.join(FIXTURES_DIR, "douyin_video.html"), "r", encoding="utf-8") as f:
+        parts = [f.read()]
+    for i in range(size):
+        roll = rnd.random()
+        if roll < 0.35:
+            url = f"https://lf-douyin-pc-web.douyinstatic.com/obj/douyin-pc-web/chunk-{rnd.randint(0, 400)}.js"
+        elif roll < 0.45:
+            url = f"https://lf-douyin-pc-web.douyinstatic.com/obj/douyin-pc-web/style-{rnd.randint(0, 80)}.css"
+        elif roll < 0.75:
+            url = (f"https://p3-pc.douyinpic.com/aweme/100x100/aweme-avatar/{rnd.getrandbits(40):x}"
+                   f"~tplv-dy-resize-origshort-autoq-75:{rnd.choice((330, 720, 1080))}.jpeg?from={i}")
+        elif roll < 0.9:
+            url = (f"https://www.iesdouyin.com/aweme/v1/play/?video_id=v0{rnd.getrandbits(32):x}"
+                   f"&ratio={rnd.choice(('540p', '720p', '1080p'))}&line=0&br={rnd.randint(600, 4000)}")
+        else:
+            url = (f"https://v26-web.douyinvod.com/{rnd.getrandbits(48):x}/video/tos/cn/"
+                   f"tos-cn-ve-15/{rnd.getrandbits(32):x}/?a=6383&br={rnd.randint(600, 4000)}&bt=1500&cs=0")
+        parts.append(f'<a href="{url}">{i}</a>')
+    return "\n".join(parts)
+
+
+def time_calls(candidates: List[str], repeat: int, cold: bool) -> float:
+    """Median seconds per ``pick_best_url`` call."""
+    samples = []
+    for _ in range(repeat):
+        if cold:
+            Tool._rank_url.cache_clear()
+            Tool._extract_quality_metrics.cache_clear()
+        started = time.perf_counter()
+        Tool.pick_best_url(candidates, platform="douyin")
+        samples.append(time.perf_counter() - started)
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def run(size: int, repeat: int) -> Dict:
+    candidates = URL_RE.findall(build_page(size))
+    Tool.pick_best_url(candidates, platform="douyin")  # 워밍업 (정규식 컴파일 등)
+    cold = time_calls(candidates, repeat, cold=True)
+    warm = time_calls(candidates, repeat, cold=False)
+    return {
+        "candidates": len(candidates),
+        "unique": len(set(candidates)),
+        "best": Tool.pick_best_url(candidates, platform="douyin"),
+        "cold_ms": round(cold * 1000, 2),
+        "warm_ms": round(warm * 1000, 2),
+        "cold_us_per_candidate": round(cold * 1e6 / len(candidates), 2),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000, 20000],
+                        help="synthetic URLs per page")
+    parser.add_argument("--repeat", type=int, default=5, help="calls per measurement (median)")
+    parser.add_argument("--json", help="write the results to this file")
+    args = parser.parse_args(argv)
+
+    results = {str(size): run(size, args.repeat) for size in args.sizes}
+    print(f"\n{'size':>7}{'cands':>8}{'unique':>8}{'cold ms':>10}{'warm ms':>10}{'us/cand':>9}")
+    for size, r in results.items():
+        print(f"{size:>7}{r['candidates']:>8}{r['unique']:>8}{r['cold_ms']:>10.2f}"
+              f"{r['warm_ms']:>10.2f}{r['cold_us_per_candidate']:>9.2f}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
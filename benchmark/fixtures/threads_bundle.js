@@ -0,0 +1 @@
+__d("Barcelonatcqodhgo",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:418,h:526,k:"tcqodhgo"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonalahdkmhu",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:977,h:532,k:"lahdkmhu"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonahkshmubq",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:915,h:663,k:"hkshmubq"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonazjipywpo",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:113,h:155,k:"zjipywpo"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonavmohttfy",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:713,h:962,k:"vmohttfy"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaprmfzdiy",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:870,h:865,k:"prmfzdiy"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaocjogwac",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:195,h:193,k:"ocjogwac"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaflannqoj",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:818,h:456,k:"flannqoj"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaqlwfdqqp",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:216,h:480,k:"qlwfdqqp"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonajrghmlkt",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:729,h:672,k:"jrghmlkt"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonasijyctwl",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:963,h:217,k:"sijyctwl"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonalvrukekv",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:965,h:216,k:"lvrukekv"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonakfnalhma",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:265,h:778,k:"kfnalhma"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonagvrolmih",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:276,h:908,k:"gvrolmih"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonawoflxbam",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:324,h:428,k:"woflxbam"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonavmvbprpz",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:302,h:654,k:"vmvbprpz"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonafcufwfiz",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:760,h:613,k:"fcufwfiz"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaewtyfvqk",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:397,h:663,k:"ewtyfvqk"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonarewpxtde",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:380,h:416,k:"rewpxtde"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonajvgrtzys",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:953,h:327,k:"jvgrtzys"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonavoxkseyl",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:605,h:559,k:"voxkseyl"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonarfbudctt",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:133,h:706,k:"rfbudctt"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonawqxeizcf",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:947,h:633,k:"wqxeizcf"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaaathocwo",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:645,h:344,k:"aathocwo"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonafgkuktae",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:444,h:481,k:"fgkuktae"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaccatxdbf",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:818,h:399,k:"ccatxdbf"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonavijxcgot",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:914,h:387,k:"vijxcgot"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonarazbxjhj",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:193,h:777,k:"razbxjhj"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonarpttemwr",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:575,h:485,k:"rpttemwr"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonazzoghiix",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:951,h:622,k:"zzoghiix"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonahewjmbhd",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:322,h:550,k:"hewjmbhd"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonazloqlqpa",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:739,h:871,k:"zloqlqpa"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonayxzwlmgf",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:455,h:608,k:"yxzwlmgf"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaxvmfqyen",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:288,h:583,k:"xvmfqyen"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaqgzguxhl",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:684,h:931,k:"qgzguxhl"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonadiiludpj",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:485,h:707,k:"diiludpj"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonasgknzazj",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:360,h:912,k:"sgknzazj"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaerrtsuew",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:895,h:274,k:"errtsuew"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonajvdzvnon",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:954,h:789,k:"jvdzvnon"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonawngdenfq",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:252,h:425,k:"wngdenfq"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonahunmiedf",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:839,h:691,k:"hunmiedf"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonagfpsrgou",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:615,h:597,k:"gfpsrgou"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonadagobyus",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:204,h:650,k:"dagobyus"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonangyjuxth",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:686,h:276,k:"ngyjuxth"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaulldpzcu",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:261,h:807,k:"ulldpzcu"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonajeirzxzd",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:161,h:959,k:"jeirzxzd"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonasbghgcii",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:953,h:188,k:"sbghgcii"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaipfiajoh",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:480,h:348,k:"ipfiajoh"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonazxndyhad",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:437,h:867,k:"zxndyhad"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonadowpyahg",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:459,h:137,k:"dowpyahg"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonakymnurmh",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:419,h:527,k:"kymnurmh"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonactzqxovn",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:698,h:887,k:"ctzqxovn"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaqypifnng",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:776,h:150,k:"qypifnng"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonargoshrqd",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:181,h:801,k:"rgoshrqd"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonalnaaiupu",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:261,h:963,k:"lnaaiupu"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonagpejnwux",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:309,h:246,k:"gpejnwux"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaumvavjam",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:552,h:837,k:"umvavjam"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonakqthkceb",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:786,h:180,k:"kqthkceb"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonajbzjjzrw",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:927,h:266,k:"jbzjjzrw"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonadcxucjay",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:841,h:477,k:"dcxucjay"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonawftmuqxn",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:225,h:220,k:"wftmuqxn"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaqojpomdn",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:333,h:489,k:"qojpomdn"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonagkpuwmmq",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:873,h:669,k:"gkpuwmmq"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaidsbuoig",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:257,h:551,k:"idsbuoig"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonamytiletq",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:275,h:535,k:"mytiletq"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaeihdranc",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:134,h:728,k:"eihdranc"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaovzjsowy",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:164,h:204,k:"ovzjsowy"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonazdmjqwaz",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:484,h:472,k:"zdmjqwaz"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaezpcaaeq",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:327,h:753,k:"ezpcaaeq"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaccrgtqce",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:396,h:940,k:"ccrgtqce"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonanoishkbs",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:860,h:199,k:"noishkbs"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonarvnjtbdd",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:538,h:165,k:"rvnjtbdd"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaswgsxivp",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:396,h:291,k:"swgsxivp"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonasnajoskj",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:663,h:381,k:"snajoskj"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonauuqcdzqp",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:448,h:334,k:"uuqcdzqp"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaldkqqjxj",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:482,h:353,k:"ldkqqjxj"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonanqitthno",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:363,h:933,k:"nqitthno"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonatzgeruez",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:929,h:671,k:"tzgeruez"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaaciwfliw",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:730,h:298,k:"aciwfliw"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonamofwudjv",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:920,h:206,k:"mofwudjv"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonafpuuqvnb",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:295,h:501,k:"fpuuqvnb"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonamvnglvwr",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:858,h:765,k:"mvnglvwr"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonajmvsmqmg",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:499,h:244,k:"jmvsmqmg"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaqykrobch",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:799,h:860,k:"qykrobch"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonacwrflziz",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:570,h:586,k:"cwrflziz"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonakjtlzfrv",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:281,h:274,k:"kjtlzfrv"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonacesqgpkd",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:637,h:258,k:"cesqgpkd"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaewrhzkjj",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:184,h:373,k:"ewrhzkjj"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonagmanhmoa",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:551,h:982,k:"gmanhmoa"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaumzadhmi",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:346,h:124,k:"umzadhmi"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonasdownsvq",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:192,h:352,k:"sdownsvq"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaojgblsbd",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:882,h:968,k:"ojgblsbd"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonasauwszwp",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:662,h:249,k:"sauwszwp"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonameroilmf",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:295,h:192,k:"meroilmf"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonawszyvukt",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:544,h:298,k:"wszyvukt"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonazjsvkbql",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:619,h:204,k:"zjsvkbql"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonabkiwxuiv",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:380,h:540,k:"bkiwxuiv"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonayqooooys",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:425,h:212,k:"yqooooys"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonawtfzdhxv",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:793,h:823,k:"wtfzdhxv"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaegegpvkg",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:441,h:845,k:"egegpvkg"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaopzbufbf",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:556,h:177,k:"opzbufbf"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonacoaapxnq",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:188,h:523,k:"coaapxnq"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaheybsnhk",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:412,h:745,k:"heybsnhk"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonapnmbuqak",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:138,h:721,k:"pnmbuqak"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaznghkaad",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:962,h:156,k:"znghkaad"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonanpwpldsm",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:694,h:423,k:"npwpldsm"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaamuintcp",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:655,h:639,k:"amuintcp"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonamdpdmvdp",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:849,h:542,k:"mdpdmvdp"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonazqtadxtp",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:991,h:885,k:"zqtadxtp"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonayjbtnvti",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:784,h:102,k:"yjbtnvti"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaphlsomdj",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:743,h:879,k:"phlsomdj"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonattbkjrhs",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:509,h:679,k:"ttbkjrhs"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonazvanorux",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:694,h:249,k:"zvanorux"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonatxpjurbw",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:396,h:782,k:"txpjurbw"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaaekwwbyz",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:350,h:131,k:"aekwwbyz"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaufzihxmh",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:863,h:821,k:"ufzihxmh"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonawqtyktse",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:924,h:897,k:"wqtyktse"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonadhoqmlez",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:559,h:279,k:"dhoqmlez"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaryjlaqiz",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:604,h:153,k:"ryjlaqiz"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonadfamrvxc",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:434,h:437,k:"dfamrvxc"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonacemejrwb",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:694,h:999,k:"cemejrwb"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonadzoqyepd",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:321,h:257,k:"dzoqyepd"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonazjhabidy",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:286,h:891,k:"zjhabidy"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaouqzkefk",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:823,h:799,k:"ouqzkefk"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonamvevsoiz",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:357,h:719,k:"mvevsoiz"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonarfetlehw",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:813,h:120,k:"rfetlehw"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonavdgyjyaj",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:430,h:200,k:"vdgyjyaj"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaxjyvozrf",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:553,h:209,k:"xjyvozrf"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaclmffgcy",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:106,h:193,k:"clmffgcy"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonavmcehovb",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:994,h:519,k:"vmcehovb"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonauodamkgh",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:701,h:907,k:"uodamkgh"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonanwlzorlw",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:971,h:230,k:"nwlzorlw"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonamcjnjjxd",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:319,h:547,k:"mcjnjjxd"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonakojguzpj",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:488,h:737,k:"kojguzpj"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonacdocsoni",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:606,h:364,k:"cdocsoni"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonamdhqwyuf",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:623,h:542,k:"mdhqwyuf"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonagapmkmud",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:670,h:751,k:"gapmkmud"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaxxcmvejn",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:627,h:231,k:"xxcmvejn"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonajkoojysp",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:726,h:736,k:"jkoojysp"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaefiuqanw",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:917,h:125,k:"efiuqanw"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonairplgnya",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:579,h:520,k:"irplgnya"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaxgwzvxcc",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:752,h:326,k:"xgwzvxcc"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonajmgnlsvv",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:565,h:748,k:"jmgnlsvv"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonanlmdhcjq",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:217,h:697,k:"nlmdhcjq"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaxoynvlsn",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:747,h:275,k:"xoynvlsn"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonahusqrnki",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:494,h:422,k:"husqrnki"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonapxobpsqg",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:777,h:154,k:"pxobpsqg"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonafbljzcgh",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:610,h:899,k:"fbljzcgh"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonajornrcbx",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:167,h:276,k:"jornrcbx"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonavgwcmeqx",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:409,h:470,k:"vgwcmeqx"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonacerkunhd",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:144,h:180,k:"cerkunhd"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonapkbxmuxi",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:480,h:556,k:"pkbxmuxi"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonahifoffyo",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:832,h:455,k:"hifoffyo"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonayzetwuzm",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:880,h:675,k:"yzetwuzm"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonacgjlvirh",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:754,h:928,k:"cgjlvirh"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonadrkmhtka",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:109,h:555,k:"drkmhtka"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonawnzuxljp",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:337,h:686,k:"wnzuxljp"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonawhjgxulr",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:878,h:589,k:"whjgxulr"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaslwmcasy",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:130,h:703,k:"slwmcasy"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonarwmuyukp",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:313,h:545,k:"rwmuyukp"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonazurtygpb",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:580,h:889,k:"zurtygpb"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonagkpyawij",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:781,h:804,k:"gkpyawij"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonayeuyozxt",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:784,h:966,k:"yeuyozxt"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonagjrptfxg",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:418,h:507,k:"gjrptfxg"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonakadjlxgs",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:250,h:277,k:"kadjlxgs"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonanxjdlyse",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:198,h:410,k:"nxjdlyse"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaiyqniuoj",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:883,h:867,k:"iyqniuoj"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonavwrkivxa",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:327,h:438,k:"vwrkivxa"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonahkygznik",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:124,h:847,k:"hkygznik"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaujjaqieg",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:474,h:219,k:"ujjaqieg"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaulkdqfni",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:188,h:692,k:"ulkdqfni"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaopjlqqyx",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:143,h:451,k:"opjlqqyx"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonantzirfpp",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:437,h:237,k:"ntzirfpp"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonahitwdhhh",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:134,h:301,k:"hitwdhhh"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonawqhervpl",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:981,h:610,k:"wqhervpl"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonalvbgvuhn",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:630,h:587,k:"lvbgvuhn"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonagbwkbcil",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:220,h:597,k:"gbwkbcil"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaeqqfzudq",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:737,h:252,k:"eqqfzudq"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonamejgsykp",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:180,h:590,k:"mejgsykp"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonakzmgylap",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:600,h:305,k:"kzmgylap"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonagrqdwoyx",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:329,h:715,k:"grqdwoyx"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaydkedgzr",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:840,h:757,k:"ydkedgzr"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaklvcndyr",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:144,h:404,k:"klvcndyr"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaumzzopiz",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:450,h:408,k:"umzzopiz"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaragpfcgl",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:793,h:695,k:"ragpfcgl"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonangxcvcqw",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:966,h:845,k:"ngxcvcqw"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonabteaqpot",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:776,h:934,k:"bteaqpot"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaiiansiqb",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:377,h:239,k:"iiansiqb"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaogxgheau",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:780,h:790,k:"ogxgheau"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonasiepnlan",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:529,h:814,k:"siepnlan"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonabqdpsxbm",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:812,h:239,k:"bqdpsxbm"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonapypfeyqm",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:921,h:997,k:"pypfeyqm"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaeqniichd",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:570,h:763,k:"eqniichd"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonalsdqrqfq",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:320,h:240,k:"lsdqrqfq"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaackhkhdb",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:528,h:285,k:"ackhkhdb"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonabcppvwxg",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:876,h:517,k:"bcppvwxg"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonajyxugerv",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:709,h:574,k:"jyxugerv"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaypfblrgz",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:442,h:221,k:"ypfblrgz"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaxgoddxxx",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:442,h:763,k:"xgoddxxx"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaqyqsrevu",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:148,h:771,k:"qyqsrevu"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaisapsyns",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:154,h:232,k:"isapsyns"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaknuncnhr",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:631,h:470,k:"knuncnhr"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaqmeniljt",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:192,h:551,k:"qmeniljt"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaakxdmpof",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:706,h:222,k:"akxdmpof"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonalbhsaebw",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:392,h:991,k:"lbhsaebw"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaovkbhvho",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:360,h:945,k:"ovkbhvho"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonawzpomdhf",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:917,h:927,k:"wzpomdhf"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonazldlswwz",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:570,h:248,k:"zldlswwz"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonabnxgcxzo",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:781,h:693,k:"bnxgcxzo"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonapzytedws",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:108,h:531,k:"pzytedws"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonanhqwxdsh",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:550,h:450,k:"nhqwxdsh"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonagskcotfx",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:837,h:630,k:"gskcotfx"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonakxcktadi",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:520,h:738,k:"kxcktadi"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonafuqkbodk",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:673,h:310,k:"fuqkbodk"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonafjrteqii",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:699,h:800,k:"fjrteqii"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaiozxejiw",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:549,h:317,k:"iozxejiw"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonatfsgoegx",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:440,h:277,k:"tfsgoegx"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonamyjmpmey",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:473,h:149,k:"myjmpmey"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonanuifqkvg",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:490,h:378,k:"nuifqkvg"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaeelwoqqt",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:311,h:240,k:"eelwoqqt"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonafukvyria",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:789,h:827,k:"fukvyria"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaxnfcicgd",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:942,h:403,k:"xnfcicgd"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonarpkthjiz",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:454,h:793,k:"rpkthjiz"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonazwzbwxsu",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:773,h:216,k:"zwzbwxsu"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonasbafsiqc",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:941,h:744,k:"sbafsiqc"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonasnghpryz",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:449,h:565,k:"snghpryz"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonabjiydmuy",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:464,h:901,k:"bjiydmuy"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonarjwdxgzt",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:758,h:827,k:"rjwdxgzt"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonavkjiitch",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:897,h:144,k:"vkjiitch"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonactmlsfun",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:447,h:375,k:"ctmlsfun"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonahufuvqqj",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:283,h:691,k:"hufuvqqj"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonadrfahlqq",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:587,h:239,k:"drfahlqq"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonarxnsofbl",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:950,h:188,k:"rxnsofbl"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaaukeatbz",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:288,h:231,k:"aukeatbz"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonajjwdqvfz",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:518,h:764,k:"jjwdqvfz"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaervjkfeo",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:268,h:556,k:"ervjkfeo"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonamfejmerk",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:665,h:345,k:"mfejmerk"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonamlzzcqkt",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:567,h:985,k:"mlzzcqkt"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaxdyyrrzu",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:686,h:988,k:"xdyyrrzu"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonadsitdekk",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:984,h:517,k:"dsitdekk"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaarddfwzn",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:915,h:366,k:"arddfwzn"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonakbexyiwd",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:480,h:455,k:"kbexyiwd"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonakueoouzb",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:447,h:411,k:"kueoouzb"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonakwqdxkbl",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:828,h:810,k:"kwqdxkbl"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaqmvlyrrs",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:471,h:560,k:"qmvlyrrs"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaieczjucw",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:299,h:772,k:"ieczjucw"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonanbbzqjrr",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:284,h:520,k:"nbbzqjrr"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonarrcehdve",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:788,h:552,k:"rrcehdve"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonautzwahbh",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:110,h:840,k:"utzwahbh"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonahyyemrye",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:260,h:972,k:"hyyemrye"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaqyxsmpzi",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:104,h:956,k:"qyxsmpzi"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonazhvkjrxz",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:598,h:917,k:"zhvkjrxz"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonablnevtoe",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:676,h:713,k:"blnevtoe"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonazvqkuaww",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:822,h:601,k:"zvqkuaww"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonarreakpwm",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:481,h:680,k:"rreakpwm"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaaupbdpcc",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:683,h:509,k:"aupbdpcc"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonakhiuouco",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:651,h:958,k:"khiuouco"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonarosjqtrl",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:598,h:968,k:"rosjqtrl"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaxgncndql",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:829,h:229,k:"xgncndql"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonarnvghhhh",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:449,h:123,k:"rnvghhhh"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonamijbaqnj",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:789,h:906,k:"mijbaqnj"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonarmtxjyxs",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:805,h:746,k:"rmtxjyxs"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonawfpoojmb",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:199,h:577,k:"wfpoojmb"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonatkfuqaxp",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:988,h:279,k:"tkfuqaxp"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonahilxttdk",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:106,h:695,k:"hilxttdk"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonallmtydkk",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:834,h:437,k:"llmtydkk"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonajefzasco",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:655,h:850,k:"jefzasco"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonakhqdalgn",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:647,h:364,k:"khqdalgn"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonakiracriw",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:674,h:756,k:"kiracriw"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonalcsrwmsi",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:940,h:875,k:"lcsrwmsi"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaalnajial",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:150,h:695,k:"alnajial"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonabhrwquod",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:708,h:446,k:"bhrwquod"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonacrwildec",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:859,h:902,k:"crwildec"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonazoozhfwr",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:928,h:381,k:"zoozhfwr"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaqkxpvyin",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:734,h:672,k:"qkxpvyin"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonasgcarrsb",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:249,h:917,k:"sgcarrsb"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaokfnnsjn",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:297,h:102,k:"okfnnsjn"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonavcwreeio",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:926,h:706,k:"vcwreeio"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonavwfwayat",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:966,h:473,k:"vwfwayat"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonakabnihhs",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:208,h:561,k:"kabnihhs"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonagcuwhdhh",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:201,h:549,k:"gcuwhdhh"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonasdknkpfz",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:511,h:582,k:"sdknkpfz"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonawfkmzofr",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:203,h:795,k:"wfkmzofr"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaudorpdcx",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:346,h:785,k:"udorpdcx"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonazlectvyn",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:583,h:583,k:"zlectvyn"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonamvetnpfo",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:394,h:663,k:"mvetnpfo"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonadtrfklht",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:745,h:934,k:"dtrfklht"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaxhhowmqp",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:547,h:651,k:"xhhowmqp"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonauzeghlkc",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:172,h:413,k:"uzeghlkc"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonadpfxouvo",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:101,h:512,k:"dpfxouvo"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonacsbqngaq",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:747,h:229,k:"csbqngaq"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonagylnkglu",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:734,h:297,k:"gylnkglu"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonarigyahkx",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:965,h:612,k:"rigyahkx"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonabbvjatwz",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:211,h:125,k:"bbvjatwz"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaymqnxola",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:750,h:853,k:"ymqnxola"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonatwoesbfv",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:831,h:745,k:"twoesbfv"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaoksiyroa",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:394,h:448,k:"oksiyroa"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonalacycoza",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:636,h:527,k:"lacycoza"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonadzxpzzcz",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:223,h:375,k:"dzxpzzcz"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaamcruqhm",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:977,h:326,k:"amcruqhm"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);
\ No newline at end of file
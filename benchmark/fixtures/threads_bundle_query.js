@@ -0,0 +1 @@
+__d("Barcelonadvktawqn",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:810,h:889,k:"dvktawqn"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonazssfqyuu",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:108,h:184,k:"zssfqyuu"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonafyhhfkkm",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:980,h:161,k:"fyhhfkkm"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonalnveqpgw",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:411,h:632,k:"lnveqpgw"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaaygkngxo",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:819,h:337,k:"aygkngxo"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonajbkxmshn",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:680,h:494,k:"jbkxmshn"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaccddjrdp",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:149,h:984,k:"ccddjrdp"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonawcxwtbgb",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:839,h:228,k:"wcxwtbgb"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonatqhtsnmh",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:375,h:453,k:"tqhtsnmh"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaeukuofoi",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:621,h:577,k:"eukuofoi"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonabjgrhpjs",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:780,h:752,k:"bjgrhpjs"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonasszzrlua",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:851,h:655,k:"sszzrlua"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonazxecdhxv",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:755,h:234,k:"zxecdhxv"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaafpfaril",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:491,h:938,k:"afpfaril"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonagpaivhke",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:524,h:369,k:"gpaivhke"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonalkkeaqjx",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:708,h:604,k:"lkkeaqjx"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonavauhcpov",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:310,h:952,k:"vauhcpov"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonapedqorda",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:427,h:288,k:"pedqorda"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonatrvguttz",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:487,h:643,k:"trvguttz"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonacvagsjcy",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:218,h:275,k:"cvagsjcy"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaoldgsmig",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:366,h:514,k:"oldgsmig"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonasdvnhimn",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:202,h:534,k:"sdvnhimn"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonazqffeieu",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:777,h:752,k:"zqffeieu"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaeqywygpr",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:273,h:311,k:"eqywygpr"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonahfemcplw",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:426,h:771,k:"hfemcplw"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonavchcsqaa",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:790,h:196,k:"vchcsqaa"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonasstycdyl",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:346,h:703,k:"sstycdyl"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonanqklxmsn",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:673,h:653,k:"nqklxmsn"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonawfyvrwzu",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:145,h:406,k:"wfyvrwzu"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonayggfsmoh",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:541,h:900,k:"yggfsmoh"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaphxwcpzn",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:522,h:823,k:"phxwcpzn"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaixjnzxiw",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:785,h:984,k:"ixjnzxiw"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonapwboplqa",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:769,h:581,k:"pwboplqa"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonafrjjdppc",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:172,h:275,k:"frjjdppc"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaoolpqiqk",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:497,h:733,k:"oolpqiqk"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaeoaurclj",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:253,h:460,k:"eoaurclj"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaykkxnptz",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:940,h:105,k:"ykkxnptz"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaeeglhmkm",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:233,h:677,k:"eeglhmkm"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaossqbust",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:956,h:948,k:"ossqbust"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonahkwbxers",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:678,h:168,k:"hkwbxers"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaxjlnupjm",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:616,h:477,k:"xjlnupjm"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonagiqhhpif",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:598,h:860,k:"giqhhpif"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonardgpzcnq",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:901,h:806,k:"rdgpzcnq"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonawizcdydl",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:604,h:933,k:"wizcdydl"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonahpcpliep",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:229,h:151,k:"hpcpliep"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonafwgspteh",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:591,h:372,k:"fwgspteh"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaoadmixxx",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:340,h:621,k:"oadmixxx"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonatjdjtbiu",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:268,h:345,k:"tjdjtbiu"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonauetqsoep",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:109,h:244,k:"uetqsoep"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonagwzrljjb",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:425,h:574,k:"gwzrljjb"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonachmioeiy",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:861,h:994,k:"chmioeiy"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonadehqgofd",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:421,h:567,k:"dehqgofd"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonakqmzffei",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:512,h:112,k:"kqmzffei"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaytpdcycn",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:264,h:328,k:"ytpdcycn"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaxdhhbkcu",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:177,h:890,k:"xdhhbkcu"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonamqldwwbq",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:228,h:652,k:"mqldwwbq"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaqdpsxokc",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:950,h:435,k:"qdpsxokc"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonawcdmdkbh",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:369,h:709,k:"wcdmdkbh"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaurbklduz",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:922,h:880,k:"urbklduz"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaphtpdggw",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:232,h:104,k:"phtpdggw"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonatetywaac",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:279,h:368,k:"tetywaac"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonasigddzkh",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:675,h:723,k:"sigddzkh"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaaftgtnyq",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:629,h:137,k:"aftgtnyq"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaddhfubcx",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:209,h:395,k:"ddhfubcx"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaixzmrmlp",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:133,h:694,k:"ixzmrmlp"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonahcsoblvn",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:574,h:691,k:"hcsoblvn"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonamtunfbsk",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:696,h:584,k:"mtunfbsk"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaaweaqikr",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:713,h:610,k:"aweaqikr"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaoucjdieq",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:129,h:645,k:"oucjdieq"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonahmyphlki",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:239,h:956,k:"hmyphlki"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonajvlhjcsu",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:737,h:125,k:"jvlhjcsu"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaavjktoiv",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:405,h:264,k:"avjktoiv"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonamlhzcvos",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:904,h:205,k:"mlhzcvos"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonadgqibjuu",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:686,h:600,k:"dgqibjuu"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaprwnpaql",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:388,h:132,k:"prwnpaql"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaobpmaklg",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:188,h:738,k:"obpmaklg"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaaqrplhyf",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:189,h:500,k:"aqrplhyf"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaalwmtdut",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:612,h:144,k:"alwmtdut"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonabmoqateb",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:453,h:227,k:"bmoqateb"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonavcryfgwu",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:926,h:189,k:"vcryfgwu"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaioznkvef",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:986,h:694,k:"ioznkvef"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonawladcryt",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:551,h:997,k:"wladcryt"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonadtskfyke",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:574,h:827,k:"dtskfyke"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonabvugeydc",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:905,h:989,k:"bvugeydc"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonasrmlpckw",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:277,h:906,k:"srmlpckw"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonarxeprkiv",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:406,h:826,k:"rxeprkiv"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonahosinjwr",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:333,h:264,k:"hosinjwr"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonafjplvmcy",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:377,h:589,k:"fjplvmcy"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonabiyujdcd",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:597,h:252,k:"biyujdcd"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaykbwtnpz",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:780,h:312,k:"ykbwtnpz"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaqsfcwpev",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:417,h:399,k:"qsfcwpev"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonadsqwopem",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:665,h:771,k:"dsqwopem"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaavlmbiqc",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:769,h:478,k:"avlmbiqc"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonafphjozdu",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:262,h:719,k:"fphjozdu"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaxuijryhi",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:111,h:520,k:"xuijryhi"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonallrcysvi",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:601,h:545,k:"llrcysvi"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonarqocblcv",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:249,h:647,k:"rqocblcv"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonabpvihzvb",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:449,h:123,k:"bpvihzvb"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonatwkitqgd",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:201,h:467,k:"twkitqgd"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonajcrqdoyh",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:472,h:382,k:"jcrqdoyh"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonabxthcvwu",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:318,h:498,k:"bxthcvwu"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonanjtlqzlr",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:434,h:316,k:"njtlqzlr"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaazyruxus",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:176,h:604,k:"azyruxus"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonacgxlqpag",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:690,h:750,k:"cgxlqpag"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonagbkrqxqf",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:233,h:878,k:"gbkrqxqf"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonalzelwgro",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:944,h:993,k:"lzelwgro"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonazuzvrfkc",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:433,h:592,k:"zuzvrfkc"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaxzgjprbb",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:163,h:574,k:"xzgjprbb"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonakxcsflml",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:975,h:170,k:"kxcsflml"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonarguorori",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:769,h:638,k:"rguorori"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonawpegeqqc",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:917,h:515,k:"wpegeqqc"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonanbbnewbu",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:663,h:249,k:"nbbnewbu"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaiqndyonw",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:528,h:434,k:"iqndyonw"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonamzqibqgw",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:235,h:899,k:"mzqibqgw"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonarlgxlblv",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:947,h:473,k:"rlgxlblv"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonafjngkrrd",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:387,h:785,k:"fjngkrrd"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonapnuwkjho",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:697,h:670,k:"pnuwkjho"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonalwtunncj",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:214,h:593,k:"lwtunncj"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaelftfvyk",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:339,h:961,k:"elftfvyk"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonahzhfoewv",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:864,h:692,k:"hzhfoewv"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonayiczcvpn",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:987,h:722,k:"yiczcvpn"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonayvroxclp",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:482,h:219,k:"yvroxclp"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonauccmyclj",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:480,h:625,k:"uccmyclj"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaiagecvqh",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:483,h:995,k:"iagecvqh"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaofnaeglj",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:730,h:375,k:"ofnaeglj"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonatknensev",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:661,h:605,k:"tknensev"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaigdinssy",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:401,h:947,k:"igdinssy"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonasuibcgue",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:668,h:888,k:"suibcgue"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonakbcepqyu",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:308,h:485,k:"kbcepqyu"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonafqjgzbhg",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:749,h:241,k:"fqjgzbhg"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonabqcwrpld",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:626,h:584,k:"bqcwrpld"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonakmwrbnwq",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:664,h:144,k:"kmwrbnwq"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonamwslbjfy",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:773,h:961,k:"mwslbjfy"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaymtbrvgr",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:134,h:237,k:"ymtbrvgr"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaxfsqamaf",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:327,h:769,k:"xfsqamaf"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonatdrvnqfa",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:519,h:908,k:"tdrvnqfa"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonapbgpcgdm",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:912,h:176,k:"pbgpcgdm"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonassohbwof",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:499,h:806,k:"ssohbwof"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaptcwnsjo",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:799,h:144,k:"ptcwnsjo"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonamlqsyrth",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:367,h:605,k:"mlqsyrth"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonabdekqavp",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:959,h:736,k:"bdekqavp"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonazsomjznu",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:958,h:652,k:"zsomjznu"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonatgbahotd",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:642,h:962,k:"tgbahotd"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaecbshcel",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:871,h:880,k:"ecbshcel"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonavnztarlx",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:619,h:213,k:"vnztarlx"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonarnofnfww",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:214,h:898,k:"rnofnfww"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonawouycrpl",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:481,h:199,k:"wouycrpl"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonatcqrywtf",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:471,h:867,k:"tcqrywtf"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaozgpepfg",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:443,h:725,k:"ozgpepfg"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("Barcelonaqxhonjpm",["react","BarcelonaEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:113,h:529,k:"qxhonjpm"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaPostPageQuery_threadsRelayOperation",[],(function(a,b,c,d,e,f){e.exports="7077000000000001"}),null);__d("BarcelonaTailmhpnwplv",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:867,h:605,k:"mhpnwplv"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailyagljzrj",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:269,h:311,k:"yagljzrj"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailccglecqe",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:142,h:781,k:"ccglecqe"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailiqkfvjgo",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:672,h:338,k:"iqkfvjgo"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailtddvqaut",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:190,h:923,k:"tddvqaut"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailrojrxtfy",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:721,h:641,k:"rojrxtfy"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailfnfcwxze",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:164,h:642,k:"fnfcwxze"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailnbjoyqrx",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:121,h:883,k:"nbjoyqrx"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailqictzmip",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:176,h:643,k:"qictzmip"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailwvefpzfa",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:420,h:846,k:"wvefpzfa"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailxulrbzeg",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:175,h:135,k:"xulrbzeg"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailwybfgyia",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:813,h:226,k:"wybfgyia"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailglkcqpel",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:554,h:856,k:"glkcqpel"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTaildpyqcfpc",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:340,h:678,k:"dpyqcfpc"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailvqffgkdh",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:838,h:300,k:"vqffgkdh"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailktakcyls",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:947,h:470,k:"ktakcyls"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailcljqluhw",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:515,h:706,k:"cljqluhw"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailxsiehjya",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:252,h:746,k:"xsiehjya"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailriwckapq",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:588,h:671,k:"riwckapq"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailxycqeisw",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:365,h:599,k:"xycqeisw"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailgfhotlxa",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:853,h:375,k:"gfhotlxa"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailiryaxudw",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:631,h:607,k:"iryaxudw"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailpvyjqrto",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:174,h:274,k:"pvyjqrto"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailpejiwdma",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:172,h:923,k:"pejiwdma"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailihbzrvgo",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:503,h:922,k:"ihbzrvgo"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailksfxqvmt",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:610,h:630,k:"ksfxqvmt"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailqrgipfkw",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:382,h:805,k:"qrgipfkw"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailcqusfvqa",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:554,h:403,k:"cqusfvqa"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailnglobcji",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:565,h:943,k:"nglobcji"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailebjztzne",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:363,h:627,k:"ebjztzne"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailnlqovrlv",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:110,h:213,k:"nlqovrlv"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailcaxindcz",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:355,h:672,k:"caxindcz"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailuvzgywwk",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:954,h:639,k:"uvzgywwk"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailcxbzcshw",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:976,h:448,k:"cxbzcshw"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailhekzxosf",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:237,h:194,k:"hekzxosf"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailhpcarbdo",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:783,h:237,k:"hpcarbdo"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailixelxxzk",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:870,h:655,k:"ixelxxzk"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailsbtrmqti",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:399,h:417,k:"sbtrmqti"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailvnkuywdf",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:803,h:840,k:"vnkuywdf"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailsqdjtlzx",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:895,h:464,k:"sqdjtlzx"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailvycdpist",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:506,h:433,k:"vycdpist"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailoerzsvoj",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:389,h:381,k:"oerzsvoj"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailfudrahew",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:468,h:116,k:"fudrahew"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailrkjjpchg",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:614,h:115,k:"rkjjpchg"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailtipsvyed",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:620,h:438,k:"tipsvyed"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailcedwdztb",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:711,h:923,k:"cedwdztb"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailphutjdmc",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:583,h:147,k:"phutjdmc"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTaildlhezywb",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:699,h:196,k:"dlhezywb"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailnuzeyvjv",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:596,h:337,k:"nuzeyvjv"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailmpgmuuwt",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:276,h:162,k:"mpgmuuwt"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailktyqgstp",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:860,h:873,k:"ktyqgstp"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailrriigqzg",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:568,h:105,k:"rriigqzg"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailmqvxegqq",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:820,h:697,k:"mqvxegqq"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailwsboqwoa",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:628,h:108,k:"wsboqwoa"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailzbvndxin",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:421,h:393,k:"zbvndxin"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTaillgpjohxj",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:480,h:648,k:"lgpjohxj"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailwqkfyujm",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:634,h:998,k:"wqkfyujm"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTaildzkwepzt",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:525,h:549,k:"dzkwepzt"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTaillloyxnmq",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:884,h:468,k:"lloyxnmq"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailfleabgkk",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:281,h:781,k:"fleabgkk"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailppewuvnh",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:352,h:425,k:"ppewuvnh"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailvakiagyw",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:999,h:872,k:"vakiagyw"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailjihwmeau",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:120,h:661,k:"jihwmeau"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailhbcjnuxe",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:733,h:705,k:"hbcjnuxe"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailucyhxzzx",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:261,h:284,k:"ucyhxzzx"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailhhcbrxcg",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:292,h:972,k:"hhcbrxcg"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailfbzcjecf",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:781,h:243,k:"fbzcjecf"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailcmtzjdza",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:657,h:393,k:"cmtzjdza"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailzkxbbdrx",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:229,h:619,k:"zkxbbdrx"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailxygmiwgz",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:971,h:819,k:"xygmiwgz"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailwdeexybs",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:577,h:847,k:"wdeexybs"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailifyrwvag",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:359,h:143,k:"ifyrwvag"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailpulwoafz",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:678,h:469,k:"pulwoafz"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailqeunuxqo",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:887,h:601,k:"qeunuxqo"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailbgrpngkz",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:503,h:130,k:"bgrpngkz"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailhjzxgvoh",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:965,h:626,k:"hjzxgvoh"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailecqgxdym",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:563,h:271,k:"ecqgxdym"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailwtpuclda",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:684,h:287,k:"wtpuclda"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailmjveyrss",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:870,h:711,k:"mjveyrss"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailezessteg",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:193,h:371,k:"ezessteg"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailwyxyvtip",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:886,h:411,k:"wyxyvtip"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailumcjybau",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:424,h:646,k:"umcjybau"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailcjnxvccq",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:706,h:914,k:"cjnxvccq"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailduyrkqgz",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:248,h:281,k:"duyrkqgz"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailhnewlrfm",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:537,h:853,k:"hnewlrfm"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailvzacnbad",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:235,h:928,k:"vzacnbad"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailfdjsqkqh",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:131,h:632,k:"fdjsqkqh"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTaildgvgmbcs",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:590,h:831,k:"dgvgmbcs"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTaillzzbtfcc",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:703,h:664,k:"lzzbtfcc"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailraymdhrq",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:466,h:358,k:"raymdhrq"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailwatoiwnj",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:639,h:665,k:"watoiwnj"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailmbsmcned",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:508,h:937,k:"mbsmcned"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailqsyizmxa",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:490,h:159,k:"qsyizmxa"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailwxghthas",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:297,h:279,k:"wxghthas"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailjlxdacdl",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:729,h:960,k:"jlxdacdl"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailctoabgyu",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:763,h:434,k:"ctoabgyu"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailykeacaqm",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:720,h:636,k:"ykeacaqm"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailvnfslgif",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:939,h:441,k:"vnfslgif"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailyvonotdh",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:176,h:683,k:"yvonotdh"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailizfplrps",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:826,h:949,k:"izfplrps"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailwophasjg",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:948,h:976,k:"wophasjg"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailbmukinxr",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:251,h:993,k:"bmukinxr"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailqlnqeqsl",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:302,h:908,k:"qlnqeqsl"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailzpkyyntk",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:811,h:137,k:"zpkyyntk"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailrgesovbc",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:284,h:489,k:"rgesovbc"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailwenlbtih",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:705,h:322,k:"wenlbtih"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailhukzarwz",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:696,h:207,k:"hukzarwz"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailpynkawln",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:635,h:601,k:"pynkawln"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailkgkwfzhz",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:428,h:603,k:"kgkwfzhz"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTaillpdnhavp",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:218,h:564,k:"lpdnhavp"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailutxmrpcd",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:813,h:871,k:"utxmrpcd"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTaillqtftbng",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:379,h:588,k:"lqtftbng"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTaillfeziyzk",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:444,h:713,k:"lfeziyzk"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailkahcjvkd",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:300,h:790,k:"kahcjvkd"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailsyhzzbyp",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:531,h:323,k:"syhzzbyp"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailfdohnxss",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:233,h:196,k:"fdohnxss"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailjecxyzpa",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:255,h:558,k:"jecxyzpa"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailgwigjuot",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:630,h:971,k:"gwigjuot"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailygqbkvab",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:597,h:208,k:"ygqbkvab"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailetxfnabv",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:358,h:299,k:"etxfnabv"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailstpzkldi",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:449,h:165,k:"stpzkldi"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailrwbvwqth",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:863,h:161,k:"rwbvwqth"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailtlhecsxj",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:562,h:580,k:"tlhecsxj"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTaildardioik",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:997,h:466,k:"dardioik"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailtvxyrnio",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:827,h:542,k:"tvxyrnio"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailhlkybmjy",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:828,h:784,k:"hlkybmjy"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailggafviye",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:437,h:571,k:"ggafviye"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailcxwkuyxe",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:601,h:233,k:"cxwkuyxe"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailniumvqeq",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:632,h:401,k:"niumvqeq"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTaildbyurwwc",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:506,h:978,k:"dbyurwwc"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailoaeeahri",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:635,h:273,k:"oaeeahri"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailhqpapbpt",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:905,h:171,k:"hqpapbpt"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailmurqkrhz",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:756,h:905,k:"murqkrhz"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailevzndedk",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:374,h:525,k:"evzndedk"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailzwyxmbqh",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:901,h:748,k:"zwyxmbqh"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailbkrxsbwk",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:685,h:720,k:"bkrxsbwk"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailwxkmjvwa",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:478,h:267,k:"wxkmjvwa"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailqupmyiyj",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:503,h:501,k:"qupmyiyj"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailtupekhqd",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:848,h:255,k:"tupekhqd"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailnaimuscj",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:310,h:701,k:"naimuscj"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailokachwku",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:251,h:278,k:"okachwku"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailhpeiskwk",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:630,h:244,k:"hpeiskwk"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailyitvcnvw",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:595,h:650,k:"yitvcnvw"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailyjmluahp",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:765,h:728,k:"yjmluahp"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*5}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailapfosoxp",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:481,h:213,k:"apfosoxp"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*6}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailhowgukbj",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:376,h:500,k:"howgukbj"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*7}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailtjpjcsbl",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:703,h:261,k:"tjpjcsbl"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*8}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailmelhmfqo",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:960,h:390,k:"melhmfqo"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*2}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailsvqcvaad",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:546,h:417,k:"svqcvaad"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*3}):[]}e.exports={get:h,cfg:g}}),null);__d("BarcelonaTailpeenhlox",["react","BarcelonaTailEnv"],(function(a,b,c,d,e,f){"use strict";var g={w:824,h:798,k:"peenhlox"};function h(a){return a!=null&&a.length>0?a.map(function(x){return x*4}):[]}e.exports={get:h,cfg:g}}),null);
\ No newline at end of file
@@ -0,0 +1,275 @@
+"""
+Offline end-to-end benchmarks for the download service.
+
+Starts a ``FakeCDN`` with the recorded fixtures, routes the extractors'
+HTTP traffic to it and drives the Flask app in-process through
+``/api/download`` -> ``/api/jobs/<id>`` -> ``/api/file/...``, the same way
+the web UI does.  Every scenario uses fresh media ids so the result and
+resolve caches start cold, except ``*_warm`` which repeats the ids of the
+scenario before it.
+
+Reports per scenario: jobs/s, MB/s, p50/p95 end-to-end latency, and per
+(platform, stage) latency from the ``Tracing`` spans.
+
+    python -m benchmark.run_benchmarks
+    python -m benchmark.run_benchmarks --requests 40 --concurrency 8 --latency 0.05 --bandwidth 20M
+    python -m benchmark.run_benchmarks --json bench.json
+    python -m benchmark.run_benchmarks --baseline bench.json --tolerance 0.25   # exit 1 on regression
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import random
+import shutil
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmark.FakeCDN import FakeCDN, route_through, restore  # noqa: E402
+
+POLL_INTERVAL = 0.02
+JOB_TIMEOUT = 300
+
+# (name, URL template, how to run it)
+SCENARIOS = (
+    ("douyin_mp4", "https://www.douyin.com/video/7{run}{i:04d}", "api"),
+    ("douyin_mp4_warm", "https://www.douyin.com/video/7{run}{i:04d}", "api"),
+    ("douyin_hls", "https://www.douyin.com/video/9{run}{i:04d}", "api"),
+    ("threads", "https://www.threads.net/@bench/post/B{run}{i:04d}", "api"),
+    # TikTok goes through yt-dlp in the app; this runs the HTML extractor directly
+    ("tiktok_html", "https://www.tiktok.com/@bench/video/7{run}{i:04d}", "direct"),
+)
+
+
+def parse_size(text: str) -> float:
+    """'20M' -> 20971520.0 (K/M/G suffixes are binary)"""
+    text = text.strip().upper().rstrip("B")
+    scale = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}.get(text[-1:], 1)
+    return float(text[:-1] if text[-1:] in "KMG" else text) * scale
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(int(round(q * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+class StageRecorder:
+    """Tracing listener that keeps span durations per (platform, stage)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.samples: Dict[str, List[float]] = {}
+
+    def __call__(self, kind, span, trace_attrs) -> None:
+        if kind != "span":
+            return
+        key = f"{trace_attrs.get('platform') or '-'}/{span.name}"
+        with self._lock:
+            self.samples.setdefault(key, []).append(span.duration or 0.0)
+
+    def reset(self) -> Dict[str, List[float]]:
+        with self._lock:
+            samples, self.samples = self.samples, {}
+        return samples
+
+
+def run_api_job(client, url: str) -> int:
+    """Submit *url*, wait for the job and fetch the file; returns the bytes received."""
+    resp = client.post("/api/download", json={"url": url, "mode": "file"})
+    if resp.status_code != 202:
+        raise RuntimeError(f"submit failed: {resp.status_code} {resp.get_data(as_text=True)[:200]}")
+    status_url = resp.get_json()["status_url"]
+    deadline = time.monotonic() + JOB_TIMEOUT
+    while True:
+        job = client.get(status_url).get_json()
+        if job["state"] == "done":
+            break
+        if job["state"] == "error":
+            raise RuntimeError(job.get("error") or "job failed")
+        if time.monotonic() > deadline:
+            raise RuntimeError("job timed out")
+        time.sleep(POLL_INTERVAL)
+    file_resp = client.get(job["download_url"])
+    size = len(file_resp.get_data())
+    file_resp.close()
+    return size
+
+
+def run_direct(url: str) -> int:
+    from common import Tracing
+    from controller import DouyinExtract
+
+    with Tracing.trace("direct", platform=DouyinExtract.detect_platform(url)):
+        path = DouyinExtract.download_tiktok_douyin_video(url)
+    try:
+        return os.path.getsize(path)
+    finally:
+        shutil.rmtree(os.path.dirname(path), ignore_errors=True)
+
+
+def run_scenario(app, name: str, template: str, kind: str, run_id: str, args) -> Dict:
+    urls = [template.format(run=run_id, i=i) for i in range(args.requests)]
+    latencies: List[float] = []
+    errors: List[str] = []
+    total_bytes = 0
+    lock = threading.Lock()
+
+    def one(url: str) -> None:
+        nonlocal total_bytes
+        started = time.monotonic()
+        try:
+            if kind == "api":
+                with app.test_client() as client:
+                    size = run_api_job(client, url)
+            else:
+                size = run_direct(url)
+        except Exception as e:
+            with lock:
+                errors.append(f"{url}: {e}")
+            return
+        with lock:
+            latencies.append(time.monotonic() - started)
+            total_bytes += size
+
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        list(pool.map(one, urls))
+    wall = time.monotonic() - started
+
+    return {
+        "requests": len(urls),
+        "errors": len(errors),
+        "error_samples": errors[:3],
+        "wall_s": round(wall, 3),
+        "jobs_per_s": round(len(latencies) / wall, 2) if wall else None,
+        "throughput_mb_s": round(total_bytes / wall / 1024 ** 2, 2) if wall else None,
+        "latency_p50_s": _round(percentile(latencies, 0.5)),
+        "latency_p95_s": _round(percentile(latencies, 0.95)),
+    }
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return round(value, 4) if value is not None else None
+
+
+def summarize_stages(samples: Dict[str, List[float]]) -> Dict[str, Dict]:
+    return {
+        key: {
+            "count": len(values),
+            "p50_ms": round(percentile(values, 0.5) * 1000, 1),
+            "p95_ms": round(percentile(values, 0.95) * 1000, 1),
+            "total_ms": round(sum(values) * 1000, 1),
+        }
+        for key, values in sorted(samples.items())
+    }
+
+
+def compare(results: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """Regressions of *results* against *baseline* beyond *tolerance* (0.25 = 25%)."""
+    problems = []
+    for name, current in results["scenarios"].items():
+        before = baseline.get("scenarios", {}).get(name)
+        if not before:
+            continue
+        if current["errors"] > before.get("errors", 0):
+            problems.append(f"{name}: {current['errors']} errors (baseline {before.get('errors', 0)})")
+        p50, base_p50 = current.get("latency_p50_s"), before.get("latency_p50_s")
+        if p50 and base_p50 and p50 > base_p50 * (1 + tolerance):
+            problems.append(f"{name}: p50 latency {p50:.3f}s vs {base_p50:.3f}s")
+        mbps, base_mbps = current.get("throughput_mb_s"), before.get("throughput_mb_s")
+        if mbps and base_mbps and mbps < base_mbps * (1 - tolerance):
+            problems.append(f"{name}: throughput {mbps:.2f} MB/s vs {base_mbps:.2f} MB/s")
+    return problems
+
+
+def print_report(results: Dict) -> None:
+    print(f"\n{'scenario':<18}{'req':>5}{'err':>5}{'jobs/s':>9}{'MB/s':>9}{'p50 s':>9}{'p95 s':>9}")
+    for name, r in results["scenarios"].items():
+        print(f"{name:<18}{r['requests']:>5}{r['errors']:>5}{r['jobs_per_s'] or 0:>9.2f}"
+              f"{r['throughput_mb_s'] or 0:>9.2f}{r['latency_p50_s'] or 0:>9.3f}{r['latency_p95_s'] or 0:>9.3f}")
+        for sample in r["error_samples"]:
+            print(f"    ! {sample[:160]}")
+    for name, stages in results["stages"].items():
+        print(f"\n[{name}] {'stage':<34}{'n':>6}{'p50 ms':>10}{'p95 ms':>10}")
+        for key, s in stages.items():
+            print(f"  {key:<42}{s['count']:>6}{s['p50_ms']:>10.1f}{s['p95_ms']:>10.1f}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=12, help="jobs per scenario")
+    parser.add_argument("--concurrency", type=int, default=4, help="jobs in flight")
+    parser.add_argument("--latency", type=float, default=0.02, help="fake CDN time to first byte (s)")
+    parser.add_argument("--bandwidth", type=parse_size, default=None, help="per-connection limit, e.g. 20M")
+    parser.add_argument("--media-size", type=parse_size, default=parse_size("12M"), help="media payload size")
+    parser.add_argument("--no-ranges", action="store_true", help="ignore Range requests (always 200)")
+    parser.add_argument("--only", nargs="*", help="scenario names to run")
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--baseline", help="results JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed regression (0.25 = 25%%)")
+    parser.add_argument("--verbose", action="store_true", help="keep the app's log output")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("TRACE_LOG", "0")
+    cdn = FakeCDN(
+        latency=args.latency,
+        bandwidth=args.bandwidth,
+        ranges=not args.no_ranges,
+        media_size=int(args.media_size),
+    ).start()
+    route_through(cdn)
+
+    quiet = open(os.devnull, "w") if not args.verbose else None
+    results = {
+        "config": {k: getattr(args, k) for k in ("requests", "concurrency", "latency", "bandwidth", "media_size")},
+        "scenarios": {},
+        "stages": {},
+    }
+    results["config"]["ranges"] = not args.no_ranges
+    try:
+        with contextlib.redirect_stdout(quiet) if quiet else contextlib.nullcontext():
+            from common import Tracing
+            from web.app import app
+
+            recorder = StageRecorder()
+            Tracing.add_listener(recorder)
+            run_id = str(random.randint(10 ** 9, 10 ** 10 - 1))
+            for name, template, kind in SCENARIOS:
+                if args.only and name not in args.only:
+                    continue
+                recorder.reset()
+                results["scenarios"][name] = run_scenario(app, name, template, kind, run_id, args)
+                results["stages"][name] = summarize_stages(recorder.reset())
+    finally:
+        restore()
+        cdn.stop()
+        if quiet:
+            quiet.close()
+
+    results["fake_cdn"] = cdn.stats()
+    print_report(results)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            problems = compare(results, json.load(f), args.tolerance)
+        for problem in problems:
+            print(f"[Regression] {problem}")
+        if problems:
+            return 1
+    return 1 if any(r["errors"] for r in results["scenarios"].values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
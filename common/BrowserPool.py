@@ -0,0 +1,194 @@
+"""
+Pool of warm headless Chrome drivers.
+
+Starting Chrome takes seconds and a few hundred MB, so the browser
+fallback borrows a driver from this pool instead of launching one per
+request.  The pool
+
+* caps how many drivers exist at once (``BROWSER_POOL_SIZE``); callers
+  wait for a free one up to ``acquire_timeout``,
+* checks that an idle driver still answers before handing it out,
+* quits a driver after ``BROWSER_MAX_PAGES`` pages, after an error and
+  after ``BROWSER_IDLE_TTL`` seconds unused,
+* always quits what it created, including at interpreter exit.
+
+Selenium is imported lazily so the pool costs nothing when unused.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Iterator, Optional
+
+POOL_SIZE = int(os.environ.get("BROWSER_POOL_SIZE", 2))
+MAX_PAGES = int(os.environ.get("BROWSER_MAX_PAGES", 20))
+IDLE_TTL = int(os.environ.get("BROWSER_IDLE_TTL", 300))
+PAGE_LOAD_TIMEOUT = 15
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+
+class BrowserPoolError(RuntimeError):
+    """No driver could be obtained (pool exhausted or Chrome failed to start)."""
+
+
+def _chrome_options():
+    from selenium.webdriver.chrome.options import Options
+
+    options = Options()
+    options.add_argument("--headless")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--window-size=1920,1080")
+    options.add_argument(f"user-agent={USER_AGENT}")
+    return options
+
+
+class _PooledDriver:
+    def __init__(self, driver) -> None:
+        self.driver = driver
+        self.pages = 0
+        self.last_used = time.monotonic()
+
+
+class BrowserPool:
+    """Bounded set of reusable headless Chrome drivers."""
+
+    def __init__(
+        self,
+        max_size: int = POOL_SIZE,
+        max_pages: int = MAX_PAGES,
+        idle_ttl: int = IDLE_TTL,
+        acquire_timeout: float = 30,
+    ) -> None:
+        self.max_size = max_size
+        self.max_pages = max_pages
+        self.idle_ttl = idle_ttl
+        self.acquire_timeout = acquire_timeout
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._lock = threading.Lock()
+        self._idle: Deque[_PooledDriver] = deque()
+        self._stats: Dict[str, int] = {"created": 0, "reused": 0, "recycled": 0, "active": 0}
+
+    def _create(self) -> _PooledDriver:
+        from selenium import webdriver
+
+        try:
+            driver = webdriver.Chrome(options=_chrome_options())
+        except Exception as e:
+            raise BrowserPoolError(f"Chrome failed to start: {e}") from e
+        driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+        with self._lock:
+            self._stats["created"] += 1
+        return _PooledDriver(driver)
+
+    @staticmethod
+    def _healthy(pooled: _PooledDriver) -> bool:
+        try:
+            return pooled.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def _quit(self, pooled: _PooledDriver) -> None:
+        try:
+            pooled.driver.quit()
+        except Exception as e:
+            print(f"[Browser] 드라이버 종료 실패: {e}")
+        with self._lock:
+            self._stats["recycled"] += 1
+
+    def _checkout(self) -> _PooledDriver:
+        self.reap()
+        while True:
+            with self._lock:
+                pooled = self._idle.pop() if self._idle else None
+            if pooled is None:
+                return self._create()
+            if self._healthy(pooled):
+                with self._lock:
+                    self._stats["reused"] += 1
+                return pooled
+            self._quit(pooled)
+
+    @contextmanager
+    def driver(self) -> Iterator:
+        """Borrow a driver; it is reset and returned (or quit) afterwards."""
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            raise BrowserPoolError("All browser drivers are busy")
+        pooled: Optional[_PooledDriver] = None
+        reusable = False
+        try:
+            pooled = self._checkout()
+            with self._lock:
+                self._stats["active"] += 1
+            yield pooled.driver
+            reusable = True
+        finally:
+            if pooled is not None:
+                with self._lock:
+                    self._stats["active"] -= 1
+                pooled.pages += 1
+                pooled.last_used = time.monotonic()
+                if reusable and pooled.pages < self.max_pages and self._reset(pooled):
+                    with self._lock:
+                        self._idle.append(pooled)
+                else:
+                    self._quit(pooled)
+            self._slots.release()
+
+    @staticmethod
+    def _reset(pooled: _PooledDriver) -> bool:
+        # 다음 요청에 이전 페이지의 쿠키/상태가 남지 않게 한다
+        try:
+            pooled.driver.delete_all_cookies()
+            pooled.driver.get("about:blank")
+            return True
+        except Exception:
+            return False
+
+    def reap(self) -> int:
+        """Quit idle drivers unused for longer than ``idle_ttl``."""
+        cutoff = time.monotonic() - self.idle_ttl
+        with self._lock:
+            stale = [p for p in self._idle if p.last_used < cutoff]
+            for pooled in stale:
+                self._idle.remove(pooled)
+        for pooled in stale:
+            self._quit(pooled)
+        return len(stale)
+
+    def close(self) -> None:
+        """Quit every idle driver (drivers in use are quit when returned)."""
+        with self._lock:
+            idle = list(self._idle)
+            self._idle.clear()
+        for pooled in idle:
+            self._quit(pooled)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats, idle=len(self._idle), max_size=self.max_size)
+
+
+_pool: Optional[BrowserPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> BrowserPool:
+    """Return this process's shared browser pool."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = BrowserPool()
+                atexit.register(_pool.close)
+    return _pool
+
+
+__all__ = ["BrowserPool", "BrowserPoolError", "get_pool", "POOL_SIZE", "MAX_PAGES", "IDLE_TTL"]
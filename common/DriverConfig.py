@@ -1,7 +1,25 @@
 from urllib.parse import urlparse, urlunparse, unquote, urljoin
-from urllib.request import Request, urlopen, build_opener, HTTPRedirectHandler
+from urllib.error import HTTPError
 from typing import Dict, List, Optional, Tuple, Iterable
+import os
 import random
+import threading
+
+import urllib3
+from urllib3.util import Retry, Timeout, make_headers
+
+from common import Tracing
+
+# 공유 커넥션 풀 설정 (호스트별 keep-alive 커넥션 재사용)
+POOL_HOSTS = int(os.environ.get("HTTP_POOL_HOSTS", 32))
+POOL_MAXSIZE = int(os.environ.get("HTTP_POOL_MAXSIZE", 16))
+CONNECT_TIMEOUT = float(os.environ.get("HTTP_CONNECT_TIMEOUT", 10))
+MAX_REDIRECTS = 10
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+# 재사용을 위해 읽고 버릴 최대 잔여 본문 크기
+DRAIN_LIMIT = 64 * 1024
+# 실제로 디코딩 가능한 인코딩만 요청 (br은 brotli 설치 시에만)
+SUPPORTED_ACCEPT_ENCODING = make_headers(accept_encoding=True)["accept-encoding"]
 
 # 강화된 헤더 설정
 DEFAULT_HEADERS = {
@@ -56,12 +74,109 @@ def get_random_headers(mobile=False):
     base["User-Agent"] = random.choice(USER_AGENTS)
     return base
 
+_pool: Optional[urllib3.PoolManager] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> urllib3.PoolManager:
+    """프로세스 전역 커넥션 풀 (스레드 안전)"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = urllib3.PoolManager(
+                    num_pools=POOL_HOSTS,
+                    maxsize=POOL_MAXSIZE,
+                    block=False,
+                    retries=Retry(connect=1, read=False, redirect=False, status=False),
+                )
+    return _pool
+
+
+class PooledResponse:
+    """
+    urlopen() 응답과 같은 인터페이스(read/headers/geturl/with 문)를 제공하고,
+    닫을 때 커넥션을 풀에 반환한다.
+    """
+
+    def __init__(self, resp: urllib3.HTTPResponse, url: str):
+        self._resp = resp
+        self.url = url
+        self.status = resp.status
+        self.reason = resp.reason
+        self.headers = resp.headers
+
+    def read(self, amt: Optional[int] = None) -> bytes:
+        return self._resp.read(amt)
+
+    def geturl(self) -> str:
+        return self.url
+
+    def getcode(self) -> int:
+        return self.status
+
+    def close(self) -> None:
+        resp = self._resp
+        if not resp.closed:
+            remaining = resp.length_remaining
+            if remaining is not None and remaining <= DRAIN_LIMIT:
+                resp.drain_conn()
+            else:
+                # 큰 본문이 남아 있으면 재사용하지 않고 커넥션을 닫는다
+                resp.close()
+        resp.release_conn()
+
+    def __enter__(self) -> "PooledResponse":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def pooled_open(url: str, headers: Optional[Dict[str, str]] = None, timeout: float = 30,
+                method: str = "GET") -> PooledResponse:
+    """
+    공유 풀로 요청을 보내고 리다이렉트를 따라간 최종 응답을 반환한다.
+    urlopen()과 같이 4xx/5xx 응답은 HTTPError로 던진다.
+    """
+    hdrs = dict(headers or {})
+    for key in list(hdrs):
+        if key.lower() == "accept-encoding" and hdrs[key].strip().lower() != "identity":
+            hdrs[key] = SUPPORTED_ACCEPT_ENCODING
+
+    current = url
+    # 응답 헤더를 받을 때까지의 시간 (본문 전송은 호출한 쪽 스팬에서 잰다)
+    with Tracing.span("http", host=urlparse(url).hostname, method=method) as sp:
+        for redirects in range(MAX_REDIRECTS + 1):
+            resp = get_pool().request(
+                method,
+                current,
+                headers=hdrs,
+                timeout=Timeout(connect=CONNECT_TIMEOUT, read=timeout),
+                preload_content=False,
+                redirect=False,
+            )
+            location = resp.headers.get("Location")
+            if resp.status in REDIRECT_STATUSES and location:
+                PooledResponse(resp, current).close()
+                current = urljoin(current, location)
+                if resp.status == 303:
+                    method = "GET"
+                continue
+            sp.set(status=resp.status, redirects=redirects)
+            if resp.status >= 400:
+                PooledResponse(resp, current).close()
+                raise HTTPError(current, resp.status, resp.reason, resp.headers, None)
+            return PooledResponse(resp, current)
+
+        raise HTTPError(url, 310, "Too many redirects", {}, None)
+
+
 def http_open(url: str, headers: Optional[Dict[str, str]] = None, timeout: int = 30):
     hdrs = get_random_headers()
     if headers:
         hdrs.update(headers)
-    req = Request(url, headers=hdrs)
-    return urlopen(req, timeout=timeout)
+    return pooled_open(url, headers=hdrs, timeout=timeout)
 
 def _http_open(url: str, headers: Optional[Dict[str, str]] = None, timeout: int = 30):
     DEFAULT_HEADERS = {
@@ -78,20 +193,15 @@ def _http_open(url: str, headers: Optional[Dict[str, str]] = None, timeout: int
     hdrs = dict(DEFAULT_HEADERS)
     if headers:
         hdrs.update(headers)
-    req = Request(url, headers=hdrs)
-    return urlopen(req, timeout=timeout)
+    return pooled_open(url, headers=hdrs, timeout=timeout)
 
     
 def resolve_redirect(url: str, headers: Optional[Dict[str, str]] = None, timeout: int = 30) -> str:
-    class _NoBodyRedirect(HTTPRedirectHandler):
-        pass
-    opener = build_opener(_NoBodyRedirect)
     hdrs = get_random_headers()
     if headers:
         hdrs.update(headers)
-    req = Request(url, headers=hdrs)
     try:
-        with opener.open(req, timeout=timeout) as resp:
+        with Tracing.span("redirect"), pooled_open(url, headers=hdrs, timeout=timeout) as resp:
             return resp.geturl()
     except Exception as e:
         print(f"[Redirect Error] {str(e)}")
@@ -100,10 +210,6 @@ def resolve_redirect(url: str, headers: Optional[Dict[str, str]] = None, timeout
     
 
 def _resolve_redirect(url: str, headers: Optional[Dict[str, str]] = None, timeout: int = 30) -> str:
-    class _NoBodyRedirect(HTTPRedirectHandler):
-        pass
-    
-    opener = build_opener(_NoBodyRedirect)
     DEFAULT_HEADERS = {
         "User-Agent": (
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -118,8 +224,7 @@ def _resolve_redirect(url: str, headers: Optional[Dict[str, str]] = None, timeou
     hdrs = dict(DEFAULT_HEADERS)
     if headers:
         hdrs.update(headers)
-    req = Request(url, headers=hdrs)
-    with opener.open(req, timeout=timeout) as resp:
+    with Tracing.span("redirect"), pooled_open(url, headers=hdrs, timeout=timeout) as resp:
         return resp.geturl()
     
 def ensure_https(url: str) -> str:
@@ -0,0 +1,160 @@
+"""
+Platform extractor registry.
+
+Each controller module registers an ``Extractor`` describing the hosts it
+handles, how to turn a URL into a canonical media id, how to resolve the
+direct media URL without downloading (``resolve``) and how to download the
+file (``fetch``).  The web app dispatches through this registry instead of
+per-platform branches, so caching, coalescing and streaming apply to every
+platform the same way.
+
+``resolve`` scrapes the post once and returns a ``Resolution``: the direct
+``target`` when the media is a single file that can be fetched or streamed
+as is (None for HLS playlists and formats that need merging), and a
+``download`` that finishes the file download from the scraped data.  A job
+that cannot use the direct URL therefore never scrapes the post twice.
+
+Hosts are matched by domain suffix through a lookup table, e.g.
+``m.tiktok.com`` walks ``m.tiktok.com`` -> ``tiktok.com`` and stops at
+the first registered entry.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from common import DriverConfig
+from common.Tool import ProgressCallback
+
+# (direct_media_url, filename, request_headers)
+StreamTarget = Tuple[str, str, Dict[str, str]]
+FetchFunc = Callable[[str, Optional[str], Optional[ProgressCallback]], str]
+# (output_dir, progress) -> downloaded file path
+DownloadFunc = Callable[[str, Optional[ProgressCallback]], str]
+CanonicalFunc = Callable[[str], Optional[str]]
+
+
+class Resolution:
+    """A scraped post: its direct target (if any) and how to download it."""
+
+    __slots__ = ("target", "download")
+
+    def __init__(self, target: Optional[StreamTarget], download: DownloadFunc) -> None:
+        self.target = target
+        self.download = download
+
+    def __repr__(self) -> str:
+        return f"Resolution({self.target[1] if self.target else None!r})"
+
+
+ResolveFunc = Callable[[str], Resolution]
+
+
+class Extractor:
+    """How one platform is recognised, identified, resolved and downloaded."""
+
+    def __init__(
+        self,
+        name: str,
+        hosts: Iterable[str],
+        fetch: FetchFunc,
+        canonical_id: Optional[CanonicalFunc] = None,
+        resolve: Optional[ResolveFunc] = None,
+        short_hosts: Iterable[str] = (),
+        label: Optional[str] = None,
+        media_types: Iterable[str] = ("videos",),
+    ) -> None:
+        self.name = name
+        self.hosts = tuple(h.lower() for h in hosts)
+        self.fetch = fetch
+        self.canonical_id = canonical_id
+        self.resolve = resolve
+        # 리다이렉트를 따라가야 미디어 ID를 알 수 있는 단축 URL 호스트
+        self.short_hosts = tuple(h.lower() for h in short_hosts)
+        self.label = label or name
+        self.media_types = tuple(media_types)
+
+    def __repr__(self) -> str:
+        return f"Extractor({self.name!r})"
+
+
+_lock = threading.Lock()
+_extractors: "OrderedDict[str, Extractor]" = OrderedDict()
+_host_table: Dict[str, str] = {}
+
+
+def register(extractor: Extractor) -> Extractor:
+    """Add (or replace) *extractor* and index its hosts."""
+    with _lock:
+        old = _extractors.get(extractor.name)
+        if old is not None:
+            for host in old.hosts:
+                if _host_table.get(host) == old.name:
+                    del _host_table[host]
+        _extractors[extractor.name] = extractor
+        for host in extractor.hosts:
+            _host_table[host] = extractor.name
+    return extractor
+
+
+def get(name: str) -> Optional[Extractor]:
+    return _extractors.get(name)
+
+
+def all_extractors() -> List[Extractor]:
+    return list(_extractors.values())
+
+
+def _hostname(url: str) -> str:
+    url = url.strip()
+    if "//" not in url:
+        url = "//" + url
+    return (urlparse(url).hostname or "").lower().rstrip(".")
+
+
+def for_url(url: str) -> Optional[Extractor]:
+    """Return the extractor registered for the host of *url*, if any."""
+    host = _hostname(url)
+    if not host:
+        return None
+    labels = host.split(".")
+    for i in range(len(labels) - 1):
+        name = _host_table.get(".".join(labels[i:]))
+        if name:
+            return _extractors.get(name)
+    return None
+
+
+def detect_platform(url: str) -> Optional[str]:
+    extractor = for_url(url)
+    return extractor.name if extractor else None
+
+
+def canonical_key(url: str, platform: Optional[str] = None) -> Optional[Tuple[str, str]]:
+    """
+    Return the ``(platform, media_id)`` key for *url*, following short-link
+    redirects first.  None when the platform or id cannot be determined.
+    """
+    extractor = get(platform) if platform else for_url(url)
+    if extractor is None or extractor.canonical_id is None:
+        return None
+    if _hostname(url) in extractor.short_hosts:
+        url = DriverConfig.resolve_redirect(url, timeout=10)
+    media_id = extractor.canonical_id(url)
+    return (extractor.name, media_id) if media_id else None
+
+
+__all__ = [
+    "Extractor",
+    "Resolution",
+    "StreamTarget",
+    "register",
+    "get",
+    "all_extractors",
+    "for_url",
+    "detect_platform",
+    "canonical_key",
+]
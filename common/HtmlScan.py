@@ -0,0 +1,179 @@
+"""
+Single-pass scanner for the JSON blob embedded in TikTok/Douyin pages.
+
+Post pages are several MB of HTML, but the extractors only need the
+``<title>`` and one embedded payload (the ``RENDER_DATA`` or ``SIGI_STATE``
+script), both near the top.  ``Page`` reads the response in chunks, looks
+for the title and the given ``Block``s while the bytes arrive and stops
+reading as soon as the first block is closed.  The rest of the document is
+only read when a fallback asks for ``Page.text`` (e.g. to collect every
+URL on the page); the response is released by ``close()`` / ``with``.
+
+Blocks are found with the leftmost-match semantics of ``re.search`` over
+the whole text as long as an opening tag or closing marker is shorter than
+``OVERLAP`` characters.
+"""
+
+from __future__ import annotations
+
+import codecs
+import re
+from typing import Iterable, List, Optional
+
+CHUNK_SIZE = 64 * 1024
+# 청크 경계에 걸친 태그/종료 표시를 놓치지 않도록 다시 검사하는 이전 텍스트 길이
+OVERLAP = 1024
+
+
+class Block:
+    """A payload between an opening pattern and the first closing pattern after it."""
+
+    __slots__ = ("name", "open", "close")
+
+    def __init__(self, name: str, open_pattern: str, close_pattern: str, flags: int = 0) -> None:
+        self.name = name
+        self.open = re.compile(open_pattern, flags)
+        self.close = re.compile(close_pattern, flags)
+
+
+TITLE = Block("title", r"<title>", r"</title>", re.I)
+RENDER_DATA_SCRIPT = Block(
+    "render_data",
+    r"<script[^>]*id=\"RENDER_DATA\"[^>]*type=\"application/json\"[^>]*>",
+    r"</script>",
+    re.I,
+)
+RENDER_DATA_ASSIGNMENT = Block("render_data_assignment", r"RENDER_DATA\s*=\s*\"", r"\"\s*;", re.I)
+SIGI_STATE = Block("sigi_state", r"<script id=\"SIGI_STATE\"[^>]*>", r"</script>")
+
+
+class _Finder:
+    __slots__ = ("block", "start", "end")
+
+    def __init__(self, block: Block) -> None:
+        self.block = block
+        self.start: Optional[int] = None
+        self.end: Optional[int] = None
+
+    def scan(self, window: str, offset: int) -> bool:
+        """Search *window* (text from absolute *offset*); True once the block is closed."""
+        if self.start is None:
+            m = self.block.open.search(window)
+            if not m:
+                return False
+            self.start = offset + m.end()
+        m = self.block.close.search(window, max(self.start - offset, 0))
+        if not m:
+            return False
+        self.end = offset + m.start()
+        return True
+
+
+class Page:
+    """
+    An HTML document scanned for its title and the first of *blocks*.
+
+    *source* is the page text or an open response (anything with
+    ``read(n)``; ``close()`` is called when done).  ``title`` and ``data``
+    are the raw text between the tags (``None`` when not found),
+    ``found`` the name of the block ``data`` came from.
+    """
+
+    def __init__(self, source, blocks: Iterable[Block] = (), chunk_size: int = CHUNK_SIZE) -> None:
+        self.chunk_size = chunk_size
+        self.consumed = 0
+        self.title: Optional[str] = None
+        self.found: Optional[str] = None
+        self.data: Optional[str] = None
+        self._chunks: List[str] = []
+        self._size = 0
+        self._tail = ""
+        self._title = _Finder(TITLE)
+        self._blocks = [_Finder(b) for b in blocks]
+        self._resp = None
+        self._decoder = None
+
+        if isinstance(source, str):
+            self._feed(source)
+            return
+        self._resp = source
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+        try:
+            self._read(stop_when_found=bool(self._blocks))
+        except BaseException:
+            self.close()
+            raise
+
+    @property
+    def complete(self) -> bool:
+        """True when the whole document has been read."""
+        return self._resp is None
+
+    @property
+    def text(self) -> str:
+        """The whole document (reads the rest of the response on first use)."""
+        if self._resp is not None:
+            self._read(stop_when_found=False)
+        if len(self._chunks) > 1:
+            self._chunks = ["".join(self._chunks)]
+        return self._chunks[0] if self._chunks else ""
+
+    def close(self) -> None:
+        resp, self._resp = self._resp, None
+        if resp is not None:
+            resp.close()
+
+    def __enter__(self) -> "Page":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+
+    def _read(self, stop_when_found: bool) -> None:
+        while self._resp is not None:
+            raw = self._resp.read(self.chunk_size)
+            if not raw:
+                self._feed(self._decoder.decode(b"", final=True))
+                self.close()
+                return
+            self.consumed += len(raw)
+            self._feed(self._decoder.decode(raw))
+            if stop_when_found and self.found is not None:
+                return
+
+    def _feed(self, chunk: str) -> None:
+        if not chunk:
+            return
+        offset = max(self._size - len(self._tail), 0)
+        window = self._tail + chunk
+        self._chunks.append(chunk)
+        self._size += len(chunk)
+        self._tail = window[-OVERLAP:]
+
+        if self.title is None and self._title.scan(window, offset):
+            self.title = self._slice(self._title)
+        if self.found is None:
+            # 같은 청크에서 여러 블록이 끝나면 먼저 지정한 블록 우선
+            for finder in self._blocks:
+                if finder.scan(window, offset) and self.found is None:
+                    self.found = finder.block.name
+                    self.data = self._slice(finder)
+
+    def _slice(self, finder: _Finder) -> str:
+        if len(self._chunks) > 1:
+            self._chunks = ["".join(self._chunks)]
+        return self._chunks[0][finder.start:finder.end]
+
+
+__all__ = [
+    "Block",
+    "Page",
+    "TITLE",
+    "RENDER_DATA_SCRIPT",
+    "RENDER_DATA_ASSIGNMENT",
+    "SIGI_STATE",
+    "CHUNK_SIZE",
+    "OVERLAP",
+]
@@ -0,0 +1,329 @@
+"""
+Background cleanup of the download folder.
+
+``/tmp/downloads`` is a tmpfs on Cloud Run, so every byte left there is
+memory the container can no longer use.  The janitor runs on a daemon
+thread and, on every sweep:
+
+* deletes job directories whose file was served more than ``served_grace``
+  seconds ago (``/api/file`` drops a ``.served`` marker),
+* deletes job directories older than ``ttl``,
+* reclaims directories of queued/running jobs whose state has not changed
+  for ``job_timeout`` seconds (their worker died or was restarted) and
+  marks those jobs as failed,
+* evicts the least recently used finished job directories while the
+  folder is over ``max_bytes``, then asks ``shrink`` (the result cache) to
+  free what is still over,
+* removes job state files whose directory is gone and that are older
+  than ``ttl``.
+
+``max_bytes`` bounds everything under the folder, including the skipped
+cache directories, except jobs that are still in progress.  Sizes are
+counted per inode: a job file hard-linked into the result cache is counted
+once, and removing the job directory is not credited with freeing it.
+
+Each gunicorn worker starts a janitor; an advisory lock file makes sure
+only one of them sweeps at a time.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+SERVED_MARKER = ".served"
+LOCK_NAME = ".janitor.lock"
+
+UNFINISHED_STATES = ("queued", "running")
+
+
+def mark_served(download_dir: str) -> None:
+    """Record that the file in *download_dir* has been sent to the client."""
+    try:
+        with open(os.path.join(download_dir, SERVED_MARKER), "a"):
+            pass
+        os.utime(os.path.join(download_dir, SERVED_MARKER), None)
+    except OSError as e:
+        print(f"[Janitor] 전송 표시 실패 {download_dir}: {e}")
+
+
+def _dir_usage(path: str, seen: Set[Tuple[int, int]]) -> Tuple[int, int]:
+    """
+    Return (bytes of inodes under *path* not in *seen*, bytes that deleting
+    *path* would free).  Files with other hard links free nothing.
+    """
+    counted = freed = 0
+    for dirpath, _, filenames in os.walk(path):
+        for name in filenames:
+            try:
+                st = os.lstat(os.path.join(dirpath, name))
+            except OSError:
+                continue
+            inode = (st.st_dev, st.st_ino)
+            if inode not in seen:
+                seen.add(inode)
+                counted += st.st_size
+            if st.st_nlink <= 1:
+                freed += st.st_size
+    return counted, freed
+
+
+class Janitor:
+    """Periodically enforces TTL, size quota and delete-after-serve on a download folder."""
+
+    def __init__(
+        self,
+        root_dir: str,
+        ttl: int = 3600,
+        max_bytes: int = 2 * 1024 * 1024 * 1024,
+        served_grace: int = 300,
+        interval: int = 60,
+        skip: Iterable[str] = (),
+        hooks: Iterable[Callable[[], object]] = (),
+        job_timeout: int = 1800,
+        shrink: Optional[Callable[[int], int]] = None,
+    ) -> None:
+        self.root_dir = root_dir
+        self.ttl = ttl
+        self.job_timeout = job_timeout
+        # 용량 초과분이 남았을 때 호출, 실제로 비운 바이트 수를 반환 (결과 캐시 축소)
+        self.shrink = shrink
+        self.max_bytes = max_bytes
+        self.served_grace = served_grace
+        self.interval = interval
+        self.skip = {os.path.abspath(p) for p in skip}
+        # 스윕마다 함께 실행할 정리 함수 (결과 캐시 evict 등)
+        self.hooks: List[Callable[[], object]] = list(hooks)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stats_lock = threading.Lock()
+        self._stats: Dict[str, float] = {
+            "runs": 0,
+            "removed_served": 0,
+            "removed_expired": 0,
+            "removed_stale": 0,
+            "removed_quota": 0,
+            "removed_state_files": 0,
+            "bytes_reclaimed": 0,
+            "last_run": 0,
+            "last_duration": 0,
+            "usage_bytes": 0,
+        }
+        os.makedirs(root_dir, exist_ok=True)
+
+    def start(self) -> "Janitor":
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._loop, name="janitor", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.sweep()
+            except Exception as e:
+                print(f"[Janitor] 정리 실패: {e}")
+
+    def stats(self) -> Dict[str, float]:
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def _job_state(self, job_id: str) -> Dict:
+        try:
+            with open(os.path.join(self.root_dir, f"{job_id}.json"), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _fail_job(self, job_id: str, job: Dict) -> None:
+        """
+        Mark an abandoned job as failed so status polls stop waiting for it.
+        The JobQueue that still holds the job in memory adopts this state.
+        """
+        path = os.path.join(self.root_dir, f"{job_id}.json")
+        job = dict(job, state="error", error="Download timed out", error_kind="timeout", updated_at=time.time())
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(job, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"[Janitor] 작업 상태 갱신 실패 {job_id}: {e}")
+
+    def _entries(self, seen: Set[Tuple[int, int]]) -> List[Dict]:
+        entries = []
+        for name in os.listdir(self.root_dir):
+            path = os.path.join(self.root_dir, name)
+            if name.startswith(".") or os.path.abspath(path) in self.skip or not os.path.isdir(path):
+                continue
+            try:
+                created = os.path.getmtime(path)
+            except OSError:
+                continue
+            try:
+                served = os.path.getmtime(os.path.join(path, SERVED_MARKER))
+            except OSError:
+                served = None
+            job = self._job_state(name)
+            counted, freed = _dir_usage(path, seen)
+            entries.append({
+                "name": name,
+                "path": path,
+                "counted": counted,
+                "size": freed,
+                "created": created,
+                "updated": max(created, job.get("updated_at") or 0),
+                "served": served,
+                "state": job.get("state"),
+                "job": job,
+            })
+        return entries
+
+    def _usage(self, entries: List[Dict], seen: Set[Tuple[int, int]]) -> int:
+        """Bytes used under the folder: job directories, skipped directories and loose files."""
+        usage = sum(e["counted"] for e in entries)
+        for path in self.skip:
+            usage += _dir_usage(path, seen)[0]
+        try:
+            names = os.listdir(self.root_dir)
+        except OSError:
+            return usage
+        for name in names:
+            try:
+                st = os.lstat(os.path.join(self.root_dir, name))
+            except OSError:
+                continue
+            if not os.path.isdir(os.path.join(self.root_dir, name)) and (st.st_dev, st.st_ino) not in seen:
+                seen.add((st.st_dev, st.st_ino))
+                usage += st.st_size
+        return usage
+
+    def _acquire(self):
+        if fcntl is None:
+            return True
+        handle = open(os.path.join(self.root_dir, LOCK_NAME), "a")
+        try:
+            fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            handle.close()
+            return None
+        return handle
+
+    def sweep(self) -> Dict[str, int]:
+        """Run one cleanup pass and return what it removed."""
+        lock = self._acquire()
+        if not lock:
+            return {}
+        started = time.monotonic()
+        result = {"served": 0, "expired": 0, "stale": 0, "quota": 0, "state_files": 0, "bytes": 0}
+        try:
+            now = time.time()
+            seen: Set[Tuple[int, int]] = set()
+            entries = self._entries(seen)
+            usage = self._usage(entries, seen)
+            live = []
+            for entry in entries:
+                if entry["state"] in UNFINISHED_STATES:
+                    if now - entry["updated"] <= self.job_timeout:
+                        live.append(entry)
+                        continue
+                    # 워커가 죽어 끝나지 못한 작업
+                    self._fail_job(entry["name"], entry["job"])
+                    reason = "stale"
+                elif entry["served"] is not None and now - entry["served"] > self.served_grace:
+                    reason = "served"
+                elif now - entry["created"] > self.ttl:
+                    reason = "expired"
+                else:
+                    live.append(entry)
+                    continue
+                shutil.rmtree(entry["path"], ignore_errors=True)
+                usage -= entry["size"]
+                result[reason] += 1
+                result["bytes"] += entry["size"]
+
+            # 오래 전에 쓰인(전송된) 디렉터리부터 삭제
+            candidates = sorted(
+                (e for e in live if e["state"] not in UNFINISHED_STATES),
+                key=lambda e: e["served"] or e["created"],
+            )
+            for entry in candidates:
+                if usage <= self.max_bytes:
+                    break
+                shutil.rmtree(entry["path"], ignore_errors=True)
+                usage -= entry["size"]
+                result["quota"] += 1
+                result["bytes"] += entry["size"]
+
+            if usage > self.max_bytes and self.shrink is not None:
+                try:
+                    freed = self.shrink(usage - self.max_bytes)
+                except Exception as e:
+                    print(f"[Janitor] 캐시 축소 실패: {e}")
+                    freed = 0
+                usage -= freed
+                result["bytes"] += freed
+
+            result["state_files"] = self._remove_orphan_state_files(now)
+
+            for hook in self.hooks:
+                try:
+                    hook()
+                except Exception as e:
+                    print(f"[Janitor] 정리 훅 실패: {e}")
+        finally:
+            if lock is not True:
+                lock.close()
+
+        with self._stats_lock:
+            stats = self._stats
+            stats["runs"] += 1
+            stats["removed_served"] += result["served"]
+            stats["removed_expired"] += result["expired"]
+            stats["removed_stale"] += result["stale"]
+            stats["removed_quota"] += result["quota"]
+            stats["removed_state_files"] += result["state_files"]
+            stats["bytes_reclaimed"] += result["bytes"]
+            stats["last_run"] = time.time()
+            stats["last_duration"] = round(time.monotonic() - started, 3)
+            stats["usage_bytes"] = usage
+
+        removed = result["served"] + result["expired"] + result["stale"] + result["quota"]
+        if removed:
+            print(
+                f"[Janitor] {removed}개 디렉터리 정리 (전송 완료 {result['served']}, "
+                f"만료 {result['expired']}, 중단된 작업 {result['stale']}, 용량 초과 {result['quota']}), "
+                f"{result['bytes']} bytes 회수"
+            )
+        return result
+
+    def _remove_orphan_state_files(self, now: float) -> int:
+        removed = 0
+        for name in os.listdir(self.root_dir):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.root_dir, name)
+            if os.path.isdir(path[:-len(".json")]):
+                continue
+            try:
+                if now - os.path.getmtime(path) > self.ttl:
+                    os.remove(path)
+                    removed += 1
+            except OSError:
+                pass
+        return removed
+
+
+__all__ = ["Janitor", "mark_served", "SERVED_MARKER"]
@@ -0,0 +1,306 @@
+"""
+Background download job queue.
+
+Downloads run on a bounded thread pool instead of inside the HTTP request
+thread.  Each job gets an id (also used as its download directory name) and
+its state is mirrored to a small JSON file next to the download directories
+so that any gunicorn worker in the same container can answer status polls.
+
+Extractors receive a ``progress(stage, downloaded, total)`` callback; the
+queue turns those calls into a ``progress`` dict (stage, bytes, total, rate)
+on the job that the status and event-stream endpoints read.
+
+A download callable may also return a ``concurrent.futures.Future`` of the
+file path (e.g. when it attaches to another job's download).  The worker is
+then released right away and the job is finished when the future is.
+
+Jobs that produce no file (resolving a direct media URL) return a dict
+instead; it is stored as the job's ``result``, and its ``filename`` and
+``download_url`` (e.g. a stream link) are copied onto the job.
+
+The janitor fails abandoned jobs by rewriting their state file.  A job
+this worker still holds as queued/running adopts a newer finished state
+from disk, so ``get`` and the pending counts stop reporting it.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import threading
+import time
+import traceback
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Optional, Union
+
+from common.Tool import ProgressCallback
+
+JobResult = Union[str, Dict, "Future[str]"]
+DownloadFunc = Callable[[str, str, str, ProgressCallback], JobResult]
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_ERROR = "error"
+
+FINISHED_STATES = (JOB_DONE, JOB_ERROR)
+
+# 진행 상황을 상태 파일에 기록하는 최소 간격 (초)
+PROGRESS_SAVE_INTERVAL = 0.5
+
+
+class QueueFullError(RuntimeError):
+    """Raised when the queue already holds the maximum number of pending jobs."""
+
+
+class JobQueue:
+    """Runs download callables on a bounded executor and tracks their state."""
+
+    def __init__(
+        self,
+        root_dir: str,
+        max_workers: int = 4,
+        max_pending: int = 64,
+        ttl: int = 3600,
+    ) -> None:
+        self.root_dir = root_dir
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.ttl = ttl
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="download")
+        self._jobs: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+        os.makedirs(root_dir, exist_ok=True)
+
+    def _state_path(self, job_id: str) -> str:
+        return os.path.join(self.root_dir, f"{job_id}.json")
+
+    def _save(self, job: dict) -> None:
+        path = self._state_path(job["id"])
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(job, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"[Job] 상태 저장 실패 {job['id']}: {e}")
+
+    def _update(self, job_id: str, **fields) -> dict:
+        with self._lock:
+            job = self._jobs[job_id]
+            job.update(fields)
+            job["updated_at"] = time.time()
+            snapshot = dict(job)
+        self._save(snapshot)
+        return snapshot
+
+    def _load(self, job_id: str) -> Optional[dict]:
+        try:
+            with open(self._state_path(job_id), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _reconcile(self, job_ids: Optional[Iterable[str]] = None) -> None:
+        """
+        Adopt finished on-disk states of jobs that are still unfinished in
+        memory (e.g. a job the janitor failed after its worker stalled).
+        """
+        if job_ids is None:
+            with self._lock:
+                job_ids = [job_id for job_id, job in self._jobs.items() if job["state"] not in FINISHED_STATES]
+        for job_id in job_ids:
+            stored = self._load(job_id)
+            if not stored or stored.get("state") not in FINISHED_STATES:
+                continue
+            with self._lock:
+                job = self._jobs.get(job_id)
+                if (job is not None and job["state"] not in FINISHED_STATES
+                        and (stored.get("updated_at") or 0) >= job["updated_at"]):
+                    self._jobs[job_id] = stored
+                    print(f"[Job] {job_id} 상태 파일의 {stored['state']} 상태 반영")
+
+    def pending_count(self) -> int:
+        self._reconcile()
+        with self._lock:
+            return sum(1 for job in self._jobs.values() if job["state"] not in FINISHED_STATES)
+
+    def state_counts(self) -> Dict[str, int]:
+        """Number of jobs of this worker that are queued and running."""
+        self._reconcile()
+        counts = {JOB_QUEUED: 0, JOB_RUNNING: 0}
+        with self._lock:
+            for job in self._jobs.values():
+                if job["state"] in counts:
+                    counts[job["state"]] += 1
+        return counts
+
+    def submit(self, url: str, platform: str, func: DownloadFunc) -> dict:
+        """
+        Enqueue ``func(url, platform, download_dir, progress)`` and return the
+        job snapshot.  ``func`` must return the path of the downloaded file,
+        a ``Future`` of it, or a dict of result fields.
+        """
+        self.prune()
+        job_id = str(uuid.uuid4())
+        now = time.time()
+        job = {
+            "id": job_id,
+            "url": url,
+            "platform": platform,
+            "state": JOB_QUEUED,
+            "filename": None,
+            "size": None,
+            "download_url": None,
+            "error": None,
+            "error_kind": None,
+            "result": None,
+            "progress": {"stage": JOB_QUEUED, "downloaded": 0, "total": None, "rate": 0},
+            "created_at": now,
+            "updated_at": now,
+        }
+        with self._lock:
+            pending = sum(1 for j in self._jobs.values() if j["state"] not in FINISHED_STATES)
+            if pending >= self.max_pending:
+                raise QueueFullError("Download queue is full, try again later")
+            self._jobs[job_id] = job
+            snapshot = dict(job)
+        self._save(snapshot)
+        self._executor.submit(self._run, job_id, func)
+        print(f"[Job] {job_id} 등록 ({platform}), 대기 중: {pending + 1}")
+        return snapshot
+
+    def _progress_callback(self, job_id: str) -> ProgressCallback:
+        """Build the callback that records extractor progress on the job."""
+        state = {"stage": None, "time": 0.0, "bytes": 0, "rate": 0.0}
+
+        def progress(stage: str, downloaded: int = 0, total: Optional[int] = None) -> None:
+            now = time.monotonic()
+            if stage == state["stage"]:
+                elapsed = now - state["time"]
+                if elapsed < PROGRESS_SAVE_INTERVAL:
+                    return
+                # 지수 이동 평균으로 전송 속도 평활화
+                instant = max(downloaded - state["bytes"], 0) / elapsed
+                state["rate"] = 0.7 * state["rate"] + 0.3 * instant if state["rate"] else instant
+            else:
+                state["rate"] = 0.0
+            state.update(stage=stage, time=now, bytes=downloaded)
+            self._update(
+                job_id,
+                progress={
+                    "stage": stage,
+                    "downloaded": downloaded,
+                    "total": total,
+                    "rate": int(state["rate"]),
+                },
+            )
+
+        return progress
+
+    def _run(self, job_id: str, func: DownloadFunc) -> None:
+        job = self._update(
+            job_id,
+            state=JOB_RUNNING,
+            started_at=time.time(),
+            progress={"stage": "start", "downloaded": 0, "total": None, "rate": 0},
+        )
+        download_dir = os.path.join(self.root_dir, job_id)
+        os.makedirs(download_dir, exist_ok=True)
+        self._finish(job_id, download_dir,
+                     lambda: func(job["url"], job["platform"], download_dir, self._progress_callback(job_id)))
+
+    def _finish(self, job_id: str, download_dir: str, result: Callable[[], JobResult]) -> None:
+        """Record the outcome of *result()* (file path, future or result dict) on the job."""
+        try:
+            filepath = result()
+            if isinstance(filepath, Future):
+                # 다른 작업의 결과를 기다리는 작업 - 워커를 붙잡지 않고 완료 시 마무리
+                filepath.add_done_callback(lambda f: self._finish(job_id, download_dir, f.result))
+                return
+            if isinstance(filepath, dict):
+                # 파일 없이 끝나는 작업 (직접 URL 추출 등)
+                shutil.rmtree(download_dir, ignore_errors=True)
+                self._update(
+                    job_id,
+                    state=JOB_DONE,
+                    result=filepath,
+                    filename=filepath.get("filename"),
+                    download_url=filepath.get("download_url"),
+                    progress={"stage": JOB_DONE, "downloaded": 0, "total": None, "rate": 0},
+                    finished_at=time.time(),
+                )
+                print(f"[Job] {job_id} 완료")
+                return
+            if not filepath or not os.path.exists(filepath):
+                raise Exception("Download failed - no file created")
+
+            filename = os.path.basename(filepath)
+            size = os.path.getsize(filepath)
+            self._update(
+                job_id,
+                state=JOB_DONE,
+                filename=filename,
+                size=size,
+                progress={"stage": JOB_DONE, "downloaded": size, "total": size, "rate": 0},
+                download_url=f"/api/file/{job_id}/{filename}",
+                finished_at=time.time(),
+            )
+            print(f"[Job] {job_id} 완료: {filename}")
+        except Exception as e:
+            print(f"[Job] {job_id} 실패: {e}")
+            traceback.print_exc()
+            shutil.rmtree(download_dir, ignore_errors=True)
+            self._update(
+                job_id,
+                state=JOB_ERROR,
+                error=str(e),
+                # 구조화된 오류(YtDlpError 등)의 분류 (예: "private", "unavailable")
+                error_kind=getattr(e, "kind", None),
+                finished_at=time.time(),
+            )
+
+    def get(self, job_id: str) -> Optional[dict]:
+        """Return the job snapshot, falling back to the on-disk state of other workers."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None and job["state"] in FINISHED_STATES:
+                return dict(job)
+        if job is not None:
+            self._reconcile((job_id,))
+            with self._lock:
+                job = self._jobs.get(job_id)
+                if job is not None:
+                    return dict(job)
+        return self._load(job_id)
+
+    def prune(self) -> int:
+        """Forget finished jobs older than ``ttl`` and delete their state files."""
+        self._reconcile()
+        cutoff = time.time() - self.ttl
+        with self._lock:
+            expired = [
+                job_id
+                for job_id, job in self._jobs.items()
+                if job["state"] in FINISHED_STATES and job["updated_at"] < cutoff
+            ]
+            for job_id in expired:
+                del self._jobs[job_id]
+        for job_id in expired:
+            try:
+                os.remove(self._state_path(job_id))
+            except OSError:
+                pass
+        return len(expired)
+
+
+__all__ = [
+    "JobQueue",
+    "QueueFullError",
+    "JOB_QUEUED",
+    "JOB_RUNNING",
+    "JOB_DONE",
+    "JOB_ERROR",
+]
@@ -0,0 +1,112 @@
+"""
+Iterative traversal of decoded JSON (``json.loads`` output).
+
+RENDER_DATA and GraphQL payloads are large and deeply nested.  These
+walkers keep an explicit stack of iterators instead of recursing, so
+depth is not limited by the interpreter's recursion limit and no
+per-level lists are built.  They are generators: a caller that only needs
+the first match stops the walk by returning.
+
+Nodes are visited in the same depth-first, key order as a recursive walk.
+``strings(obj, under=keys)`` only yields strings inside the subtrees of the
+given keys (e.g. ``video`` / ``play_addr``), skipping avatars, music and
+share links elsewhere in the document.
+"""
+
+from __future__ import annotations
+
+from typing import Collection, Dict, Iterator, Optional
+
+
+def dicts(obj) -> Iterator[Dict]:
+    """Every dict in *obj*, parents before children."""
+    if isinstance(obj, dict):
+        yield obj
+    elif not isinstance(obj, list):
+        return
+    stack = [iter(obj.values() if isinstance(obj, dict) else obj)]
+    while stack:
+        for value in stack[-1]:
+            if isinstance(value, dict):
+                yield value
+                stack.append(iter(value.values()))
+                break
+            if isinstance(value, list):
+                stack.append(iter(value))
+                break
+        else:
+            stack.pop()
+
+
+def strings(obj, under: Optional[Collection[str]] = None) -> Iterator[str]:
+    """
+    Every string value in *obj*, in document order.
+
+    With *under*, only strings below a dict key in *under* (at any depth,
+    e.g. ``video.bit_rate[0].play_addr.url_list[1]`` for ``under={"video"}``).
+    """
+    if isinstance(obj, str):
+        if not under:
+            yield obj
+        return
+    if not isinstance(obj, (dict, list)):
+        return
+    if not under:
+        yield from _all_strings(obj)
+        return
+
+    wanted = frozenset(under)
+    # 찾는 키 밖에서는 dict 키만 검사하고, 키를 찾으면 그 아래는 전부 내보낸다
+    stack = [iter(obj.items()) if isinstance(obj, dict) else iter(obj)]
+    keyed = [isinstance(obj, dict)]
+    while stack:
+        if keyed[-1]:
+            for key, value in stack[-1]:
+                if key in wanted:
+                    if isinstance(value, str):
+                        yield value
+                    elif isinstance(value, (dict, list)):
+                        yield from _all_strings(value)
+                elif isinstance(value, dict):
+                    stack.append(iter(value.items()))
+                    keyed.append(True)
+                    break
+                elif isinstance(value, list):
+                    stack.append(iter(value))
+                    keyed.append(False)
+                    break
+            else:
+                stack.pop()
+                keyed.pop()
+        else:
+            for value in stack[-1]:
+                if isinstance(value, dict):
+                    stack.append(iter(value.items()))
+                    keyed.append(True)
+                    break
+                if isinstance(value, list):
+                    stack.append(iter(value))
+                    keyed.append(False)
+                    break
+            else:
+                stack.pop()
+                keyed.pop()
+
+
+def _all_strings(obj) -> Iterator[str]:
+    stack = [iter(obj.values() if isinstance(obj, dict) else obj)]
+    while stack:
+        for value in stack[-1]:
+            if isinstance(value, str):
+                yield value
+            elif isinstance(value, dict):
+                stack.append(iter(value.values()))
+                break
+            elif isinstance(value, list):
+                stack.append(iter(value))
+                break
+        else:
+            stack.pop()
+
+
+__all__ = ["dicts", "strings"]
@@ -0,0 +1,401 @@
+"""
+Prometheus text-format metrics for the download service.
+
+Metrics are registered on a ``Registry`` and rendered in the Prometheus
+exposition format (``text/plain; version=0.0.4``) by ``/metrics``.  There
+are three kinds:
+
+* ``Counter`` / ``Histogram`` - updated in place by the code that does the
+  work (request hooks, the ``Tracing`` listener below),
+* ``Gauge`` - set in place, or computed at scrape time from a callback
+  (queue depth, cache statistics, disk usage).
+
+Each gunicorn worker has its own registry, but a scrape only reaches one
+worker.  Once ``Registry.share(dir)`` is called every worker writes a
+snapshot of its values there every ``interval`` seconds and ``render``
+adds up the snapshots of all live workers, so the numbers describe the
+whole container.  Callback gauges marked ``shared=True`` already describe
+the container (e.g. disk usage) and are taken from the scraped worker only.
+
+``observe_span`` turns finished ``Tracing`` spans and traces into request,
+stage, transfer and yt-dlp metrics; install it with
+``Tracing.add_listener(Metrics.observe_span)``.
+"""
+
+from __future__ import annotations
+
+import abc
+import json
+import math
+import os
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from common.Tracing import Span
+
+PREFIX = "video_downloader_"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 초 단위 - HTML/API 호출(수십 ms)부터 대용량 다운로드(수 분)까지
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric(abc.ABC):
+    kind = ""
+    shared = False
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(n) or "") for n in self.labels)
+
+    @abc.abstractmethod
+    def snapshot(self) -> List:
+        """Current values as JSON-serialisable ``[label_values, value]`` pairs."""
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labels)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def snapshot(self) -> List:
+        with self._lock:
+            return [[list(k), v] for k, v in self._values.items()]
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = (),
+                 fn: Optional[Callable[[], object]] = None, shared: bool = False,
+                 kind: str = "gauge") -> None:
+        super().__init__(name, documentation, labels)
+        self.kind = kind
+        self.fn = fn
+        self.shared = shared
+        self._values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def snapshot(self) -> List:
+        if self.fn is None:
+            with self._lock:
+                return [[list(k), v] for k, v in self._values.items()]
+        try:
+            value = self.fn()
+        except Exception as e:
+            print(f"[Metrics] {self.name} 수집 실패: {e}")
+            return []
+        if isinstance(value, dict):
+            # {라벨 값(또는 튜플): 값}
+            return [[list(k) if isinstance(k, tuple) else [str(k)], v]
+                    for k, v in value.items() if v is not None]
+        return [] if value is None else [[[], value]]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = (),
+                 buckets: Iterable[float] = DEFAULT_BUCKETS) -> None:
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨 -> [버킷별 개수..., 합계, 개수]
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[i] += 1
+                    break
+            state[-2] += value
+            state[-1] += 1
+
+    def snapshot(self) -> List:
+        with self._lock:
+            return [[list(k), list(v)] for k, v in self._values.items()]
+
+
+def _merge(kind: str, into: Dict[LabelValues, object], rows: List) -> None:
+    for labels, value in rows:
+        key = tuple(labels)
+        current = into.get(key)
+        if current is None:
+            into[key] = list(value) if kind == "histogram" else value
+        elif kind == "histogram" and len(current) == len(value):
+            into[key] = [a + b for a, b in zip(current, value)]
+        elif kind != "histogram":
+            into[key] = current + value
+
+
+class Registry:
+    """A set of metrics rendered together, optionally summed across workers."""
+
+    def __init__(self, interval: float = 10.0) -> None:
+        self.share_dir: Optional[str] = None
+        self.interval = interval
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labels: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(PREFIX + name, documentation, labels))
+
+    def gauge(self, name: str, documentation: str, labels: Sequence[str] = (),
+              fn: Optional[Callable[[], object]] = None, shared: bool = False) -> Gauge:
+        return self._register(Gauge(PREFIX + name, documentation, labels, fn=fn, shared=shared))
+
+    def counter_callback(self, name: str, documentation: str, labels: Sequence[str] = (),
+                         fn: Optional[Callable[[], object]] = None) -> Gauge:
+        """A counter whose value is read from *fn* (e.g. an existing hit count)."""
+        return self._register(Gauge(PREFIX + name, documentation, labels, fn=fn, kind="counter"))
+
+    def histogram(self, name: str, documentation: str, labels: Sequence[str] = (),
+                  buckets: Iterable[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(PREFIX + name, documentation, labels, buckets))
+
+    def snapshot(self, include_shared: bool = True) -> Dict[str, List]:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return {
+            m.name: m.snapshot()
+            for m in metrics
+            if include_shared or not m.shared
+        }
+
+    # ------------------------------------------------------------------
+    # 워커 간 공유
+
+    def _snapshot_path(self, pid: int) -> str:
+        return os.path.join(self.share_dir, f"{pid}.json")
+
+    def share(self, share_dir: str) -> "Registry":
+        """Publish this worker's values in *share_dir* every ``interval`` seconds."""
+        os.makedirs(share_dir, exist_ok=True)
+        self.share_dir = share_dir
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._loop, name="metrics-flush", daemon=True)
+            self._thread.start()
+        return self
+
+    def flush(self, snapshot: Optional[Dict[str, List]] = None) -> None:
+        """Write this worker's values to ``share_dir`` (no-op without one)."""
+        if not self.share_dir:
+            return
+        if snapshot is None:
+            snapshot = self.snapshot(include_shared=False)
+        path = self._snapshot_path(os.getpid())
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"[Metrics] 스냅샷 저장 실패: {e}")
+
+    def _loop(self) -> None:
+        while True:
+            time.sleep(self.interval)
+            self.flush()
+
+    def _peer_snapshots(self) -> List[Dict[str, List]]:
+        snapshots = []
+        try:
+            names = os.listdir(self.share_dir)
+        except OSError:
+            return snapshots
+        for name in names:
+            pid_text, _, ext = name.partition(".")
+            if ext != "json" or not pid_text.isdigit() or int(pid_text) == os.getpid():
+                continue
+            path = os.path.join(self.share_dir, name)
+            if not _alive(int(pid_text)):
+                # 종료된 워커의 값은 버린다 (Prometheus는 카운터 감소를 재시작으로 처리)
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+                continue
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    snapshots.append(json.load(f))
+            except (OSError, ValueError):
+                pass
+        return snapshots
+
+    # ------------------------------------------------------------------
+
+    def render(self) -> str:
+        """Return every metric in the Prometheus text exposition format."""
+        own = self.snapshot()
+        peers = []
+        if self.share_dir:
+            peers = self._peer_snapshots()
+            self.flush({name: rows for name, rows in own.items() if not self._metrics[name].shared})
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        lines: List[str] = []
+        for metric in metrics:
+            values: Dict[LabelValues, object] = {}
+            _merge(metric.kind, values, own.get(metric.name, []))
+            if not metric.shared:
+                for snapshot in peers:
+                    _merge(metric.kind, values, snapshot.get(metric.name, []))
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for key in sorted(values):
+                if metric.kind == "histogram":
+                    lines.extend(_histogram_lines(metric, key, values[key]))
+                else:
+                    labels = _format_labels(metric.labels, key)
+                    lines.append(f"{metric.name}{labels} {_format_value(values[key])}")
+        return "\n".join(lines) + "\n"
+
+
+def _histogram_lines(metric: Histogram, key: LabelValues, state: List[float]) -> List[str]:
+    lines = []
+    cumulative = 0
+    for bound, count in zip(metric.buckets + (math.inf,), state[:-2] + [state[-1] - sum(state[:-2])]):
+        cumulative += count
+        labels = _format_labels(metric.labels, key, f'le="{_format_value(bound)}"')
+        lines.append(f"{metric.name}_bucket{labels} {_format_value(cumulative)}")
+    labels = _format_labels(metric.labels, key)
+    lines.append(f"{metric.name}_sum{labels} {_format_value(state[-2])}")
+    lines.append(f"{metric.name}_count{labels} {_format_value(state[-1])}")
+    return lines
+
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True
+    return True
+
+
+REGISTRY = Registry()
+
+http_requests = REGISTRY.counter(
+    "http_requests_total", "HTTP requests by endpoint, method and status code",
+    ("endpoint", "method", "status"))
+http_latency = REGISTRY.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by endpoint (time to response headers; streamed responses are not included)",
+    ("endpoint",))
+traces = REGISTRY.counter(
+    "operations_total", "API operations and download jobs by platform and outcome",
+    ("operation", "platform", "outcome"))
+trace_latency = REGISTRY.histogram(
+    "operation_duration_seconds", "API operation and download job latency by platform",
+    ("operation", "platform"))
+failures = REGISTRY.counter(
+    "operation_failures_total", "Failed API operations and jobs by platform and exception type",
+    ("operation", "platform", "reason"))
+stages = REGISTRY.counter(
+    "stage_total", "Extraction stages run by platform, stage and outcome", ("platform", "stage", "outcome"))
+stage_latency = REGISTRY.histogram(
+    "stage_duration_seconds", "Extraction stage latency by platform and stage", ("platform", "stage"))
+transferred = REGISTRY.counter(
+    "bytes_transferred_total", "Media bytes transferred by platform and stage", ("platform", "stage"))
+ytdlp_runs = REGISTRY.counter(
+    "ytdlp_runs_total", "yt-dlp extractions by operation and outcome (ok or failure kind)",
+    ("operation", "outcome"))
+
+YTDLP_SPANS = {"ytdlp.download": "download", "ytdlp.extract": "extract"}
+
+
+def observe_request(endpoint: str, method: str, status: int, duration: float, streamed: bool = False) -> None:
+    """
+    Record one finished HTTP request.  For a *streamed* response (SSE, file
+    and stream proxy bodies) the view returns before the body is sent, so
+    it is only counted; its duration would say nothing about the transfer.
+    """
+    http_requests.inc(endpoint=endpoint, method=method, status=status)
+    if not streamed:
+        http_latency.observe(duration, endpoint=endpoint)
+
+
+def observe_span(kind: str, span: Span, trace_attrs: Dict) -> None:
+    """``Tracing`` listener: turn finished spans and traces into metrics."""
+    platform = trace_attrs.get("platform") or ""
+    duration = span.duration or 0.0
+    if kind == "trace":
+        traces.inc(operation=span.name, platform=platform, outcome="error" if span.error else "ok")
+        trace_latency.observe(duration, operation=span.name, platform=platform)
+        if span.error:
+            failures.inc(operation=span.name, platform=platform, reason=span.error)
+        return
+
+    stages.inc(platform=platform, stage=span.name, outcome="error" if span.error else "ok")
+    stage_latency.observe(duration, platform=platform, stage=span.name)
+    if span.bytes:
+        transferred.inc(span.bytes, platform=platform, stage=span.name)
+    operation = YTDLP_SPANS.get(span.name)
+    if operation:
+        outcome = span.attrs.get("kind") or ("error" if span.error else "ok")
+        ytdlp_runs.inc(operation=operation, outcome=outcome)
+
+
+__all__ = [
+    "Registry",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "REGISTRY",
+    "CONTENT_TYPE",
+    "observe_request",
+    "observe_span",
+]
@@ -0,0 +1,388 @@
+"""
+On-disk state for resumable downloads.
+
+While a file is downloading it is written to ``<dest>.part`` and a small
+``<dest>.part.json`` sidecar records the source URL, the validators the
+server sent (ETag / Last-Modified / Content-Length) and the byte ranges
+that are already on disk.  A retry loads the sidecar and asks only for the
+missing bytes with ``Range`` + ``If-Range``; if the server answers with the
+full body instead, the transfer starts over.
+
+The state only lives as long as the destination path: every job downloads
+into its own directory, so resuming covers the retries within one download
+call, not a later request for the same URL.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.error import HTTPError
+
+from common import DriverConfig, Tool, Tracing
+
+CONTENT_RANGE_RE = re.compile(r"bytes\s+(\d+)-(\d+)/(\d+|\*)", re.I)
+
+# 사이드카 저장 최소 간격 (바이트)
+SAVE_EVERY_BYTES = 1024 * 1024
+# 단일 스트림이 끊겼을 때 .part 파일에서 이어받는 횟수
+STREAM_RETRIES = int(os.environ.get("STREAM_RESUME_RETRIES", 2))
+
+# opener(url, headers=..., timeout=...) -> pooled_open()과 같은 응답 (4xx/5xx는 HTTPError)
+Opener = Callable[..., "DriverConfig.PooledResponse"]
+
+
+def part_path(dest_path: str) -> str:
+    return dest_path + ".part"
+
+
+def state_path(dest_path: str) -> str:
+    return dest_path + ".part.json"
+
+
+def _header(headers, name: str) -> Optional[str]:
+    value = headers.get(name) if headers is not None else None
+    return value or None
+
+
+def new_state(url: str, headers) -> Dict:
+    """Start a fresh state from the response headers of a full (200) or ranged (206) reply."""
+    total = None
+    m = CONTENT_RANGE_RE.search(_header(headers, "Content-Range") or "")
+    if m and m.group(3) != "*":
+        total = int(m.group(3))
+    else:
+        length = _header(headers, "Content-Length")
+        total = int(length) if length and length.isdigit() else None
+    return {
+        "url": url,
+        "etag": _header(headers, "ETag"),
+        "last_modified": _header(headers, "Last-Modified"),
+        "total": total,
+        "ranges": [],
+    }
+
+
+def load_state(dest_path: str, url: str) -> Optional[Dict]:
+    """Return the saved state for *dest_path* if it belongs to *url* and the .part file exists."""
+    try:
+        with open(state_path(dest_path), "r", encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if state.get("url") != url or not os.path.exists(part_path(dest_path)):
+        return None
+    return state
+
+
+def save_state(dest_path: str, state: Dict) -> None:
+    tmp = state_path(dest_path) + ".tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp, state_path(dest_path))
+    except OSError as e:
+        print(f"[Resume] 상태 저장 실패: {e}")
+
+
+def validators_match(state: Dict, headers) -> bool:
+    """True if the response still describes the same resource as *state*."""
+    etag = _header(headers, "ETag")
+    if state.get("etag") and etag and state["etag"] != etag:
+        return False
+    last_modified = _header(headers, "Last-Modified")
+    if state.get("last_modified") and last_modified and state["last_modified"] != last_modified:
+        return False
+    fresh = new_state(state.get("url", ""), headers)
+    if state.get("total") and fresh["total"] and state["total"] != fresh["total"]:
+        return False
+    return True
+
+
+def resume_headers(state: Dict, start: int, end: Optional[int] = None) -> Dict[str, str]:
+    """Range request headers for bytes ``start..end`` guarded by If-Range."""
+    hdrs = {"Range": f"bytes={start}-{'' if end is None else end}"}
+    validator = state.get("etag") or state.get("last_modified")
+    if validator:
+        hdrs["If-Range"] = validator
+    return hdrs
+
+
+def open_part(dest_path: str, offset: int):
+    """
+    Open the .part file for writing at *offset*.  Bytes past *offset* (a
+    tail written after the last saved state) are cut off, so the resumed
+    body lands exactly after the range the server was asked for.
+    """
+    if not offset:
+        return open(part_path(dest_path), "wb")
+    f = open(part_path(dest_path), "r+b")
+    f.seek(offset)
+    f.truncate()
+    return f
+
+
+def content_range_start(headers) -> Optional[int]:
+    m = CONTENT_RANGE_RE.search(_header(headers, "Content-Range") or "")
+    return int(m.group(1)) if m else None
+
+
+def add_range(ranges: List[List[int]], start: int, end: int) -> List[List[int]]:
+    """Merge the half-open range ``[start, end)`` into *ranges* (sorted, non-overlapping)."""
+    if end <= start:
+        return ranges
+    merged: List[List[int]] = []
+    for a, b in sorted(ranges + [[start, end]]):
+        if merged and a <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], b)
+        else:
+            merged.append([a, b])
+    return merged
+
+
+def contiguous_end(state: Dict, dest_path: str) -> int:
+    """Number of leading bytes already on disk (bounded by the .part file size)."""
+    ranges = state.get("ranges") or []
+    end = ranges[0][1] if ranges and ranges[0][0] == 0 else 0
+    try:
+        return min(end, os.path.getsize(part_path(dest_path)))
+    except OSError:
+        return 0
+
+
+def missing_ranges(state: Dict, total: int) -> List[Tuple[int, int]]:
+    """Half-open ``[start, end)`` gaps of ``[0, total)`` not yet recorded as complete."""
+    gaps = []
+    pos = 0
+    for a, b in state.get("ranges") or []:
+        if a > pos:
+            gaps.append((pos, min(a, total)))
+        pos = max(pos, b)
+    if pos < total:
+        gaps.append((pos, total))
+    return [(a, b) for a, b in gaps if b > a]
+
+
+def completed_bytes(state: Dict) -> int:
+    return sum(b - a for a, b in state.get("ranges") or [])
+
+
+def finalize(dest_path: str) -> None:
+    """Move the finished .part file into place and drop the sidecar."""
+    os.replace(part_path(dest_path), dest_path)
+    try:
+        os.remove(state_path(dest_path))
+    except OSError:
+        pass
+
+
+def discard(dest_path: str) -> None:
+    for path in (part_path(dest_path), state_path(dest_path)):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+class _SessionResponse:
+    """A streamed requests.Response with the read()/status/headers interface of pooled_open()."""
+
+    def __init__(self, resp) -> None:
+        self._resp = resp
+        self.url = resp.url
+        self.status = resp.status_code
+        self.reason = resp.reason
+        self.headers = resp.headers
+
+    def read(self, amt: Optional[int] = None) -> bytes:
+        return self._resp.raw.read(amt, decode_content=True)
+
+    def geturl(self) -> str:
+        return self.url
+
+    def close(self) -> None:
+        self._resp.close()
+
+    def __enter__(self) -> "_SessionResponse":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def session_opener(session) -> Opener:
+    """
+    Opener that sends the requests through a ``requests.Session``, so its
+    cookies, default headers and connection pool are used.
+    """
+    def open_(url: str, headers: Optional[Dict[str, str]] = None, timeout: float = 30):
+        resp = session.get(url, headers=headers, stream=True, timeout=timeout)
+        if resp.status_code >= 400:
+            resp.close()
+            raise HTTPError(resp.url, resp.status_code, resp.reason, resp.headers, None)
+        return _SessionResponse(resp)
+    return open_
+
+
+def stream_download(to_url: str, dest_path: str, headers: Dict[str, str],
+                    progress: Optional[Tool.ProgressCallback] = None,
+                    retries: int = STREAM_RETRIES,
+                    opener: Opener = DriverConfig.pooled_open) -> Tuple[int, str, Optional[int]]:
+    """
+    Download *to_url* to *dest_path* and return (downloaded, content_type, total).
+    Large files go through parallel Range requests; a transfer that drops is
+    resumed from the ``.part`` file up to *retries* times.  Every request is
+    sent with *opener* (the shared urllib3 pool unless a caller passes e.g.
+    ``session_opener(session)``).
+    """
+    with Tracing.span("transfer") as sp:
+        # 끊기면 .part 파일과 사이드카 상태를 남겨 두고 받은 지점부터 이어받는다
+        last_error: Optional[Exception] = None
+        for attempt in range(retries + 1):
+            try:
+                return _stream_to_part(to_url, dest_path, headers, progress, span=sp, opener=opener)
+            except Exception as e:
+                last_error = e
+                sp.set(retries=attempt + 1)
+                if attempt < retries:
+                    print(f"\n  전송 중단, 이어받기 재시도 {attempt + 1}/{retries}: {e}")
+        raise last_error
+
+
+def _stream_to_part(to_url: str, dest_path: str, headers: Dict[str, str],
+                    progress: Optional[Tool.ProgressCallback] = None, ranges: bool = True,
+                    span: Optional[Tracing.Span] = None,
+                    opener: Opener = DriverConfig.pooled_open) -> Tuple[int, str, Optional[int]]:
+    """
+    One GET for the bytes not yet on disk.  It carries ``Range: bytes=N-``,
+    so the response headers already say whether the server takes ranges and
+    how big the file is: a large file keeps this response as its first
+    range and fetches the rest in parallel, anything else is read as a
+    single stream.  No separate probe request is made.
+    """
+    from common import RangeDownload
+
+    state = load_state(dest_path, to_url)
+    offset = contiguous_end(state, dest_path) if state else 0
+    req_headers = {k: v for k, v in headers.items() if k.lower() != "range"}
+    if ranges or offset:
+        req_headers.update(resume_headers(state or {}, offset))
+        req_headers["Accept-Encoding"] = "identity"
+
+    try:
+        resp = opener(to_url, headers=req_headers, timeout=60)
+    except HTTPError as e:
+        if e.code == 416 and offset:
+            # 저장된 상태가 원격 파일과 맞지 않는다 - 다음 시도는 처음부터 받는다
+            discard(dest_path)
+        raise
+    with resp:
+        ct = resp.headers.get("Content-Type") or ""
+        partial = resp.status == 206 and content_range_start(resp.headers) == offset
+        if partial and state and validators_match(state, resp.headers):
+            if offset:
+                print(f"  이어받기: {_human_size(offset)}부터")
+            # 저장되지 않은 꼬리는 버리고 [0, offset)과 그 뒤에 끝난 병렬 구간만 남긴다
+            state["ranges"] = add_range([r for r in state.get("ranges") or [] if r[0] > offset], 0, offset)
+        elif offset and resp.status == 206:
+            # 다른 파일의 구간 - 처음부터 다시 받는다
+            discard(dest_path)
+            raise IOError("resume validators no longer match")
+        else:
+            offset = 0
+            state = new_state(to_url, resp.headers)
+
+        if not (ranges and resp.status == 206 and RangeDownload.worth_splitting(state["total"])):
+            return _read_stream(resp, dest_path, state, offset, progress, ct)
+        try:
+            result = RangeDownload.download_rest(resp, dest_path, headers, state, offset, progress,
+                                                  opener=opener)
+        except RangeDownload.RangeNotSupported as e:
+            print(f"  [Range] 구간 요청 미지원, 단일 스트림으로 전환: {e}")
+            discard(dest_path)
+        else:
+            if span is not None:
+                span.set(mode="ranges")
+            return result
+    # 나머지 구간을 거부한 서버 - Range 없이 처음부터 하나의 스트림으로 받는다
+    return _stream_to_part(to_url, dest_path, headers, progress, ranges=False, span=span, opener=opener)
+
+
+def _read_stream(resp, dest_path: str, state: Dict, offset: int,
+                 progress: Optional[Tool.ProgressCallback], ct: str) -> Tuple[int, str, Optional[int]]:
+    total_i = state["total"]
+    downloaded = offset
+    saved = offset
+    last_print = time.time()
+    chunk = 1024 * 256
+
+    with open_part(dest_path, offset) as f:
+        try:
+            while True:
+                buf = resp.read(chunk)
+                if not buf:
+                    break
+                f.write(buf)
+                downloaded += len(buf)
+                Tracing.add_bytes(len(buf))
+                Tool.report_progress(progress, "download", downloaded, total_i)
+                if downloaded - saved >= SAVE_EVERY_BYTES:
+                    state["ranges"] = [[0, downloaded]]
+                    save_state(dest_path, state)
+                    saved = downloaded
+                now = time.time()
+                if now - last_print >= 0.5:
+                    if total_i and total_i > 0:
+                        pct = downloaded / total_i * 100
+                        print(f"  {_human_size(downloaded)}/{_human_size(total_i)} ({pct:.1f}%)", end="\r")
+                    else:
+                        print(f"  {_human_size(downloaded)} downloaded", end="\r")
+                    last_print = now
+            if total_i and downloaded < total_i:
+                raise IOError(f"connection closed at {downloaded}/{total_i} bytes")
+        except Exception:
+            f.flush()
+            state["ranges"] = [[0, downloaded]]
+            save_state(dest_path, state)
+            raise
+
+    finalize(dest_path)
+    if total_i and total_i > 0:
+        print(f"  {_human_size(downloaded)}/{_human_size(total_i)} (100.0%)        ")
+    else:
+        print(f"  {_human_size(downloaded)} downloaded        ")
+
+    return downloaded, ct.lower(), total_i
+
+
+def _human_size(n: int) -> str:
+    size = float(n)
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024.0:
+            return f"{size:.1f}{unit}"
+        size /= 1024.0
+    return f"{size:.1f}TB"
+
+
+__all__ = [
+    "part_path",
+    "state_path",
+    "new_state",
+    "load_state",
+    "save_state",
+    "validators_match",
+    "resume_headers",
+    "open_part",
+    "content_range_start",
+    "add_range",
+    "contiguous_end",
+    "missing_ranges",
+    "completed_bytes",
+    "finalize",
+    "discard",
+    "session_opener",
+    "stream_download",
+]
@@ -0,0 +1,181 @@
+"""
+Parallel byte-range downloader for large progressive files.
+
+Douyin/TikTok CDNs throttle each connection, so files above a size
+threshold are split into byte ranges that are fetched concurrently and
+written at their offsets into a preallocated file.  The first request of
+every download (``PartialDownload.stream_download``) already asks for
+``bytes=N-``; when the server answers 206 with the file size,
+``download_rest`` keeps that response as the first range and only opens
+connections for the others, so deciding to split costs no extra round
+trip.  Completed ranges are recorded in a PartialDownload sidecar, so a
+retried download only fetches the gaps.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from common import DriverConfig, PartialDownload, Tracing
+from common.Tool import ProgressCallback, report_progress
+
+RANGE_CONNECTIONS = int(os.environ.get("RANGE_DOWNLOAD_CONNECTIONS", 4))
+RANGE_THRESHOLD = int(os.environ.get("RANGE_DOWNLOAD_THRESHOLD", 8 * 1024 * 1024))
+MIN_PART_SIZE = 2 * 1024 * 1024
+CHUNK_SIZE = 1024 * 256
+PART_RETRIES = 2
+
+
+class RangeNotSupported(Exception):
+    """Raised when the server answers a Range request with the full body."""
+
+
+def _range_headers(headers: Dict[str, str], start: int, end: int) -> Dict[str, str]:
+    hdrs = {k: v for k, v in headers.items() if k.lower() != "range"}
+    hdrs["Range"] = f"bytes={start}-{end}"
+    hdrs["Accept-Encoding"] = "identity"
+    return hdrs
+
+
+def worth_splitting(total: Optional[int], connections: int = RANGE_CONNECTIONS,
+                    threshold: int = RANGE_THRESHOLD) -> bool:
+    """True if a file of *total* bytes should be fetched as parallel ranges."""
+    return connections >= 2 and bool(total) and total >= threshold
+
+
+def split_ranges(total: int, connections: int,
+                 gaps: Optional[List[Tuple[int, int]]] = None) -> List[Tuple[int, int]]:
+    """
+    Split the half-open *gaps* (default ``[0, total)``) into inclusive byte
+    ranges, about *connections* of them in total.
+    """
+    gaps = gaps if gaps is not None else [(0, total)]
+    remaining = sum(b - a for a, b in gaps)
+    parts = max(1, min(connections, remaining // MIN_PART_SIZE))
+    size = max(-(-remaining // parts), 1)
+    ranges = []
+    for gap_start, gap_end in gaps:
+        for start in range(gap_start, gap_end, size):
+            ranges.append((start, min(start + size, gap_end) - 1))
+    return ranges
+
+
+def _fetch_part(url: str, part_file: str, headers: Dict[str, str], start: int, end: int,
+                on_bytes, cancelled: threading.Event, timeout: float, resp=None,
+                opener=DriverConfig.pooled_open) -> None:
+    """Write bytes ``start..end`` into *part_file*; *resp* is an already open 206 response at *start*."""
+    offset = start
+    last_error: Optional[Exception] = None
+    for _ in range(PART_RETRIES + 1):
+        current, resp = resp, None
+        if cancelled.is_set():
+            if current is not None:
+                current.close()
+            return
+        try:
+            if current is None:
+                current = opener(url, headers=_range_headers(headers, offset, end), timeout=timeout)
+            with current, open(part_file, "r+b") as f:
+                if current.status != 206:
+                    raise RangeNotSupported(f"HTTP {current.status} for range request")
+                f.seek(offset)
+                while offset <= end:
+                    if cancelled.is_set():
+                        return
+                    buf = current.read(min(CHUNK_SIZE, end - offset + 1))
+                    if not buf:
+                        break
+                    f.write(buf)
+                    on_bytes(offset, len(buf))
+                    offset += len(buf)
+            if offset > end:
+                return
+            last_error = IOError(f"range {start}-{end} ended early at {offset}")
+        except RangeNotSupported:
+            raise
+        except Exception as e:
+            last_error = e
+        print(f"  [Range] {start}-{end} 재시도 (offset {offset}): {last_error}")
+    raise last_error or IOError(f"range {start}-{end} failed")
+
+
+def download_rest(resp, dest_path: str, headers: Dict[str, str], state: Dict, offset: int,
+                  progress: Optional[ProgressCallback] = None,
+                  connections: int = RANGE_CONNECTIONS,
+                  timeout: float = 60,
+                  opener=DriverConfig.pooled_open) -> Tuple[int, str, Optional[int]]:
+    """
+    Finish a download whose first request *resp* answered ``bytes={offset}-``
+    with 206.  *state* describes the file (``total`` and the ranges already
+    on disk, which must cover ``[0, offset)``).  The first missing range is
+    read from *resp*, the others in parallel.  Returns (downloaded,
+    content_type, total) like ``PartialDownload.stream_download``; raises
+    ``RangeNotSupported`` if the server refuses the extra ranges.  The other
+    ranges are requested with *opener*, like the first one.
+    """
+    total = state["total"]
+    ctype = (resp.headers.get("Content-Type") or "").lower()
+    part_file = PartialDownload.part_path(dest_path)
+    # 구간마다 제자리에 쓰므로 .part 파일을 전체 크기로 맞춰 둔다
+    with open(part_file, "r+b" if state["ranges"] else "wb") as f:
+        f.truncate(total)
+
+    ranges = split_ranges(total, connections, PartialDownload.missing_ranges(state, total))
+    if not ranges:
+        resp.close()
+        PartialDownload.finalize(dest_path)
+        return total, ctype, total
+    print(f"  [Range] {total} bytes, {len(ranges)}개 구간 병렬 다운로드")
+
+    lock = threading.Lock()
+    counters = {"downloaded": PartialDownload.completed_bytes(state), "unsaved": 0}
+    cancelled = threading.Event()
+    part_headers = dict(headers)
+    validator = state.get("etag") or state.get("last_modified")
+    if validator:
+        part_headers["If-Range"] = validator
+
+    def on_bytes(start: int, n: int) -> None:
+        with lock:
+            state["ranges"] = PartialDownload.add_range(state["ranges"], start, start + n)
+            counters["downloaded"] += n
+            counters["unsaved"] += n
+            done = counters["downloaded"]
+            Tracing.add_bytes(n)
+            if counters["unsaved"] >= PartialDownload.SAVE_EVERY_BYTES:
+                counters["unsaved"] = 0
+                PartialDownload.save_state(dest_path, state)
+        report_progress(progress, "download", done, total)
+
+    url = resp.geturl()
+    first, rest = ranges[0], ranges[1:]
+    with ThreadPoolExecutor(max_workers=max(len(rest), 1), thread_name_prefix="range") as pool:
+        futures = [
+            pool.submit(Tracing.wrap(_fetch_part), url, part_file, part_headers, start, end, on_bytes, cancelled,
+                        timeout, opener=opener)
+            for start, end in rest
+        ]
+        try:
+            # 첫 구간은 이미 열려 있는 응답에서 읽는다
+            _fetch_part(url, part_file, part_headers, first[0], first[1], on_bytes, cancelled, timeout,
+                        resp=resp if first[0] == offset else None, opener=opener)
+            for future in futures:
+                future.result()
+        except RangeNotSupported:
+            cancelled.set()
+            raise
+        except Exception:
+            cancelled.set()
+            with lock:
+                PartialDownload.save_state(dest_path, state)
+            raise
+
+    PartialDownload.finalize(dest_path)
+    print(f"  [Range] 완료: {counters['downloaded']} bytes")
+    return total, ctype, total
+
+
+__all__ = ["download_rest", "worth_splitting", "split_ranges", "RangeNotSupported"]
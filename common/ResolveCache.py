@@ -0,0 +1,175 @@
+"""
+Cache of resolved direct media URLs keyed by (platform, canonical media id).
+
+Resolving a post (page scrape, GraphQL call or yt-dlp extraction) is the
+slow part of most downloads; fetching the CDN file is the cheap part.  The
+result of the resolve phase is kept here so that a video requested again
+after its file was evicted from the result cache can be fetched straight
+from the CDN without scraping.
+
+CDN URLs are signed and stop working at some point, so each entry expires
+no later than the signature does.  The expiry is read from the usual query
+parameters:
+
+* ``x-expires`` / ``expires`` / ``expire`` - unix seconds (TikTok, Douyin,
+  Google video), milliseconds are accepted too,
+* ``oe`` - hex unix seconds (Instagram / Threads ``fbcdn`` URLs).
+
+URLs without a recognisable expiry are kept for ``ttl`` seconds.  Entries
+are JSON files so every gunicorn worker shares them.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import parse_qsl, urlparse
+
+from common.Extractors import StreamTarget
+from common.ResultCache import CacheKey, SAFE_ID_RE
+
+# 서명 만료 직전의 URL은 다운로드 도중 끊길 수 있으므로 여유를 둔다
+EXPIRY_MARGIN = 60
+
+DECIMAL_EXPIRY_PARAMS = ("x-expires", "expires", "expire")
+HEX_EXPIRY_PARAMS = ("oe",)
+
+
+def url_expiry(url: str) -> Optional[float]:
+    """Return the unix time at which the signed *url* expires, if it says so."""
+    try:
+        params = {k.lower(): v for k, v in parse_qsl(urlparse(url).query)}
+    except ValueError:
+        return None
+    for name in DECIMAL_EXPIRY_PARAMS:
+        value = params.get(name, "")
+        if value.isdigit():
+            expires = int(value)
+            # 밀리초 단위 타임스탬프
+            return expires / 1000.0 if expires > 10 ** 12 else float(expires)
+    for name in HEX_EXPIRY_PARAMS:
+        value = params.get(name, "")
+        try:
+            return float(int(value, 16)) if value else None
+        except ValueError:
+            return None
+    return None
+
+
+def make_entry(platform: str, target: StreamTarget, ttl: int, max_ttl: int,
+               margin: int = EXPIRY_MARGIN) -> Dict:
+    """Build a cache entry for a resolved *target* with its expiry time."""
+    media_url, filename, headers = target
+    now = time.time()
+    signed = url_expiry(media_url)
+    if signed is None:
+        expires_at = now + ttl
+    else:
+        expires_at = min(signed - margin, now + max_ttl)
+    return {
+        "platform": platform,
+        "url": media_url,
+        "filename": filename,
+        "headers": dict(headers or {}),
+        "resolved_at": now,
+        "expires_at": expires_at,
+    }
+
+
+class ResolveCache:
+    """(platform, media id) -> direct media URL, valid until the CDN signature expires."""
+
+    def __init__(self, root_dir: str, ttl: int = 900, max_ttl: int = 6 * 3600) -> None:
+        self.root_dir = root_dir
+        self.ttl = ttl
+        self.max_ttl = max_ttl
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(root_dir, exist_ok=True)
+
+    def _path(self, key: CacheKey) -> Optional[str]:
+        platform, media_id = key
+        if not SAFE_ID_RE.match(platform) or not SAFE_ID_RE.match(media_id):
+            return None
+        return os.path.join(self.root_dir, f"{platform}_{media_id}.json")
+
+    def entry(self, platform: str, target: StreamTarget) -> Dict:
+        return make_entry(platform, target, self.ttl, self.max_ttl)
+
+    def get(self, key: CacheKey) -> Optional[Dict]:
+        """Return the unexpired entry for *key*, or None."""
+        path = self._path(key)
+        entry = None
+        if path:
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                entry = None
+        if entry is not None and entry.get("expires_at", 0) <= time.time():
+            self.invalidate(key)
+            entry = None
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return entry
+
+    def put(self, key: CacheKey, entry: Dict) -> bool:
+        """Store *entry* under *key* unless it is already expired."""
+        path = self._path(key)
+        if not path or entry["expires_at"] <= time.time():
+            return False
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"[Resolve] 캐시 저장 실패 {key}: {e}")
+            return False
+        return True
+
+    def invalidate(self, key: CacheKey) -> None:
+        """Forget *key*, e.g. after its URL stopped working."""
+        path = self._path(key)
+        if path:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def prune(self) -> int:
+        """Delete expired entries and leftover temp files."""
+        removed = 0
+        now = time.time()
+        try:
+            names = os.listdir(self.root_dir)
+        except OSError:
+            return 0
+        for name in names:
+            path = os.path.join(self.root_dir, name)
+            try:
+                if name.endswith(".tmp"):
+                    expired = now - os.path.getmtime(path) > self.ttl
+                else:
+                    with open(path, "r", encoding="utf-8") as f:
+                        expired = json.load(f).get("expires_at", 0) <= now
+                if expired:
+                    os.remove(path)
+                    removed += 1
+            except (OSError, ValueError):
+                pass
+        return removed
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+
+__all__ = ["ResolveCache", "url_expiry", "make_entry", "EXPIRY_MARGIN"]
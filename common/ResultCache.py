@@ -0,0 +1,250 @@
+"""
+Downloaded media cache keyed by (platform, canonical media id).
+
+Finished downloads are hard-linked into ``<root>/<platform>/<media_id>/`` so
+a repeated request for the same video can be served by linking the cached
+file into the new job directory instead of fetching it again.  The cache
+lives on disk, so every gunicorn worker in the container shares it; entry
+directories are touched on each hit and the least recently used ones are
+evicted once the total size exceeds ``max_bytes``.  The cached file's mtime
+marks when it was stored (used for the TTL) and the entry directory's mtime
+marks its last use (used for LRU order).
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import shutil
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+CacheKey = Tuple[str, str]
+
+SAFE_ID_RE = re.compile(r"^[A-Za-z0-9_\-]{1,128}$")
+MAX_ALIASES = 10000
+
+
+def link_or_copy(src: str, dest: str) -> None:
+    """Hard-link *src* to *dest*, copying when the filesystem refuses links."""
+    try:
+        os.link(src, dest)
+    except OSError:
+        shutil.copy2(src, dest)
+
+
+class ResultCache:
+    """Size-bounded LRU cache of downloaded files with a TTL."""
+
+    def __init__(self, root_dir: str, ttl: int = 6 * 3600, max_bytes: int = 1024 * 1024 * 1024) -> None:
+        self.root_dir = root_dir
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # url -> key, learned after downloads whose id is only known afterwards
+        self._aliases: "OrderedDict[str, CacheKey]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(root_dir, exist_ok=True)
+
+    def _entry_dir(self, key: CacheKey) -> Optional[str]:
+        platform, media_id = key
+        if not SAFE_ID_RE.match(platform) or not SAFE_ID_RE.match(media_id):
+            return None
+        return os.path.join(self.root_dir, platform, media_id)
+
+    def _entry_file(self, entry_dir: str) -> Optional[str]:
+        try:
+            names = [n for n in os.listdir(entry_dir) if not n.startswith(".")]
+        except OSError:
+            return None
+        return os.path.join(entry_dir, names[0]) if names else None
+
+    def remember(self, url: str, key: CacheKey) -> None:
+        """Record that *url* resolves to *key* for future lookups."""
+        with self._lock:
+            self._aliases[url] = key
+            self._aliases.move_to_end(url)
+            while len(self._aliases) > MAX_ALIASES:
+                self._aliases.popitem(last=False)
+
+    def lookup_alias(self, url: str) -> Optional[CacheKey]:
+        with self._lock:
+            key = self._aliases.get(url)
+            if key is not None:
+                self._aliases.move_to_end(url)
+            return key
+
+    def get(self, key: CacheKey) -> Optional[str]:
+        """Return the cached file path for *key*, or None if missing or expired."""
+        path = self._lookup(key)
+        # 여러 요청 스레드가 동시에 갱신하므로 카운터는 락 안에서 증가
+        with self._lock:
+            if path:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return path
+
+    def _lookup(self, key: CacheKey) -> Optional[str]:
+        entry_dir = self._entry_dir(key)
+        path = self._entry_file(entry_dir) if entry_dir else None
+        if not path:
+            return None
+
+        try:
+            age = time.time() - os.path.getmtime(path)
+        except OSError:
+            return None
+        if age > self.ttl:
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            return None
+
+        try:
+            # mtime = 마지막 사용 시각 (LRU 기준)
+            os.utime(entry_dir, None)
+        except OSError:
+            pass
+        return path
+
+    def fetch_into(self, key: CacheKey, dest_dir: str) -> Optional[str]:
+        """Link the cached file for *key* into *dest_dir* and return the new path."""
+        path = self.get(key)
+        if not path:
+            return None
+        dest = os.path.join(dest_dir, os.path.basename(path))
+        try:
+            link_or_copy(path, dest)
+        except OSError as e:
+            # Evicted by another worker between get() and link
+            print(f"[Cache] 캐시 파일 연결 실패 {key}: {e}")
+            return None
+        return dest
+
+    def put(self, key: CacheKey, filepath: str) -> Optional[str]:
+        """Store *filepath* under *key*, replacing any older entry, and enforce limits."""
+        entry_dir = self._entry_dir(key)
+        if not entry_dir or not os.path.isfile(filepath):
+            return None
+        if os.path.getsize(filepath) > self.max_bytes:
+            return None
+
+        platform_dir = os.path.dirname(entry_dir)
+        os.makedirs(platform_dir, exist_ok=True)
+        staging = os.path.join(platform_dir, f".tmp-{uuid.uuid4().hex}")
+        try:
+            os.makedirs(staging)
+            cached = os.path.join(staging, os.path.basename(filepath))
+            link_or_copy(filepath, cached)
+            # yt-dlp sets the upstream Last-Modified as mtime; restart the TTL here
+            os.utime(cached, None)
+            if os.path.isdir(entry_dir):
+                shutil.rmtree(entry_dir, ignore_errors=True)
+            os.rename(staging, entry_dir)
+        except OSError as e:
+            print(f"[Cache] 캐시 저장 실패 {key}: {e}")
+            shutil.rmtree(staging, ignore_errors=True)
+            return None
+
+        print(f"[Cache] 저장: {key[0]}/{key[1]}")
+        self.evict()
+        return self._entry_file(entry_dir)
+
+    def _entries(self) -> List[Dict]:
+        entries = []
+        for platform in os.listdir(self.root_dir):
+            platform_dir = os.path.join(self.root_dir, platform)
+            if not os.path.isdir(platform_dir):
+                continue
+            for media_id in os.listdir(platform_dir):
+                if media_id.startswith("."):
+                    continue
+                entry_dir = os.path.join(platform_dir, media_id)
+                try:
+                    files = [os.stat(os.path.join(entry_dir, n)) for n in os.listdir(entry_dir)]
+                    used = os.path.getmtime(entry_dir)
+                except OSError:
+                    continue
+                entries.append({
+                    "dir": entry_dir,
+                    "size": sum(f.st_size for f in files),
+                    # 작업 디렉터리에 하드링크가 남아 있지 않은 바이트 (지우면 실제로 비는 양)
+                    "unique": sum(f.st_size for f in files if f.st_nlink <= 1),
+                    "created": min((f.st_mtime for f in files), default=0),
+                    "used": used,
+                })
+        return entries
+
+    def evict(self) -> Tuple[int, int]:
+        """Drop expired entries, then least recently used ones over ``max_bytes``."""
+        removed = 0
+        reclaimed = 0
+        with self._lock:
+            try:
+                entries = self._entries()
+            except OSError:
+                return 0, 0
+            now = time.time()
+            live = []
+            for entry in entries:
+                if now - entry["created"] > self.ttl:
+                    shutil.rmtree(entry["dir"], ignore_errors=True)
+                    removed += 1
+                    reclaimed += entry["size"]
+                else:
+                    live.append(entry)
+
+            total = sum(e["size"] for e in live)
+            live.sort(key=lambda e: e["used"])
+            while live and total > self.max_bytes:
+                entry = live.pop(0)
+                shutil.rmtree(entry["dir"], ignore_errors=True)
+                total -= entry["size"]
+                removed += 1
+                reclaimed += entry["size"]
+
+        if removed:
+            print(f"[Cache] {removed}개 항목 정리, {reclaimed} bytes 회수")
+        return removed, reclaimed
+
+    def shrink(self, nbytes: int) -> int:
+        """
+        Evict least recently used entries until about *nbytes* of disk space
+        is freed (the janitor's folder quota); returns the bytes freed.
+        """
+        freed = 0
+        removed = 0
+        with self._lock:
+            try:
+                entries = self._entries()
+            except OSError:
+                return 0
+            for entry in sorted(entries, key=lambda e: e["used"]):
+                if freed >= nbytes:
+                    break
+                shutil.rmtree(entry["dir"], ignore_errors=True)
+                freed += entry["unique"]
+                removed += 1
+        if removed:
+            print(f"[Cache] 폴더 용량 초과로 {removed}개 항목 정리, {freed} bytes 회수")
+        return freed
+
+    def stats(self) -> Dict[str, int]:
+        try:
+            entries = self._entries()
+        except OSError:
+            entries = []
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        return {
+            "entries": len(entries),
+            "bytes": sum(e["size"] for e in entries),
+            "hits": hits,
+            "misses": misses,
+        }
+
+
+__all__ = ["ResultCache", "CacheKey", "link_or_copy"]
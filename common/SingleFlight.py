@@ -0,0 +1,115 @@
+"""
+In-flight call coalescing.
+
+When several threads ask for the same key at once, only the first one (the
+leader) runs the function; the others block until it finishes and receive
+the same result or exception.  Coalescing is per process, so each gunicorn
+worker runs at most one download per key at a time.
+
+``follow()`` does the same without blocking: a caller that is not the
+leader registers a callback that the leader's thread runs when the call
+finishes, so a pool worker is not held for the length of someone else's
+download.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+
+Callback = Callable[[Any, Optional[BaseException]], None]
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "waiters", "callbacks")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+        self.callbacks: List[Callback] = []
+
+
+class SingleFlight:
+    """Runs one call per key at a time and shares its outcome with waiters."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.coalesced = 0
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+    def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], Any],
+        timeout: Optional[float] = None,
+        on_wait: Optional[Callable[[], None]] = None,
+    ) -> Tuple[Any, bool]:
+        """
+        Return ``(result, shared)`` where *shared* is True when the result came
+        from another thread's call.  Exceptions raised by the leader are
+        re-raised in every waiter.  *on_wait* is called before a waiter blocks.
+        """
+        call, leader = self._enter(key)
+        if not leader:
+            if on_wait:
+                on_wait()
+            if not call.done.wait(timeout):
+                raise TimeoutError(f"Timed out waiting for in-flight call {key!r}")
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+        return self._lead(key, call, fn), False
+
+    def follow(self, key: Hashable, fn: Callable[[], Any], callback: Callback) -> Tuple[Any, bool]:
+        """
+        Like ``do`` but without blocking.  When a call for *key* is already in
+        flight, register ``callback(result, error)`` and return ``(None, True)``
+        at once; the callback runs on the leader's thread when it finishes.
+        Otherwise run *fn* and return ``(result, False)``.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.callbacks.append(callback)
+                call.waiters += 1
+                self.coalesced += 1
+                return None, True
+            call = self._calls[key] = _Call()
+        return self._lead(key, call, fn), False
+
+    def _enter(self, key: Hashable) -> Tuple[_Call, bool]:
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                return call, True
+            call.waiters += 1
+            self.coalesced += 1
+            return call, False
+
+    def _lead(self, key: Hashable, call: _Call, fn: Callable[[], Any]) -> Any:
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+            for callback in call.callbacks:
+                try:
+                    callback(call.result, call.error)
+                except Exception as e:
+                    print(f"[SingleFlight] 대기 콜백 실패 {key!r}: {e}")
+
+
+__all__ = ["SingleFlight"]
@@ -0,0 +1,146 @@
+"""
+Adaptive ordering of interchangeable extraction strategies.
+
+Extractors usually have several ways to find a media URL (page HTML, a JSON
+API, different headers, ...) and which of them works changes whenever the
+platform ships a new page.  A ``StrategyScheduler`` keeps a rolling window
+of outcomes per strategy and hands back an order to try them in:
+
+* strategies are ranked by success rate, then by mean latency,
+* a strategy that keeps failing (``skip_below`` over at least
+  ``min_samples`` attempts) is skipped,
+* with probability ``explore`` one of the skipped ones is tried first, so
+  a strategy that starts working again is noticed.
+
+Statistics live in memory per worker and are optionally written to a JSON
+file (``STRATEGY_STATS_DIR``) so that a restarted worker starts from what
+the previous one learned.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+
+STATS_DIR = os.environ.get("STRATEGY_STATS_DIR", "")
+SAVE_INTERVAL = 30.0
+
+
+class StrategyScheduler:
+    """Rolling success/latency statistics that decide which strategy to try first."""
+
+    def __init__(
+        self,
+        name: str,
+        strategies: Iterable[str],
+        window: int = 50,
+        explore: float = 0.1,
+        skip_below: float = 0.05,
+        min_samples: int = 10,
+        state_path: Optional[str] = None,
+    ) -> None:
+        self.name = name
+        self.strategies = list(strategies)
+        self.window = window
+        self.explore = explore
+        self.skip_below = skip_below
+        self.min_samples = min_samples
+        if state_path is None and STATS_DIR:
+            state_path = os.path.join(STATS_DIR, f"{name}.json")
+        self.state_path = state_path
+        self._lock = threading.Lock()
+        # strategy -> deque of (ok, latency)
+        self._samples: Dict[str, Deque[Tuple[bool, float]]] = {
+            s: deque(maxlen=window) for s in self.strategies
+        }
+        self._last_save = 0.0
+        self._load()
+
+    def record(self, strategy: str, ok: bool, latency: float) -> None:
+        """Add one outcome for *strategy*."""
+        with self._lock:
+            samples = self._samples.setdefault(strategy, deque(maxlen=self.window))
+            samples.append((bool(ok), round(float(latency), 3)))
+            due = self.state_path and time.monotonic() - self._last_save >= SAVE_INTERVAL
+        if due:
+            self.save()
+
+    def _score(self, strategy: str) -> Tuple[float, float, int, int]:
+        samples = self._samples.get(strategy) or ()
+        n = len(samples)
+        successes = sum(1 for ok, _ in samples if ok)
+        # 기록이 없는 전략은 성공률 0.5, 지연 0으로 시작
+        rate = (successes + 1) / (n + 2)
+        latency = sum(lat for _, lat in samples) / n if n else 0.0
+        return rate, latency, n, successes
+
+    def order(self) -> List[str]:
+        """Strategies to try, best first; failing ones are skipped unless one is being explored."""
+        with self._lock:
+            scores = {s: self._score(s) for s in self.strategies}
+        ranked = sorted(
+            self.strategies,
+            key=lambda s: (-scores[s][0], scores[s][1], self.strategies.index(s)),
+        )
+        active = [s for s in ranked if not self._demoted(scores[s])]
+        demoted = [s for s in ranked if self._demoted(scores[s])]
+        if not active:
+            return demoted
+        if demoted and random.random() < self.explore:
+            # 뒤에 붙이면 앞의 전략이 성공해 시도되지 않으므로 맨 앞에서 표본을 얻는다
+            return [random.choice(demoted)] + active
+        return active
+
+    def _demoted(self, score: Tuple[float, float, int, int]) -> bool:
+        _, _, n, successes = score
+        return n >= self.min_samples and successes / n < self.skip_below
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            result = {}
+            for s in self._samples:
+                score = self._score(s)
+                _, latency, n, successes = score
+                result[s] = {
+                    "samples": n,
+                    "success_rate": round(successes / n, 3) if n else None,
+                    "mean_latency": round(latency, 3),
+                    "demoted": self._demoted(score),
+                }
+            return result
+
+    def _load(self) -> None:
+        if not self.state_path:
+            return
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        for strategy, samples in (data.get("samples") or {}).items():
+            if strategy in self._samples:
+                self._samples[strategy].extend((bool(ok), float(lat)) for ok, lat in samples)
+
+    def save(self) -> None:
+        """Write the current windows to ``state_path`` (no-op without one)."""
+        if not self.state_path:
+            return
+        with self._lock:
+            data = {"samples": {s: list(d) for s, d in self._samples.items()}}
+            self._last_save = time.monotonic()
+        tmp_path = f"{self.state_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.state_path) or ".", exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.state_path)
+        except OSError as e:
+            print(f"[Strategy] {self.name} 통계 저장 실패: {e}")
+
+
+__all__ = ["StrategyScheduler", "STATS_DIR"]
@@ -0,0 +1,138 @@
+"""
+Zero-disk streaming of resolved media URLs.
+
+In stream mode the extractor only resolves the direct CDN URL; the bytes
+are then piped from the upstream response to the client one chunk at a
+time, so nothing is written to ``/tmp/downloads`` (a tmpfs on Cloud Run)
+and at most ``CHUNK_SIZE`` bytes per stream are held in memory.
+
+Resolved targets are stored as small JSON files under a token so that the
+follow-up GET can be answered by any gunicorn worker, the same way job
+state is shared.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import time
+import uuid
+from typing import Dict, Iterator, Optional
+
+from common import DriverConfig
+
+CHUNK_SIZE = int(os.environ.get("STREAM_CHUNK_SIZE", 64 * 1024))
+READ_TIMEOUT = 60
+
+TOKEN_RE = re.compile(r"^[0-9a-f]{32}$")
+
+# 클라이언트에 그대로 전달할 업스트림 응답 헤더
+PASSTHROUGH_HEADERS = ("Content-Length", "Content-Range", "Accept-Ranges", "Last-Modified", "ETag")
+
+
+class StreamTargets:
+    """Token -> resolved media target, persisted as JSON for cross-worker lookups."""
+
+    def __init__(self, root_dir: str, ttl: int = 600) -> None:
+        self.root_dir = root_dir
+        self.ttl = ttl
+        os.makedirs(root_dir, exist_ok=True)
+
+    def _path(self, token: str) -> str:
+        return os.path.join(self.root_dir, f"{token}.json")
+
+    def put(self, platform: str, media_url: str, filename: str, headers: Dict[str, str]) -> str:
+        """Store a resolved target and return its token."""
+        self.prune()
+        token = uuid.uuid4().hex
+        target = {
+            "platform": platform,
+            "url": media_url,
+            "filename": filename,
+            "headers": headers,
+            "created_at": time.time(),
+        }
+        tmp_path = self._path(token) + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(target, f)
+        os.replace(tmp_path, self._path(token))
+        return token
+
+    def get(self, token: str) -> Optional[dict]:
+        if not TOKEN_RE.match(token):
+            return None
+        try:
+            with open(self._path(token), "r", encoding="utf-8") as f:
+                target = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - target.get("created_at", 0) > self.ttl:
+            return None
+        return target
+
+    def prune(self) -> int:
+        """Delete targets older than ``ttl``."""
+        removed = 0
+        cutoff = time.time() - self.ttl
+        try:
+            names = os.listdir(self.root_dir)
+        except OSError:
+            return 0
+        for name in names:
+            path = os.path.join(self.root_dir, name)
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+                    removed += 1
+            except OSError:
+                pass
+        return removed
+
+
+def open_upstream(target: dict, range_header: Optional[str] = None) -> DriverConfig.PooledResponse:
+    """Open the target's media URL, forwarding the client's Range header."""
+    headers = dict(target.get("headers") or {})
+    headers["Accept-Encoding"] = "identity"
+    if range_header:
+        headers["Range"] = range_header
+    return DriverConfig.pooled_open(target["url"], headers=headers, timeout=READ_TIMEOUT)
+
+
+def response_headers(upstream: DriverConfig.PooledResponse) -> Dict[str, str]:
+    """Headers to copy from the upstream response to the client."""
+    headers = {}
+    for name in PASSTHROUGH_HEADERS:
+        value = upstream.headers.get(name)
+        if value:
+            headers[name] = value
+    return headers
+
+
+def iter_body(upstream: DriverConfig.PooledResponse, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Yield the upstream body chunk by chunk and release the connection afterwards.
+    A generator that is never started never runs its cleanup, so the caller
+    also closes *upstream* when its response is closed.
+    """
+    sent = 0
+    try:
+        while True:
+            buf = upstream.read(chunk_size)
+            if not buf:
+                break
+            sent += len(buf)
+            yield buf
+    finally:
+        # 클라이언트가 중간에 끊어도 커넥션은 반환한다
+        upstream.close()
+        print(f"[Stream] {sent} bytes 전송: {upstream.geturl()[:80]}")
+
+
+__all__ = [
+    "StreamTargets",
+    "open_upstream",
+    "response_headers",
+    "iter_body",
+    "CHUNK_SIZE",
+]
@@ -1,13 +1,51 @@
+import functools
 import re
 import time
 from urllib.parse import urlparse, urlunparse, unquote, urljoin, parse_qs
 from urllib.request import Request, urlopen, build_opener, HTTPRedirectHandler
 import html
-from typing import Dict, List, Optional, Tuple, Iterable
+from typing import Callable, Dict, List, Optional, Tuple, Iterable
 import random
 
-from common import DriverConfig
+from common import DriverConfig, PartialDownload
 
+# progress(stage, downloaded_bytes, total_bytes) - 다운로드 진행 상황 콜백
+ProgressCallback = Callable[[str, int, Optional[int]], None]
+
+def report_progress(progress: Optional[ProgressCallback], stage: str,
+                    downloaded: int = 0, total: Optional[int] = None) -> None:
+    """진행 상황 콜백 호출 (콜백 오류가 다운로드를 중단시키지 않도록 보호)"""
+    if not progress:
+        return
+    try:
+        progress(stage, downloaded, total)
+    except Exception as e:
+        print(f"[Progress] 콜백 오류: {e}")
+
+
+# 품질 힌트를 한 번의 스캔으로 찾는다. 각 대안을 전방탐색으로 감싸 위치마다 검사하므로
+# 패턴별 findall을 따로 돌릴 때와 같은 (겹치는) 매치를 모두 얻는다.
+_QUALITY_HINT_RE = re.compile(
+    r"(?=(\d{3,4})p"                                    # 1: 1080p
+    r"|fps[=:_-]?(\d{2,3})"                             # 2: fps30, fps=60
+    r"|(?:bitrate|br|bw|bandwidth)[=:_-]?(\d{3,7})"      # 3: br=1820
+    r"|(\d{3,5})kbps"                                   # 4: 1500kbps
+    r"|(uhd|4k))"                                       # 5: 4k 표시
+)
+_QUERY_HINTS = ("ratio", "fps", "bitrate", "br", "bw", "bandwidth", "%")
+_DIGITS_RE = re.compile(r"(\d{3,4})")
+_BITRATE_DIGITS_RE = re.compile(r"(\d{3,7})")
+
+# 미디어가 아닌 정적 리소스 (경로 확장자 기준)
+STATIC_EXTENSIONS = (
+    ".js", ".css", ".jpg", ".jpeg", ".png", ".gif", ".svg", ".ico", ".webp",
+    ".woff", ".woff2", ".ttf", ".map",
+)
+# 같은 후보가 페이지/요청마다 반복되므로 URL별 점수를 기억한다
+RANK_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=RANK_CACHE_SIZE)
 def _extract_quality_metrics(url: str) -> Tuple[int, int, int]:
     """
     Inspect known query parameters and path segments to infer relative quality.
@@ -18,22 +56,30 @@ def _extract_quality_metrics(url: str) -> Tuple[int, int, int]:
     fps = 0
     bitrate = 0
 
-    # Look for explicit resolution markers like 1080p, 720p, 2160p, etc.
-    for match in re.findall(r'(\d{3,4})p', lower):
-        try:
-            quality = max(quality, int(match))
-        except ValueError:
-            continue
-
-    # Ensure well-known high-quality markers count even if "p" not present.
-    if "uhd" in lower or "4k" in lower:
-        quality = max(quality, 2160)
+    # Resolution markers (1080p, 2160p, uhd/4k), fps and bitrate/bandwidth hints.
+    for m in _QUALITY_HINT_RE.finditer(lower):
+        res, fps_hint, br_hint, kbps, marker = m.groups()
+        if res:
+            quality = max(quality, int(res))
+        elif fps_hint:
+            fps = max(fps, int(fps_hint))
+        elif br_hint:
+            bitrate = max(bitrate, int(br_hint))
+        elif kbps:
+            bitrate = max(bitrate, int(kbps) * 1000)
+        elif marker:
+            quality = max(quality, 2160)
 
+    if "?" not in url:
+        return quality, fps, bitrate
     parsed = urlparse(url)
+    if not any(k in parsed.query for k in _QUERY_HINTS):
+        return quality, fps, bitrate
+
     query = parse_qs(parsed.query)
     for ratio in query.get("ratio", []):
         ratio_lower = ratio.lower()
-        m = re.search(r'(\d{3,4})', ratio_lower)
+        m = _DIGITS_RE.search(ratio_lower)
         if m:
             quality = max(quality, int(m.group(1)))
         if "uhd" in ratio_lower or "4k" in ratio_lower:
@@ -42,71 +88,81 @@ def _extract_quality_metrics(url: str) -> Tuple[int, int, int]:
     for fps_val in query.get("fps", []):
         if fps_val.isdigit():
             fps = max(fps, int(fps_val))
-    for match in re.findall(r'fps[=:_-]?(\d{2,3})', lower):
-        try:
-            fps = max(fps, int(match))
-        except ValueError:
-            continue
 
-    # Extract bitrate/bandwidth hints.
     for key in ("bitrate", "br", "bw", "bandwidth"):
         for value in query.get(key, []):
-            m = re.search(r'(\d{3,7})', value)
+            m = _BITRATE_DIGITS_RE.search(value)
             if m:
                 bitrate = max(bitrate, int(m.group(1)))
-    for match in re.findall(r'(?:bitrate|br|bw|bandwidth)[=:_-]?(\d{3,7})', lower):
-        try:
-            bitrate = max(bitrate, int(match))
-        except ValueError:
-            continue
-    for match in re.findall(r'(\d{3,5})kbps', lower):
-        try:
-            bitrate = max(bitrate, int(match) * 1000)
-        except ValueError:
-            continue
 
     return quality, fps, bitrate
 
+@functools.lru_cache(maxsize=RANK_CACHE_SIZE)
+def _rank_url(url: str, platform: str) -> Tuple[int, int, int, int]:
+    """Sort key of a cleaned candidate: (quality, fps, bitrate, score)."""
+    score = 0
+    if "playwm" in url or "watermark=1" in url or "wm=1" in url:
+        score -= 20
+    if platform == "tiktok":
+        if any(k in url for k in ("v16", "v19", "v24", "tiktokcdn", "tiktokcdn-us")):
+            score += 5
+        if "/video/" in url or "/play/" in url:
+            score += 3
+    else:  # douyin
+        if "douyin" in url and ("play" in url or "video" in url):
+            score += 5
+        if "/aweme/v1/play" in url or "video_id=" in url:
+            score += 6
+        if "play/" in url:
+            score += 3
+        if ".mp4" in url:
+            score += 4
+    if any(url.endswith(suf) for suf in (".html", "/", ".htm")):
+        score -= 3
+    if url.endswith(".mp4"):
+        score += 2
+    quality, fps, bitrate = _extract_quality_metrics(url)
+    return quality, fps, bitrate, score
+
+def _clean_candidate(u: str) -> Optional[str]:
+    if "&" in u:
+        u = html.unescape(u)
+    if "\\" in u:
+        u = u.replace("\\u002F", "/").replace("\\/", "/")
+    if not u.startswith("https:"):
+        u = DriverConfig.ensure_https(u)
+    return u if u.startswith("http") else None
+
+def _is_static_asset(url: str) -> bool:
+    path = url.split("#", 1)[0].split("?", 1)[0].lower()
+    return path.endswith(STATIC_EXTENSIONS)
+
 def pick_best_url(candidates, platform: str) -> Optional[str]:
+    """
+    Highest ranked media URL among *candidates* (the first one on ties).
+
+    Duplicates are scored once and static assets (scripts, styles, images,
+    fonts) are dropped before ranking, unless nothing else is left.
+    """
     cleaned = []
-    for u in candidates:
+    static = []
+    for u in dict.fromkeys(candidates):
         if not u:
             continue
-        u = html.unescape(u)
-        u = u.replace("\\u002F", "/").replace("\\/", "/")
-        u = DriverConfig.ensure_https(u)
-        if not u.startswith("http"):
+        u = _clean_candidate(u)
+        if not u:
             continue
-        cleaned.append(u)
+        (static if _is_static_asset(u) else cleaned).append(u)
+    if not cleaned:
+        cleaned = static
 
-    priorities = []
+    best = None
+    best_key = None
     for u in cleaned:
-        score = 0
-        if "playwm" in u or "watermark=1" in u or "wm=1" in u:
-            score -= 20
-        if platform == "tiktok":
-            if any(k in u for k in ("v16", "v19", "v24", "tiktokcdn", "tiktokcdn-us")):
-                score += 5
-            if "/video/" in u or "/play/" in u:
-                score += 3
-        else:  # douyin
-            if "douyin" in u and ("play" in u or "video" in u):
-                score += 5
-            if "/aweme/v1/play" in u or "video_id=" in u:
-                score += 6
-            if "play/" in u:
-                score += 3
-            if ".mp4" in u:
-                score += 4
-        if any(u.endswith(suf) for suf in (".html", "/", ".htm")):
-            score -= 3
-        if u.endswith(".mp4"):
-            score += 2
-        quality, fps, bitrate = _extract_quality_metrics(u)
-        priorities.append(((quality, fps, bitrate, score), u))
-
-    priorities.sort(key=lambda x: x[0], reverse=True)
-    return priorities[0][1] if priorities else None
+        key = _rank_url(u, platform)
+        if best_key is None or key > best_key:
+            best, best_key = u, key
+    return best
     
         
 def sanitize_filename(name: str, max_len: int = 150) -> str:
@@ -115,7 +171,8 @@ def sanitize_filename(name: str, max_len: int = 150) -> str:
     name = re.sub(r"\s+", " ", name)
     return name[:max_len].strip()
 
-def download_file(url: str, dest_path: str, referer: str, platform: str = ""):
+def download_file(url: str, dest_path: str, referer: str, platform: str = "",
+                  progress: Optional[ProgressCallback] = None):
     """강화된 파일 다운로드 함수"""
     print(f"[다운로드] 시작: {url[:100]}...")
     
@@ -127,7 +184,7 @@ def download_file(url: str, dest_path: str, referer: str, platform: str = ""):
         "Connection": "keep-alive",
     })
 
-    # 다운로드 시도
+    # 다운로드 시도 (끊긴 시도는 .part 파일에서 이어받는다)
     max_retries = 3
     for attempt in range(max_retries):
         try:
@@ -139,27 +196,18 @@ def download_file(url: str, dest_path: str, referer: str, platform: str = ""):
                 headers.update({
                     "Referer": referer or "",
                     "Accept": "*/*",
-                    "Range": "bytes=0-",  # Range 헤더 추가
                 })
                 time.sleep(random.uniform(1, 3))  # 랜덤 대기
             
-            req = Request(url, headers=headers)
-            with urlopen(req, timeout=60) as resp, open(dest_path, "wb") as f:
-                total_size = 0
-                while True:
-                    chunk = resp.read(1024 * 256)
-                    if not chunk:
-                        break
-                    f.write(chunk)
-                    total_size += len(chunk)
-                
-                print(f"[다운로드] 완료: {total_size} 바이트")
-                
-                # 파일 크기 검증
-                if total_size < 1024:  # 1KB 미만이면 오류로 간주
-                    raise Exception(f"파일이 너무 작습니다: {total_size} 바이트")
-                
-                return  # 성공
+            # 첫 응답 헤더로 구간 병렬 다운로드 여부를 정한다 (큰 파일만, 추가 요청 없음)
+            downloaded, _, _ = PartialDownload.stream_download(url, dest_path, headers, progress, retries=0)
+            print(f"[다운로드] 완료: {downloaded} 바이트")
+            
+            # 파일 크기 검증
+            if downloaded < 1024:  # 1KB 미만이면 오류로 간주
+                raise Exception(f"파일이 너무 작습니다: {downloaded} 바이트")
+            
+            return  # 성공
                 
         except Exception as e:
             print(f"[다운로드] 시도 {attempt + 1} 실패: {str(e)}")
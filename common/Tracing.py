@@ -0,0 +1,257 @@
+"""
+Per-request timing spans, emitted as structured JSON log lines.
+
+A ``trace`` wraps one unit of work (an API request or a download job) and
+collects the ``span``s opened while it is active: redirect resolution,
+page fetches, parsing, API probes, transfers, post-processing.  When the
+trace ends a single JSON line is printed to stdout, which Cloud Logging
+ingests as a structured entry::
+
+    {"severity": "INFO", "message": "[Trace] job tiktok 2.41s", "trace": {...}}
+
+The active trace is held in a ``contextvars.ContextVar`` so concurrent
+jobs on different threads do not mix.  Work handed to a thread pool keeps
+the caller's trace when submitted through ``wrap``.  Spans opened with no
+active trace only reach the listeners (e.g. metrics), nothing is logged.
+
+A job that hands back a ``Future`` (e.g. one that shares another job's
+download) is still running when its block exits; ``finish_with(future)``
+keeps its trace open until the future is done, so the trace reports the
+real wait and outcome.
+
+Set ``TRACE_LOG=0`` to stop printing traces; listeners still run.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional
+
+TRACE_LOG = os.environ.get("TRACE_LOG", "1") != "0"
+# 한 요청에서 기록할 최대 스팬 수 (HLS 세그먼트 등으로 로그가 폭증하지 않게)
+MAX_SPANS = 200
+
+_bytes_lock = threading.Lock()
+
+
+class Span:
+    """One timed step; ``bytes`` and attributes can be added while it runs."""
+
+    __slots__ = ("name", "attrs", "start", "duration", "bytes", "error")
+
+    def __init__(self, name: str, attrs: Dict) -> None:
+        self.name = name
+        self.attrs = attrs
+        self.start = time.monotonic()
+        self.duration: Optional[float] = None
+        self.bytes = 0
+        self.error: Optional[str] = None
+
+    def set(self, **attrs) -> "Span":
+        self.attrs.update(attrs)
+        return self
+
+    def add_bytes(self, n: int) -> None:
+        # 병렬 구간 다운로드 스레드들이 같은 스팬에 더한다
+        with _bytes_lock:
+            self.bytes += n
+
+    def to_dict(self, origin: float) -> Dict:
+        record = {
+            "name": self.name,
+            "start_ms": round((self.start - origin) * 1000, 1),
+            "duration_ms": round((self.duration or 0) * 1000, 1),
+        }
+        if self.bytes:
+            record["bytes"] = self.bytes
+        if self.attrs:
+            record["attrs"] = self.attrs
+        if self.error:
+            record["error"] = self.error
+        return record
+
+
+class Trace:
+    """The spans recorded for one request or job."""
+
+    def __init__(self, name: str, attrs: Dict) -> None:
+        self.trace_id = uuid.uuid4().hex[:16]
+        self.root = Span(name, attrs)
+        self._lock = threading.Lock()
+        self.spans: List[Span] = []
+        self.dropped = 0
+        # finish_with()로 지정하면 블록이 끝나도 이 Future가 끝날 때 닫는다
+        self.pending: Optional[Future] = None
+
+    def add(self, span: Span) -> None:
+        with self._lock:
+            if len(self.spans) < MAX_SPANS:
+                self.spans.append(span)
+            else:
+                self.dropped += 1
+
+    def to_dict(self) -> Dict:
+        origin = self.root.start
+        with self._lock:
+            spans = [s.to_dict(origin) for s in self.spans]
+        record = dict(self.root.to_dict(origin), trace_id=self.trace_id, spans=spans)
+        del record["start_ms"]
+        if self.dropped:
+            record["dropped_spans"] = self.dropped
+        return record
+
+
+_current: contextvars.ContextVar[Optional[Trace]] = contextvars.ContextVar("trace", default=None)
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar("span", default=None)
+_listeners: List[Callable[[str, Span, Dict], None]] = []
+
+
+def add_listener(listener: Callable[[str, Span, Dict], None]) -> None:
+    """Call ``listener(kind, span, trace_attrs)`` for every finished span and trace.
+
+    *kind* is ``"span"`` or ``"trace"``; *trace_attrs* are the attributes of
+    the enclosing trace (e.g. ``platform``), empty outside a trace.
+    """
+    _listeners.append(listener)
+
+
+def _notify(kind: str, span: Span, trace_attrs: Dict) -> None:
+    for listener in _listeners:
+        try:
+            listener(kind, span, trace_attrs)
+        except Exception as e:
+            print(f"[Trace] listener failed: {e}")
+
+
+def current() -> Optional[Trace]:
+    return _current.get()
+
+
+def annotate(**attrs) -> None:
+    """Add attributes to the active trace (e.g. the detected platform)."""
+    active = _current.get()
+    if active is not None:
+        active.root.set(**attrs)
+
+
+def add_bytes(n: int) -> None:
+    """Count *n* transferred bytes on the innermost open span."""
+    active = _current_span.get()
+    if active is not None:
+        active.add_bytes(n)
+
+
+@contextmanager
+def span(name: str, **attrs) -> Iterator[Span]:
+    """Time the enclosed block as *name* within the active trace."""
+    item = Span(name, attrs)
+    token = _current_span.set(item)
+    try:
+        yield item
+    except BaseException as e:
+        item.error = type(e).__name__
+        raise
+    finally:
+        _current_span.reset(token)
+        item.duration = time.monotonic() - item.start
+        active = _current.get()
+        if active is not None:
+            active.add(item)
+        _notify("span", item, active.root.attrs if active is not None else {})
+
+
+@contextmanager
+def trace(name: str, **attrs) -> Iterator[Trace]:
+    """Collect the spans of the enclosed block and log them as one JSON line."""
+    item = Trace(name, attrs)
+    token = _current.set(item)
+    span_token = _current_span.set(item.root)
+    try:
+        yield item
+    except BaseException as e:
+        item.root.error = type(e).__name__
+        raise
+    finally:
+        _current_span.reset(span_token)
+        _current.reset(token)
+        if item.pending is None or item.root.error:
+            _finish(item)
+        else:
+            item.pending.add_done_callback(lambda future: _finish(item, future))
+
+
+def finish_with(future: Future) -> None:
+    """End the active trace when *future* is done rather than when its block exits."""
+    active = _current.get()
+    if active is not None:
+        active.pending = future
+
+
+def _finish(item: Trace, future: Optional[Future] = None) -> None:
+    if future is not None:
+        if future.cancelled():
+            item.root.error = "CancelledError"
+        elif future.exception() is not None:
+            item.root.error = type(future.exception()).__name__
+    item.root.duration = time.monotonic() - item.root.start
+    _notify("trace", item.root, item.root.attrs)
+    if TRACE_LOG:
+        _emit(item)
+
+
+def _emit(item: Trace) -> None:
+    record = item.to_dict()
+    platform = item.root.attrs.get("platform") or ""
+    severity = "ERROR" if item.root.error else "INFO"
+    message = f"[Trace] {item.root.name} {platform} {item.root.duration:.2f}s".replace("  ", " ")
+    print(json.dumps({"severity": severity, "message": message, "trace": record},
+                     ensure_ascii=False, default=str), flush=True)
+
+
+def timed(name: str, **attrs) -> Callable[[Callable], Callable]:
+    """Decorator form of ``span`` for functions that are one stage as a whole."""
+
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(name, **attrs):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def wrap(fn: Callable) -> Callable:
+    """Bind *fn* to the caller's trace so it can run on a pool thread."""
+    context = contextvars.copy_context()
+
+    def run(*args, **kwargs):
+        # 같은 컨텍스트를 여러 스레드에서 동시에 들어갈 수 없으므로 복사본에서 실행
+        return context.copy().run(fn, *args, **kwargs)
+
+    return run
+
+
+__all__ = [
+    "Span",
+    "Trace",
+    "span",
+    "trace",
+    "finish_with",
+    "current",
+    "annotate",
+    "add_bytes",
+    "add_listener",
+    "timed",
+    "wrap",
+    "TRACE_LOG",
+]
@@ -0,0 +1,428 @@
+"""
+In-process yt-dlp backend.
+
+Spawning ``yt-dlp`` per request pays interpreter start-up plus yt-dlp's
+import graph every time.  This module imports yt-dlp once per worker and
+keeps a small pool of ``YoutubeDL`` instances per (format, output
+template), so extractor classes and their instances are loaded once and
+reused.  An instance is only used by one thread at a time; the job
+directory is passed through the ``paths`` option on checkout.
+
+``ytdlp.download`` spans contain a ``ytdlp.transfer`` span per downloaded
+file (opened and closed from the progress hooks) and a
+``ytdlp.postprocess`` span per post-processor (merging, remuxing), so a
+trace shows where a slow download spent its time.
+
+``download_info`` downloads from an info dict that ``extract_info``
+already returned (as yt-dlp's ``--load-info-json`` does), so a caller that
+looked at the formats first does not pay for a second extraction.
+
+A call with a ``timeout`` runs yt-dlp on a helper thread and stops waiting
+when the timeout expires, whether yt-dlp is extracting, downloading or
+post-processing.  yt-dlp cannot be interrupted from outside, so the
+instance is abandoned instead of returned to the pool: its hooks raise at
+the next progress report and ``socket_timeout`` ends any blocked read.
+
+Failures are raised as ``YtDlpError`` with a ``kind`` (``unavailable``,
+``private``, ``login_required``, ``geo_blocked``, ``rate_limited``,
+``unsupported``, ``network``, ``timeout``, ``not_installed``, ``unknown``)
+so callers can report something more useful than the raw stderr.
+
+``resolve`` is the extractor-facing entry point: it extracts a URL once
+and returns an ``Extractors.Resolution`` whose target is the selected
+format's direct URL and whose download reuses the extracted info.
+"""
+
+from __future__ import annotations
+
+import copy
+import os
+import re
+import threading
+import time
+from collections import deque
+from contextlib import ExitStack
+from http.cookies import SimpleCookie
+from typing import Callable, Deque, Dict, Iterable, Optional, Tuple
+
+from common import Extractors, Tracing
+from common.Tool import ProgressCallback, report_progress
+
+try:
+    import yt_dlp
+    from yt_dlp.utils import DownloadError
+except ImportError:  # yt-dlp is an optional dependency of the CLI tools
+    yt_dlp = None
+    DownloadError = Exception
+
+POOL_SIZE = int(os.environ.get("YTDLP_POOL_SIZE", 4))
+SOCKET_TIMEOUT = 30
+
+BASE_PARAMS = {
+    "quiet": True,
+    "no_warnings": True,
+    "noprogress": True,
+    "noplaylist": True,
+    "restrictfilenames": True,
+    "socket_timeout": SOCKET_TIMEOUT,
+}
+
+# (pattern, kind) - 먼저 일치하는 항목 사용
+ERROR_KINDS: Tuple[Tuple[re.Pattern, str], ...] = (
+    (re.compile(r"private", re.I), "private"),
+    (re.compile(r"log ?in|sign in|cookies|authenticat", re.I), "login_required"),
+    (re.compile(r"geo|your country|region", re.I), "geo_blocked"),
+    (re.compile(r"HTTP Error 429|too many requests|rate.?limit", re.I), "rate_limited"),
+    (re.compile(r"unsupported url|no video formats|requested format is not available", re.I), "unsupported"),
+    (re.compile(r"unavailable|not available|removed|deleted|does not exist|HTTP Error 404|HTTP Error 410", re.I),
+     "unavailable"),
+    (re.compile(r"timed? ?out|connection|network|unreachable|HTTP Error 5\d\d|name resolution", re.I), "network"),
+)
+
+
+class YtDlpError(Exception):
+    """A yt-dlp failure with a coarse machine-readable ``kind``."""
+
+    def __init__(self, message: str, kind: str = "unknown") -> None:
+        super().__init__(message)
+        self.kind = kind
+
+    def to_dict(self) -> Dict[str, str]:
+        return {"kind": self.kind, "message": str(self)}
+
+
+def classify_error(message: str) -> str:
+    for pattern, kind in ERROR_KINDS:
+        if pattern.search(message or ""):
+            return kind
+    return "unknown"
+
+
+class _Logger:
+    """Route yt-dlp messages to our log format and keep the last error."""
+
+    def __init__(self) -> None:
+        self.last_error = ""
+
+    def debug(self, msg: str) -> None:
+        pass
+
+    def info(self, msg: str) -> None:
+        pass
+
+    def warning(self, msg: str) -> None:
+        print(f"[yt-dlp] {msg}")
+
+    def error(self, msg: str) -> None:
+        self.last_error = msg
+        print(f"[yt-dlp] {msg}")
+
+
+class _Slot:
+    """A pooled YoutubeDL instance plus the per-checkout state its hooks read."""
+
+    def __init__(self, params: Dict) -> None:
+        self.logger = _Logger()
+        self.progress: Optional[ProgressCallback] = None
+        # 시간 초과로 포기한 인스턴스 - 백그라운드에서 계속 돌지 않도록 훅에서 중단시킨다
+        self.abandoned = threading.Event()
+        # 훅으로 열고 닫는 단계별 스팬: key -> (ExitStack, Span, 기록한 바이트)
+        self._stages: Dict[str, list] = {}
+        self.ydl = yt_dlp.YoutubeDL(dict(params, logger=self.logger, progress_hooks=[self._hook],
+                                         postprocessor_hooks=[self._pp_hook]))
+
+    def _hook(self, status: Dict) -> None:
+        if self.abandoned.is_set():
+            raise YtDlpError("yt-dlp download timed out", kind="timeout")
+        state = status.get("status")
+        if state == "downloading":
+            stage = self._stages.get("transfer") or self._open("transfer", "ytdlp.transfer")
+            downloaded = status.get("downloaded_bytes")
+            total = status.get("total_bytes") or status.get("total_bytes_estimate")
+            if downloaded is not None:
+                if downloaded > stage[2]:
+                    stage[1].add_bytes(int(downloaded) - stage[2])
+                    stage[2] = int(downloaded)
+                report_progress(self.progress, "download", int(downloaded), int(total) if total else None)
+        elif state == "finished":
+            stage = self._stages.get("transfer")
+            size = status.get("total_bytes") or status.get("downloaded_bytes")
+            if stage is not None and size and size > stage[2]:
+                stage[1].add_bytes(int(size) - stage[2])
+            self._close("transfer")
+        elif state == "error":
+            self._close("transfer", error="DownloadError")
+
+    def _pp_hook(self, status: Dict) -> None:
+        if self.abandoned.is_set():
+            raise YtDlpError("yt-dlp post-processing timed out", kind="timeout")
+        if status.get("status") == "started":
+            self._close("transfer")
+            self._open("postprocess", "ytdlp.postprocess", postprocessor=status.get("postprocessor"))
+        elif status.get("status") == "finished":
+            self._close("postprocess")
+
+    def _open(self, key: str, name: str, **attrs) -> list:
+        self._close(key)
+        stack = ExitStack()
+        stage = [stack, stack.enter_context(Tracing.span(name, **attrs)), 0]
+        self._stages[key] = stage
+        return stage
+
+    def _close(self, key: str, error: Optional[str] = None) -> None:
+        stage = self._stages.pop(key, None)
+        if stage is not None:
+            if error:
+                stage[1].error = error
+            stage[0].close()
+
+    def close_stages(self, error: Optional[str] = None) -> None:
+        """Close spans left open by a failed run (innermost first)."""
+        for key in ("postprocess", "transfer"):
+            self._close(key, error)
+
+    def checkout(self, home: Optional[str], progress: Optional[ProgressCallback]) -> None:
+        self.ydl.params["paths"] = {"home": home} if home else {}
+        self.progress = progress
+        self.logger.last_error = ""
+
+    def release(self) -> None:
+        self.progress = None
+
+
+class YtDlpEngine:
+    """Per-process pools of YoutubeDL instances keyed by format and output template."""
+
+    def __init__(self, pool_size: int = POOL_SIZE) -> None:
+        self.pool_size = pool_size
+        self._lock = threading.Lock()
+        self._idle: Dict[Tuple[str, str], Deque[_Slot]] = {}
+        self.created = 0
+        self.active = 0
+
+    def _acquire(self, fmt: str, outtmpl: str) -> _Slot:
+        if yt_dlp is None:
+            raise YtDlpError("yt-dlp not installed", kind="not_installed")
+        key = (fmt, outtmpl)
+        with self._lock:
+            idle = self._idle.setdefault(key, deque())
+            if idle:
+                return idle.pop()
+            self.created += 1
+        return _Slot(dict(BASE_PARAMS, format=fmt, outtmpl=outtmpl))
+
+    def _release(self, fmt: str, outtmpl: str, slot: _Slot) -> None:
+        slot.release()
+        with self._lock:
+            idle = self._idle.setdefault((fmt, outtmpl), deque())
+            if len(idle) < self.pool_size:
+                idle.append(slot)
+
+    def warm(self, extractors: Iterable[str], fmt: str = "best", outtmpl: str = "%(id)s.%(ext)s") -> None:
+        """Instantiate *extractors* (e.g. "TikTok") ahead of the first request."""
+        slot = self._acquire(fmt, outtmpl)
+        try:
+            for name in extractors:
+                try:
+                    slot.ydl.get_info_extractor(name)
+                except Exception as e:
+                    print(f"[yt-dlp] 추출기 미리 로드 실패 {name}: {e}")
+        finally:
+            self._release(fmt, outtmpl, slot)
+
+    def _run(self, url: str, fmt: str, outtmpl: str, download: bool, home: Optional[str],
+             progress: Optional[ProgressCallback], timeout: Optional[float], info: Optional[Dict] = None) -> Dict:
+        slot = self._acquire(fmt, outtmpl)
+        slot.checkout(home, progress)
+        reusable = True
+        with self._lock:
+            self.active += 1
+        try:
+            report_progress(progress, "resolve")
+            result = self._extract(slot, url, download, timeout, info)
+            if not result:
+                raise YtDlpError("yt-dlp returned no result", kind="unavailable")
+            return slot.ydl.sanitize_info(result)
+        except YtDlpError:
+            reusable = False
+            raise
+        except DownloadError as e:
+            message = str(e) or slot.logger.last_error
+            raise YtDlpError(message, kind=classify_error(message)) from e
+        finally:
+            with self._lock:
+                self.active -= 1
+            if reusable:
+                self._release(fmt, outtmpl, slot)
+
+    @staticmethod
+    def _extract(slot: _Slot, url: str, download: bool, timeout: Optional[float],
+                 info: Optional[Dict] = None) -> Optional[Dict]:
+        """
+        ``extract_info`` on *slot* (or, given an extracted *info*, download
+        from it), bounded by *timeout* seconds when given.
+        """
+        def run() -> Optional[Dict]:
+            # 훅이 연 스팬은 같은 스레드(컨텍스트)에서 닫아야 한다
+            try:
+                if info is not None:
+                    # yt-dlp가 info를 수정하므로 복사본으로 처리
+                    result = slot.ydl.process_ie_result(copy.deepcopy(info), download=True)
+                else:
+                    result = slot.ydl.extract_info(url, download=download)
+            except BaseException as e:
+                slot.close_stages(error=type(e).__name__)
+                raise
+            slot.close_stages()
+            return result
+
+        if not timeout:
+            return run()
+
+        outcome: Dict = {}
+        finished = threading.Event()
+
+        def work() -> None:
+            try:
+                outcome["info"] = run()
+            except BaseException as e:
+                outcome["error"] = e
+            finally:
+                finished.set()
+
+        threading.Thread(target=Tracing.wrap(work), name="ytdlp-run", daemon=True).start()
+        if not finished.wait(timeout):
+            slot.abandoned.set()
+            raise YtDlpError(f"yt-dlp timed out after {timeout:g}s", kind="timeout")
+        if "error" in outcome:
+            raise outcome["error"]
+        return outcome.get("info")
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            idle = sum(len(d) for d in self._idle.values())
+            return {"created": self.created, "active": self.active, "idle": idle}
+
+    def download(self, url: str, output_dir: str, outtmpl: str, fmt: str = "best",
+                 progress: Optional[ProgressCallback] = None, timeout: Optional[float] = 300) -> str:
+        """Download *url* into *output_dir* using *outtmpl* and return the file path."""
+        return self._download(url, None, output_dir, outtmpl, fmt, progress, timeout)
+
+    def download_info(self, info: Dict, output_dir: str, outtmpl: str, fmt: str = "best",
+                      progress: Optional[ProgressCallback] = None, timeout: Optional[float] = 300) -> str:
+        """Download the media described by *info* (from ``extract_info``) and return the file path."""
+        return self._download(info.get("webpage_url") or "", info, output_dir, outtmpl, fmt, progress, timeout)
+
+    def _download(self, url: str, extracted: Optional[Dict], output_dir: str, outtmpl: str, fmt: str,
+                  progress: Optional[ProgressCallback], timeout: Optional[float]) -> str:
+        os.makedirs(output_dir, exist_ok=True)
+        with Tracing.span("ytdlp.download") as sp:
+            try:
+                info = self._run(url, fmt, outtmpl, True, output_dir, progress, timeout, extracted)
+            except YtDlpError as e:
+                sp.set(kind=e.kind)
+                raise
+            sp.set(extractor=info.get("extractor_key"))
+            paths = [item.get("filepath") or item.get("_filename") for item in info.get("requested_downloads") or []]
+            paths.append(info.get("filepath") or info.get("_filename"))
+            for path in paths:
+                if path and os.path.exists(path):
+                    # 전송 바이트는 하위 ytdlp.transfer 스팬에 기록된다
+                    sp.set(size=os.path.getsize(path))
+                    return os.path.abspath(path)
+            raise YtDlpError("yt-dlp finished but the file was not found", kind="unknown")
+
+    def extract_info(self, url: str, fmt: str = "best", timeout: Optional[float] = 60) -> Dict:
+        """Resolve *url* without downloading and return the sanitized info dict."""
+        with Tracing.span("ytdlp.extract") as sp:
+            try:
+                info = self._run(url, fmt, "%(id)s.%(ext)s", False, None, None, timeout)
+            except YtDlpError as e:
+                sp.set(kind=e.kind)
+                raise
+            sp.set(extractor=info.get("extractor_key"))
+            return info
+
+
+_engine: Optional[YtDlpEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_engine() -> YtDlpEngine:
+    """Return this process's shared engine."""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = YtDlpEngine()
+    return _engine
+
+
+def direct_url(info: Dict[str, object]) -> Optional[Tuple[str, Dict[str, str]]]:
+    """
+    (direct_url, request_headers) of the format yt-dlp selected in *info*, or
+    None when it cannot be fetched as a single progressive file (separate
+    audio/video that need merging, HLS/DASH manifests).
+    """
+    protocol = str(info.get("protocol") or "")
+    if info.get("requested_formats") or not info.get("url") or not protocol.startswith("http"):
+        return None
+
+    headers = {k: v for k, v in (info.get("http_headers") or {}).items() if v}
+    if info.get("cookies"):
+        # yt-dlp는 Set-Cookie 형식 문자열을 준다 -> Cookie 헤더로 변환
+        try:
+            jar = SimpleCookie()
+            jar.load(info["cookies"])
+            headers["Cookie"] = "; ".join(f"{k}={m.value}" for k, m in jar.items())
+        except Exception as e:
+            print(f"[yt-dlp] 쿠키 변환 실패: {e}")
+    return info["url"], headers
+
+
+def resolve(url: str, fmt: str, outtmpl: str, label: str,
+            rename: Optional[Callable[[str, str], str]] = None) -> Extractors.Resolution:
+    """
+    Extract *url* once with yt-dlp and return its ``Extractors.Resolution``.
+
+    The target is the direct URL of the selected format, named like the file
+    download would be (None when the format needs merging or is a manifest).
+    The download runs yt-dlp on the extracted info with *outtmpl*, so merging
+    and manifests work without extracting again.  *rename(media_id, ext)*
+    gives the final file name when it is not *outtmpl*'s (engine instances
+    are pooled per template, so per-call names are applied afterwards).
+    Raises YtDlpError when yt-dlp cannot resolve the URL.
+    """
+    engine = get_engine()
+    try:
+        info = engine.extract_info(url, fmt, timeout=60)
+    except YtDlpError as e:
+        raise YtDlpError(f"{label} download failed: {str(e)[:200]}", kind=e.kind) from e
+
+    media_id = str(info.get("id") or "") or str(int(time.time()))
+    ext = str(info.get("ext") or "mp4")
+    filename = rename(media_id, ext) if rename else outtmpl % {"id": media_id, "ext": ext}
+
+    def download(output_dir: str, progress: Optional[ProgressCallback] = None) -> str:
+        os.makedirs(output_dir, exist_ok=True)
+        print(f"[{label}] Downloading: {url}")
+        try:
+            filepath = engine.download_info(info, output_dir, outtmpl, fmt=fmt, progress=progress, timeout=300)
+        except YtDlpError as e:
+            print(f"[{label}] Error ({e.kind}): {e}")
+            raise YtDlpError(f"{label} download failed: {str(e)[:200]}", kind=e.kind) from e
+        if rename:
+            final_path = os.path.join(output_dir, rename(media_id, os.path.splitext(filepath)[1].lstrip(".")))
+            os.replace(filepath, final_path)
+            filepath = final_path
+        print(f"[{label}] Downloaded: {filepath}")
+        return filepath
+
+    direct = direct_url(info)
+    if not direct:
+        print(f"[Stream] {label}: 병합이 필요한 포맷, 파일 다운로드 사용")
+        return Extractors.Resolution(None, download)
+    return Extractors.Resolution((direct[0], filename, direct[1]), download)
+
+
+__all__ = ["YtDlpEngine", "YtDlpError", "classify_error", "direct_url", "get_engine", "resolve", "POOL_SIZE"]
@@ -5,42 +5,55 @@ import json
 from datetime import datetime, timedelta
 import traceback
 import tempfile
+import shutil
 from urllib.parse import urlparse, urlunparse, unquote, urljoin, parse_qs
 from urllib.request import Request, urlopen, build_opener, HTTPRedirectHandler
 import html
 import secrets
-from typing import Dict, List, Optional, Tuple, Iterable
-from common import DriverConfig, Tool
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Tuple, Iterable, Union
+from common import DriverConfig, Extractors, HtmlScan, Tool, PartialDownload, Tracing
+from common.StrategyScheduler import StrategyScheduler
 from controller import VideoExtract
 
-RENDER_DATA_SCRIPT_JSON = re.compile(
-    r"<script[^>]*id=\"RENDER_DATA\"[^>]*type=\"application/json\"[^>]*>(.*?)</script>",
-    re.S | re.I,
-)
-RENDER_DATA_ASSIGNMENT = re.compile(r"RENDER_DATA\s*=\s*\"(.*?)\"\s*;", re.S | re.I)
+# <script id="RENDER_DATA" type="application/json"> 또는 RENDER_DATA = "..."; (먼저 끝나는 쪽)
+RENDER_DATA_BLOCKS = (HtmlScan.RENDER_DATA_SCRIPT, HtmlScan.RENDER_DATA_ASSIGNMENT)
 MODAL_ID_RE = re.compile(r"(?:^|[?&#])modal_id=(\d{6,})")
 
-def douyin_extract_from_html(html_text: str) -> Tuple[Optional[str], Dict[str, str]]:
-    meta = {}
-    m_title = re.search(r"<title>(.*?)</title>", html_text, re.S | re.I)
-    if m_title:
-        meta["title"] = html.unescape(m_title.group(1)).strip()
+# HLS 세그먼트 동시 다운로드 수 / 세그먼트별 재시도 횟수
+HLS_WORKERS = int(os.environ.get("HLS_SEGMENT_WORKERS", 4))
+HLS_SEGMENT_RETRIES = 2
 
-    print("[Douyin] HTML 길이:", len(html_text))
+def _scan_page(html_text: Union[str, HtmlScan.Page]) -> HtmlScan.Page:
+    """HTML 문자열 또는 이미 읽고 있는 페이지를 RENDER_DATA 기준으로 스캔"""
+    if isinstance(html_text, HtmlScan.Page):
+        return html_text
+    return HtmlScan.Page(html_text, RENDER_DATA_BLOCKS)
 
-    # 방법 1: RENDER_DATA JSON 스크립트
-    m = RENDER_DATA_SCRIPT_JSON.search(html_text)
-    data_json = None
-    if m:
-        payload = html.unescape(m.group(1))
+def _render_data_json(page: HtmlScan.Page) -> Optional[str]:
+    """RENDER_DATA 블록의 JSON 문자열 (URL 인코딩 해제)"""
+    if page.found == HtmlScan.RENDER_DATA_SCRIPT.name:
+        payload = html.unescape(page.data)
         try:
-            data_json = unquote(payload)
+            return unquote(payload)
         except Exception:
-            data_json = payload
-    else:
-        m2 = RENDER_DATA_ASSIGNMENT.search(html_text)
-        if m2:
-            data_json = unquote(m2.group(1))
+            return payload
+    if page.found == HtmlScan.RENDER_DATA_ASSIGNMENT.name:
+        return unquote(page.data)
+    return None
+
+def douyin_extract_from_html(html_text: Union[str, HtmlScan.Page]) -> Tuple[Optional[str], Dict[str, str]]:
+    page = _scan_page(html_text)
+    meta = {}
+    if page.title is not None:
+        meta["title"] = html.unescape(page.title).strip()
+
+    print("[Douyin] HTML 읽은 바이트:", page.consumed if page.consumed else len(page.text))
+
+    # 방법 1: RENDER_DATA JSON 스크립트
+    data_json = _render_data_json(page)
 
     if data_json:
         print("[Douyin] RENDER_DATA 찾음, 길이:", len(data_json))
@@ -49,7 +62,7 @@ def douyin_extract_from_html(html_text: str) -> Tuple[Optional[str], Dict[str, s
             urls = VideoExtract._json_walk_urls(data)
             candidates = [u for u in urls if "douyin" in u or "aweme" in u]
             print(f"[Douyin] JSON에서 {len(candidates)}개 후보 URL 찾음")
-            best = VideoExtract.pick_best_url(candidates, platform="douyin")
+            best = Tool.pick_best_url(candidates, platform="douyin")
             if best:
                 best = best.replace("playwm", "play")
                 print(f"[Douyin] JSON에서 최적 URL 선택: {best[:100]}...")
@@ -57,7 +70,8 @@ def douyin_extract_from_html(html_text: str) -> Tuple[Optional[str], Dict[str, s
         except Exception as e:
             print(f"[Douyin] JSON 파싱 오류: {str(e)}")
 
-    # 방법 2: 비디오 ID 추출 후 API URL 생성
+    # 방법 2: 비디오 ID 추출 후 API URL 생성 (여기부터는 페이지 전체가 필요)
+    html_text = page.text
     video_ids = VideoExtract.extract_video_ids(html_text)
     print(f"[Douyin] 추출된 비디오 ID: {video_ids}")
     
@@ -91,43 +105,137 @@ def douyin_extract_from_html(html_text: str) -> Tuple[Optional[str], Dict[str, s
     print("[Douyin] 모든 추출 방법 실패")
     return None, meta
 
-def try_douyin_api_methods(item_id: str) -> List[str]:
-    """다양한 Douyin API 엔드포인트 시도"""
+# (이름, URL 템플릿) - 성공률 순으로 재정렬되어 동시에 요청된다
+DOUYIN_API_ENDPOINTS = (
+    ("iteminfo", "https://www.iesdouyin.com/web/api/v2/aweme/iteminfo/?item_ids={item_id}"),
+    ("aweme_detail", "https://www.douyin.com/aweme/v1/web/aweme/detail/?aweme_id={item_id}"),
+    ("play_1080p", "https://www.iesdouyin.com/aweme/v1/play/?video_id={item_id}&ratio=1080p&line=0&is_play_url=1&source=Web"),
+    ("play_720p", "https://www.iesdouyin.com/aweme/v1/play/?video_id={item_id}&ratio=720p&line=0&is_play_url=1&source=Web"),
+)
+API_RACE_WORKERS = int(os.environ.get("DOUYIN_API_WORKERS", 4))
+API_RACE_TIMEOUT = float(os.environ.get("DOUYIN_API_TIMEOUT", 15))
+# 직접 비디오 응답으로 인정할 최소 크기 (이보다 작으면 오류/캡차 페이지로 본다)
+MIN_API_VIDEO_BYTES = 200_000
+
+
+# 엔드포인트별 최근 성공률/지연 시간 (다음 요청의 시도 순서 결정에 사용)
+endpoint_stats = StrategyScheduler("douyin_api", (name for name, _ in DOUYIN_API_ENDPOINTS))
+
+
+def _query_douyin_endpoint(api_url: str, cancelled: threading.Event) -> Optional[List[str]]:
+    """API 엔드포인트 하나를 조회해 재생 URL 목록을 반환 (취소되면 None)"""
+    if cancelled.is_set():
+        return None
+    print(f"[API] 시도 중: {api_url}")
+    headers = DriverConfig.get_random_headers(mobile=True)
+    headers["Referer"] = "https://www.douyin.com/"
+
     api_urls = []
-    
-    # 다양한 API 엔드포인트
-    endpoints = [
-        f"https://www.iesdouyin.com/web/api/v2/aweme/iteminfo/?item_ids={item_id}",
-        f"https://www.douyin.com/aweme/v1/web/aweme/detail/?aweme_id={item_id}",
-        f"https://www.iesdouyin.com/aweme/v1/play/?video_id={item_id}&ratio=1080p&line=0&is_play_url=1&source=Web",
-        f"https://www.iesdouyin.com/aweme/v1/play/?video_id={item_id}&ratio=720p&line=0&is_play_url=1&source=Web",
-    ]
-    
-    for api_url in endpoints:
-        try:
-            print(f"[API] 시도 중: {api_url}")
-            headers = DriverConfig.get_random_headers(mobile=True)
-            headers["Referer"] = "https://www.douyin.com/"
-            
-            with DriverConfig.http_open(api_url, headers=headers) as resp:
-                if "application/json" in resp.headers.get("Content-Type", ""):
-                    data = json.loads(resp.read().decode("utf-8", errors="ignore"))
-                    
-                    # API 응답에서 URL 추출
-                    urls = VideoExtract._json_walk_urls(data)
-                    for url in urls:
-                        if "play" in url or ".mp4" in url:
-                            api_urls.append(url)
-                else:
-                    # 직접 비디오 파일인 경우
-                    api_urls.append(api_url)
-                    
-        except Exception as e:
-            print(f"[API] {api_url} 실패: {str(e)}")
-            continue
-    
+    with Tracing.span("douyin.api_probe", endpoint=urlparse(api_url).path), \
+            DriverConfig.http_open(api_url, headers=headers, timeout=API_RACE_TIMEOUT) as resp:
+        ctype = resp.headers.get("Content-Type", "").lower()
+        if "application/json" in ctype:
+            if cancelled.is_set():
+                return None
+            data = json.loads(resp.read().decode("utf-8", errors="ignore"))
+
+            # API 응답에서 URL 추출
+            urls = VideoExtract._json_walk_urls(data)
+            for url in urls:
+                if "play" in url or ".mp4" in url:
+                    api_urls.append(url)
+        elif ctype.startswith(("video/", "application/octet-stream")):
+            # 직접 비디오 파일인 경우 (본문은 읽지 않고 닫는다)
+            try:
+                size = int(resp.headers.get("Content-Length") or 0)
+            except ValueError:
+                size = 0
+            if size >= MIN_API_VIDEO_BYTES:
+                api_urls.append(api_url)
+            else:
+                print(f"[API] 비디오 응답이 너무 작음 ({size} bytes): {api_url}")
+        else:
+            # HTML 오류/캡차 페이지 등은 실패로 기록된다 (빈 목록)
+            print(f"[API] 비디오가 아닌 응답 ({ctype or 'unknown'}): {api_url}")
     return api_urls
 
+
+def _run_endpoint(name: str, api_url: str, cancelled: threading.Event,
+                  started: Dict[str, float]) -> Optional[List[str]]:
+    """_query_douyin_endpoint + 통계 기록 (시간은 실제로 실행을 시작한 시점부터 잰다)"""
+    begin = started[api_url] = time.monotonic()
+    try:
+        result = _query_douyin_endpoint(api_url, cancelled)
+    except Exception as e:
+        # 패자 요청도 끝나는 대로 기록해야 죽은 엔드포인트가 뒤로 밀린다
+        print(f"[API] {api_url} 실패: {str(e)}")
+        endpoint_stats.record(name, False, time.monotonic() - begin)
+        raise
+    if result is not None:
+        # 재생 URL을 돌려주지 못한 응답(빈 목록)은 실패로 센다
+        endpoint_stats.record(name, bool(result), time.monotonic() - begin)
+    return result
+
+
+def race_douyin_api(item_ids: Iterable[str]) -> List[str]:
+    """
+    모든 (ID, 엔드포인트) 조합을 동시에 요청하고 처음으로 URL을 돌려준 응답을 사용한다.
+    나머지 요청은 취소되며, 결과는 엔드포인트별 성공률에 기록된다.
+
+    경주마다 자기 워커(최대 DOUYIN_API_WORKERS개)를 쓰므로 다른 요청의 경주 뒤에서
+    기다리지 않고, 제한 시간도 각 요청이 실제로 시작된 시점부터 계산한다.
+    """
+    item_ids = list(dict.fromkeys(i for i in item_ids if i))
+    templates = dict(DOUYIN_API_ENDPOINTS)
+    jobs = [(name, templates[name].format(item_id=item_id))
+            for name in endpoint_stats.order() for item_id in item_ids]
+    if not jobs:
+        return []
+
+    cancelled = threading.Event()
+    started: Dict[str, float] = {}
+    pool = ThreadPoolExecutor(max_workers=min(len(jobs), API_RACE_WORKERS), thread_name_prefix="douyin-api")
+    futures = {
+        pool.submit(Tracing.wrap(_run_endpoint), name, api_url, cancelled, started): (name, api_url)
+        for name, api_url in jobs
+    }
+
+    winner: List[str] = []
+    pending = set(futures)
+    try:
+        while pending and not winner:
+            done, pending = wait(pending, timeout=API_RACE_TIMEOUT, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None and future.result() and not winner:
+                    winner = future.result()
+                    print(f"[API] {futures[future][0]} 응답 사용: {len(winner)}개 URL")
+            if done or winner:
+                continue
+            # 아직 시작 전이거나 시작한 지 제한 시간이 안 된 요청이 있으면 계속 기다린다
+            now = time.monotonic()
+            if all(now - started.get(futures[f][1], now) > API_RACE_TIMEOUT * 2 for f in pending):
+                print(f"[API] 시간 초과, 응답 없는 요청 {len(pending)}개 포기")
+                break
+    finally:
+        # 패자 요청: 아직 시작하지 않은 것은 취소, 진행 중인 것은 본문을 읽지 않고 종료
+        cancelled.set()
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=False)
+    return winner
+
+
+def try_douyin_api_methods(item_id: str) -> List[str]:
+    """다양한 Douyin API 엔드포인트 시도 (동시 요청, 가장 먼저 성공한 응답 사용)"""
+    return race_douyin_api([item_id])
+
+
+# fetch_douyin_video의 추출 단계별 통계 (패턴 URL 생성은 항상 마지막 수단)
+douyin_stages = StrategyScheduler("douyin_stages", ("html", "api", "alt_headers"))
+# _fetch_douyin_video (다운로드 경로)의 추출 단계별 통계
+douyin_resolve_stages = StrategyScheduler("douyin_resolve", ("html", "api"))
+
+
 def fetch_douyin_video(url: str) -> Tuple[Optional[str], Dict[str, str]]:
     print(f"[Douyin] 다운로드 시작: {url}")
     
@@ -157,61 +265,83 @@ def fetch_douyin_video(url: str) -> Tuple[Optional[str], Dict[str, str]]:
         
         print(f"[Douyin] URL에서 추출된 ID: {url_video_ids}")
         
-        # 2단계: HTML 페이지 가져오기
-        print("[Douyin] 2단계: HTML 페이지 가져오기")
-        try:
-            with DriverConfig.http_open(final_url, headers=base_headers) as resp:
-                html_text = resp.read().decode("utf-8", errors="ignore")
-            print(f"[Douyin] HTML 크기: {len(html_text)} 바이트")
-        except Exception as e:
-            print(f"[Douyin] HTML 가져오기 실패: {str(e)}")
-            html_text = ""
-        
-        # 3단계: HTML에서 URL 추출
-        print("[Douyin] 3단계: HTML에서 URL 추출")
-        if html_text:
-            direct_url, html_meta = douyin_extract_from_html(html_text)
-            meta.update(html_meta)
-            
-            if direct_url:
-                print(f"[Douyin] HTML에서 URL 추출 성공: {direct_url[:100]}...")
-                return direct_url, meta
-        
-        # 4단계: API 방법들 시도
-        print("[Douyin] 4단계: API 방법들 시도")
-        all_ids = url_video_ids + [meta.get("video_id", "")]
-        all_ids = [vid for vid in all_ids if vid and len(vid) >= 8]
-        
-        for video_id in all_ids:
-            print(f"[Douyin] API 시도 - 비디오 ID: {video_id}")
-            api_urls = try_douyin_api_methods(video_id)
+        def html_stage() -> Optional[Tuple[str, Dict[str, str]]]:
+            # 2단계: HTML 페이지 가져오기
+            print("[Douyin] 2단계: HTML 페이지 가져오기")
+            try:
+                # RENDER_DATA 스크립트가 끝나면 읽기를 멈춘다 (나머지는 대체 추출에 필요할 때만)
+                page = HtmlScan.Page(DriverConfig.http_open(final_url, headers=base_headers), RENDER_DATA_BLOCKS)
+                print(f"[Douyin] HTML {page.consumed} 바이트 읽음")
+            except Exception as e:
+                print(f"[Douyin] HTML 가져오기 실패: {str(e)}")
+                return None
             
-            if api_urls:
-                best_api_url = Tool.pick_best_url(api_urls, platform="douyin")
-                if best_api_url:
-                    print(f"[Douyin] API에서 최적 URL 선택: {best_api_url[:100]}...")
-                    return best_api_url, meta
-        
-        # 5단계: 대체 헤더로 재시도
-        print("[Douyin] 5단계: 대체 헤더로 재시도")
-        alt_headers = DriverConfig.get_random_headers(mobile=False)
-        alt_headers.update({
-            "Referer": "https://www.douyin.com/",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-        })
+            # 3단계: HTML에서 URL 추출
+            print("[Douyin] 3단계: HTML에서 URL 추출")
+            with page:
+                if page.consumed:
+                    direct_url, html_meta = douyin_extract_from_html(page)
+                    meta.update(html_meta)
+                    
+                    if direct_url:
+                        print(f"[Douyin] HTML에서 URL 추출 성공: {direct_url[:100]}...")
+                        return direct_url, meta
+            return None
         
-        try:
-            with DriverConfig.http_open(final_url, headers=alt_headers) as resp:
-                alt_html = resp.read().decode("utf-8", errors="ignore")
+        def api_stage() -> Optional[Tuple[str, Dict[str, str]]]:
+            # 4단계: API 방법들 시도
+            print("[Douyin] 4단계: API 방법들 시도")
+            all_ids = url_video_ids + [meta.get("video_id", "")]
+            all_ids = [vid for vid in all_ids if vid and len(vid) >= 8]
             
-            alt_direct, alt_meta = douyin_extract_from_html(alt_html)
-            if alt_direct:
-                print(f"[Douyin] 대체 헤더로 성공: {alt_direct[:100]}...")
-                return alt_direct, {**meta, **alt_meta}
+            if all_ids:
+                print(f"[Douyin] API 시도 - 비디오 ID: {all_ids}")
+                api_urls = race_douyin_api(all_ids)
                 
-        except Exception as e:
-            print(f"[Douyin] 대체 헤더 시도 실패: {str(e)}")
+                if api_urls:
+                    best_api_url = Tool.pick_best_url(api_urls, platform="douyin")
+                    if best_api_url:
+                        print(f"[Douyin] API에서 최적 URL 선택: {best_api_url[:100]}...")
+                        return best_api_url, meta
+            return None
+        
+        def alt_headers_stage() -> Optional[Tuple[str, Dict[str, str]]]:
+            # 5단계: 대체 헤더로 재시도
+            print("[Douyin] 5단계: 대체 헤더로 재시도")
+            alt_headers = DriverConfig.get_random_headers(mobile=False)
+            alt_headers.update({
+                "Referer": "https://www.douyin.com/",
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
+            })
+            
+            try:
+                with HtmlScan.Page(DriverConfig.http_open(final_url, headers=alt_headers),
+                                   RENDER_DATA_BLOCKS) as alt_page:
+                    alt_direct, alt_meta = douyin_extract_from_html(alt_page)
+                if alt_direct:
+                    print(f"[Douyin] 대체 헤더로 성공: {alt_direct[:100]}...")
+                    return alt_direct, {**meta, **alt_meta}
+                    
+            except Exception as e:
+                print(f"[Douyin] 대체 헤더 시도 실패: {str(e)}")
+            return None
+        
+        # 최근 성공률/지연 시간 순으로 단계 실행 (계속 실패하는 단계는 가끔만 시도)
+        stages = {"html": html_stage, "api": api_stage, "alt_headers": alt_headers_stage}
+        order = douyin_stages.order()
+        print(f"[Douyin] 단계 순서: {order}")
+        for name in order:
+            started = time.monotonic()
+            try:
+                with Tracing.span(f"douyin.{name}"):
+                    found = stages[name]()
+            except Exception as e:
+                print(f"[Douyin] {name} 단계 오류: {str(e)}")
+                found = None
+            douyin_stages.record(name, found is not None, time.monotonic() - started)
+            if found:
+                return found
         
         # 6단계: 마지막 수단 - 일반적인 패턴으로 URL 생성
         print("[Douyin] 6단계: 패턴 기반 URL 생성")
@@ -236,51 +366,80 @@ def fetch_douyin_video(url: str) -> Tuple[Optional[str], Dict[str, str]]:
     return None, meta
 
 
-def download_tiktok_douyin_video(url: str) -> str:
-        """두 번째 파일의 다운로드 로직 100% 적용"""
+def download_tiktok_douyin_video(url: str, progress: Optional[Tool.ProgressCallback] = None,
+                                 output_dir: Optional[str] = None) -> str:
+        """두 번째 파일의 다운로드 로직 100% 적용 (output_dir이 없으면 임시 디렉터리에 저장)"""
         try:
             print(f"\n[다운로드] {url}")
-            
-            url = normalize_douyin_modal_url(url)
+            Tool.report_progress(progress, "resolve")
+            resolution = resolve_tiktok_douyin(url)
+        except Exception as e:
+            print(f"[다운로드 오류] {str(e)}")
+            raise Exception(f"TikTok/Douyin 다운로드 실패: {str(e)}")
+        return resolution.download(output_dir, progress)
 
-            temp_dir = tempfile.mkdtemp(prefix="tiktok_douyin_")
-            
-            # 품질 설정 (UI에서 선택 가능하게 할 수도 있음)
-            target_height = None  # None = best quality
-            prefer_small = False
-            
-            # 1. 플랫폼 감지 (두 번째 파일 로직 그대로)
-            platform = detect_platform(url)
-            print(f"[다운로드] 플랫폼: {platform}")
-            
-            # 2. 비디오 정보 추출 (두 번째 파일 로직 그대로)
+def resolve_tiktok_douyin(url: str) -> Extractors.Resolution:
+        """
+        게시물을 한 번만 분석해 직접 미디어 URL(스트리밍 프록시용)과 다운로드 함수를 반환
+        HLS는 세그먼트를 이어 붙여야 하므로 target 없이 다운로드 함수만 제공
+        """
+        url = normalize_douyin_modal_url(url)
+        
+        # 품질 설정 (UI에서 선택 가능하게 할 수도 있음)
+        target_height = None  # None = best quality
+        prefer_small = False
+        
+        # 1. 플랫폼 감지 (두 번째 파일 로직 그대로)
+        platform = detect_platform(url)
+        print(f"[다운로드] 플랫폼: {platform}")
+        
+        # 2. 비디오 정보 추출 (두 번째 파일 로직 그대로)
+        with Tracing.span(f"{platform}.resolve"):
             if platform == "tiktok":
                 direct_url, meta = _fetch_tiktok_video(url)
                 referer = "https://www.tiktok.com/"
             else:  # douyin
                 direct_url, meta = _fetch_douyin_video(url, target_height, prefer_small)
                 referer = "https://www.douyin.com/"
-            
-            if not direct_url:
-                raise RuntimeError("비디오 URL을 추출할 수 없습니다")
-            
-            # 3. 파일명 생성 (두 번째 파일 로직 그대로)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = _decide_filename(platform, meta, timestamp)
+        
+        if not direct_url:
+            raise RuntimeError("비디오 URL을 추출할 수 없습니다")
+        
+        # 3. 파일명 생성 (두 번째 파일 로직 그대로)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = _decide_filename(platform, meta, timestamp)
+
+        def download(output_dir: Optional[str], progress: Optional[Tool.ProgressCallback] = None) -> str:
+            return _download_resolved(direct_url, filename, referer, platform, output_dir,
+                                      target_height, prefer_small, progress)
+
+        if _is_m3u8_like(direct_url):
+            return Extractors.Resolution(None, download)
+        return Extractors.Resolution((direct_url, filename, _media_headers(platform, referer)), download)
+
+def _download_resolved(direct_url: str, filename: str, referer: str, platform: str,
+                       output_dir: Optional[str], target_height: Optional[int] = None,
+                       prefer_small: bool = False, progress: Optional[Tool.ProgressCallback] = None) -> str:
+        """추출한 URL을 output_dir(없으면 임시 디렉터리)에 다운로드 (HLS 포함)"""
+        try:
+            temp_dir = output_dir or tempfile.mkdtemp(prefix="tiktok_douyin_")
+            os.makedirs(temp_dir, exist_ok=True)
             local_path = os.path.join(temp_dir, filename)
             
             print(f"[다운로드] 저장 위치: {local_path}")
             print(f"[다운로드] 비디오 URL: {direct_url[:100]}...")
             
             # 4. 다운로드 실행 (두 번째 파일 로직 그대로)
-            _download_file(
-                direct_url, 
-                local_path, 
-                referer=referer,
-                platform=platform,
-                target_height=target_height,
-                prefer_small=prefer_small
-            )
+            with Tracing.span(f"{platform}.download", hls=_is_m3u8_like(direct_url)):
+                _download_file(
+                    direct_url, 
+                    local_path, 
+                    referer=referer,
+                    platform=platform,
+                    target_height=target_height,
+                    prefer_small=prefer_small,
+                    progress=progress
+                )
             
             # 파일 확인
             if not os.path.exists(local_path) or os.path.getsize(local_path) < 1024:
@@ -300,13 +459,12 @@ def download_tiktok_douyin_video(url: str) -> str:
             raise Exception(f"TikTok/Douyin 다운로드 실패: {str(e)}")
         
 def detect_platform(url: str) -> str:
-        """URL에서 플랫폼 감지"""
+        """URL에서 플랫폼 감지 (등록된 호스트 우선, 없으면 호스트 이름으로 추정)"""
+        platform = Extractors.detect_platform(url)
+        if platform in ("tiktok", "douyin"):
+            return platform
         host = urlparse(url).netloc.lower()
-        if any(host.endswith(d) for d in ("tiktok.com", "v.tiktok.com", "m.tiktok.com", "www.tiktok.com")):
-            return "tiktok"
-        elif any(host.endswith(d) for d in ("douyin.com", "v.douyin.com", "www.iesdouyin.com", "www.douyin.com")):
-            return "douyin"
-        elif "tiktok" in host:
+        if "tiktok" in host:
             return "tiktok"
         elif "douyin" in host:
             return "douyin"
@@ -318,24 +476,25 @@ def _fetch_tiktok_video (url: str) -> Tuple[Optional[str], Dict[str, str]]:
         # 리다이렉트 해결
         final = DriverConfig._resolve_redirect(url, headers={"Referer": "https://www.tiktok.com/"})
         
-        # HTML 가져오기
-        with DriverConfig._http_open(final, headers={"Referer": "https://www.tiktok.com/"}) as resp:
-            html_text = resp.read().decode("utf-8", errors="ignore")
+        # HTML 가져오기 (SIGI_STATE 스크립트가 끝나면 읽기 중단)
+        with Tracing.span("tiktok.html") as sp:
+            page = HtmlScan.Page(DriverConfig._http_open(final, headers={"Referer": "https://www.tiktok.com/"}),
+                                 [HtmlScan.SIGI_STATE])
+            sp.add_bytes(page.consumed)
         
-        return _tiktok_extract_from_html(html_text)
+        with page, Tracing.span("tiktok.parse"):
+            return _tiktok_extract_from_html(page)
     
-def _tiktok_extract_from_html(html_text: str) -> Tuple[Optional[str], Dict[str, str]]:
+def _tiktok_extract_from_html(html_text: Union[str, HtmlScan.Page]) -> Tuple[Optional[str], Dict[str, str]]:
+    page = html_text if isinstance(html_text, HtmlScan.Page) else HtmlScan.Page(html_text, [HtmlScan.SIGI_STATE])
     meta = {}
-    m_title = re.search(r"<title>(.*?)</title>", html_text, re.S | re.I)
-    if m_title:
-        meta["title"] = html.unescape(m_title.group(1)).strip()
+    if page.title is not None:
+        meta["title"] = html.unescape(page.title).strip()
 
     # 1) SIGI_STATE JSON 우선
-    SIGI_RE = re.compile(r"<script id=\"SIGI_STATE\"[^>]*>(.*?)</script>", re.S)
-    m = SIGI_RE.search(html_text)
-    if m:
+    if page.found == HtmlScan.SIGI_STATE.name:
         try:
-            data = json.loads(m.group(1))
+            data = json.loads(page.data)
             item_mod = data.get("ItemModule") or {}
             item = None
             if isinstance(item_mod, dict) and item_mod:
@@ -383,6 +542,7 @@ def _tiktok_extract_from_html(html_text: str) -> Tuple[Optional[str], Dict[str,
             pass
 
     # 2) <video> 태그 src 탐색 (SSR 케이스 보완)
+    html_text = page.text
     vid_srcs = re.findall(r"<video[^>]+src=[\"']([^\"']+)[\"']", html_text, re.I)
     vid_srcs = _filter_videoish_urls(vid_srcs)
     if vid_srcs:
@@ -426,121 +586,134 @@ def _fetch_douyin_video( url: str, target_height: Optional[int] = None,
         # 리다이렉트 해결
         final = DriverConfig._resolve_redirect(url, headers=base_headers)
         
-        # HTML 파싱 시도
         meta = {}
-        html_text = ""
-        try:
-            with DriverConfig._http_open(final, headers=base_headers) as resp:
-                html_text = resp.read().decode("utf-8", errors="ignore")
-        except Exception as e :
-            print (e)
-            pass
-        
-        try:
-            from urllib.parse import urlparse, urljoin
-            p = urlparse(final)
-            if "/search" in p.path or "type=general" in final:
-                ids = re.findall(r'href=[\'"]/(?:video)/(\d+)[\'"]', html_text) \
-                    + re.findall(r'https?://www\.douyin\.com/video/(\d+)', html_text)
-
-                if ids:
-                    video_page = f"https://www.douyin.com/video/{ids[0]}"
-                    with DriverConfig._http_open(video_page, headers=base_headers) as resp2:
-                        html_text = resp2.read().decode("utf-8", errors="ignore")
-                    final = video_page
-                else:
-                    raise RuntimeError("검색 결과에서 동영상 링크를 찾을 수 없습니다. 개별 동영상 URL을 주세요.")
-        except Exception as e:
-            print (e)
-            pass
-
-        direct, meta = _douyin_extract_from_html(html_text, target_height, prefer_small)
-        if direct:
-            return direct, meta
+        page = {"final": final, "html": None}
         
-        # 비디오 ID 추출
-        item_id = _extract_douyin_id_from_url(final)
-        
-        if not item_id:
-            m = re.search(r'(?:aweme_id|itemId|item_id)\D(\d{8,22})', html_text)
-            if m:
-                item_id = m.group(1)
-                
-        # API 시도
-        if item_id:
+        def load_html() -> HtmlScan.Page:
+            # HTML은 필요한 단계에서 한 번만, RENDER_DATA 스크립트가 끝날 때까지만 읽는다
+            if page["html"] is not None:
+                return page["html"]
+            html_page = HtmlScan.Page("")
             try:
-                api_url = f"https://www.iesdouyin.com/web/api/v2/aweme/iteminfo/?item_ids={item_id}"
-                with DriverConfig._http_open(api_url, headers={"Referer": "https://www.iesdouyin.com/"}) as r:
-                    data = json.loads(r.read().decode("utf-8", errors="ignore"))
-                
-                item = (data.get("item_list") or [None])[0] or {}
-                author = item.get("author") or {}
-                video = item.get("video") or {}
-                
-                meta.update({
-                    "author": author.get("nickname") or author.get("short_id") or "",
-                    "desc": item.get("desc") or "",
-                    "id": item.get("aweme_id") or item_id,
-                })
-                
-                urls = (video.get("play_addr") or {}).get("url_list") or []
-                
-                if not urls:
-                    uri = (video.get("play_addr") or {}).get("uri") or video.get("vid")
-                    if uri:
-                        ratio = _quality_to_ratio(target_height)
-                        line = '1' if prefer_small else '0'
-                        urls = [
-                            f"https://www.iesdouyin.com/aweme/v1/play/?video_id={uri}&ratio={ratio}&line={line}&is_play_url=1&source=Web"
-                        ]
-                
-                direct = Tool.pick_best_url(urls, platform="douyin")
-                if direct:
-                    direct = direct.replace("playwm", "play")
-                    if "aweme/v1/play" in direct or "ratio=" in direct:
-                        direct = _rewrite_ratio_in_url(direct, target_height, prefer_small)
-                    return direct, meta
+                with Tracing.span("douyin.page") as sp:
+                    html_page = HtmlScan.Page(DriverConfig._http_open(page["final"], headers=base_headers),
+                                              RENDER_DATA_BLOCKS)
+                    sp.add_bytes(html_page.consumed)
+            except Exception as e :
+                print (e)
+                pass
+            
+            try:
+                from urllib.parse import urlparse, urljoin
+                p = urlparse(page["final"])
+                if "/search" in p.path or "type=general" in page["final"]:
+                    with html_page:
+                        html_text = html_page.text
+                    ids = re.findall(r'href=[\'"]/(?:video)/(\d+)[\'"]', html_text) \
+                        + re.findall(r'https?://www\.douyin\.com/video/(\d+)', html_text)
+
+                    if ids:
+                        video_page = f"https://www.douyin.com/video/{ids[0]}"
+                        html_page = HtmlScan.Page(DriverConfig._http_open(video_page, headers=base_headers),
+                                                  RENDER_DATA_BLOCKS)
+                        page["final"] = video_page
+                    else:
+                        raise RuntimeError("검색 결과에서 동영상 링크를 찾을 수 없습니다. 개별 동영상 URL을 주세요.")
             except Exception as e:
                 print (e)
                 pass
+            page["html"] = html_page
+            return html_page
+        
+        def html_stage() -> Optional[Tuple[str, Dict[str, str]]]:
+            html_page = load_html()
+            with Tracing.span("douyin.parse"):
+                direct, html_meta = _douyin_extract_from_html(html_page, target_height, prefer_small)
+            meta.update(html_meta)
+            return (direct, meta) if direct else None
+        
+        def api_stage() -> Optional[Tuple[str, Dict[str, str]]]:
+            # 비디오 ID 추출 (URL에 없을 때만 HTML 사용)
+            item_id = _extract_douyin_id_from_url(page["final"])
+            
+            if not item_id:
+                m = re.search(r'(?:aweme_id|itemId|item_id)\D(\d{8,22})', load_html().text)
+                if m:
+                    item_id = m.group(1)
+            
+            if not item_id:
+                return None
+            api_url = f"https://www.iesdouyin.com/web/api/v2/aweme/iteminfo/?item_ids={item_id}"
+            with DriverConfig._http_open(api_url, headers={"Referer": "https://www.iesdouyin.com/"}) as r:
+                data = json.loads(r.read().decode("utf-8", errors="ignore"))
+            
+            item = (data.get("item_list") or [None])[0] or {}
+            author = item.get("author") or {}
+            video = item.get("video") or {}
+            
+            meta.update({
+                "author": author.get("nickname") or author.get("short_id") or "",
+                "desc": item.get("desc") or "",
+                "id": item.get("aweme_id") or item_id,
+            })
+            
+            urls = (video.get("play_addr") or {}).get("url_list") or []
+            
+            if not urls:
+                uri = (video.get("play_addr") or {}).get("uri") or video.get("vid")
+                if uri:
+                    ratio = _quality_to_ratio(target_height)
+                    line = '1' if prefer_small else '0'
+                    urls = [
+                        f"https://www.iesdouyin.com/aweme/v1/play/?video_id={uri}&ratio={ratio}&line={line}&is_play_url=1&source=Web"
+                    ]
+            
+            direct = Tool.pick_best_url(urls, platform="douyin")
+            if not direct:
+                return None
+            direct = direct.replace("playwm", "play")
+            if "aweme/v1/play" in direct or "ratio=" in direct:
+                direct = _rewrite_ratio_in_url(direct, target_height, prefer_small)
+            return direct, meta
+        
+        # 최근에 성공한 방법부터 시도 (URL에 ID가 있으면 API가 HTML 요청 없이 끝날 수 있다)
+        stages = {"html": html_stage, "api": api_stage}
+        try:
+            for name in douyin_resolve_stages.order():
+                started = time.monotonic()
+                try:
+                    with Tracing.span(f"douyin.{name}"):
+                        found = stages[name]()
+                except Exception as e:
+                    print (e)
+                    found = None
+                douyin_resolve_stages.record(name, found is not None, time.monotonic() - started)
+                if found:
+                    return found
+        finally:
+            # 일찍 멈춘 페이지 응답 정리
+            if page["html"] is not None:
+                page["html"].close()
         
         return None, meta
     
-def _douyin_extract_from_html(html_text: str, target_height: Optional[int] = None, 
+def _douyin_extract_from_html(html_text: Union[str, HtmlScan.Page], target_height: Optional[int] = None, 
                                   prefer_small: bool = False) -> Tuple[Optional[str], Dict[str, str]]:
         """두 번째 파일의 douyin_extract_from_html 그대로"""
+        page = _scan_page(html_text)
         meta = {}
         
         # Title 추출
-        m_title = re.search(r"<title>(.*?)</title>", html_text, re.S | re.I)
-        if m_title:
-            meta["title"] = html.unescape(m_title.group(1)).strip()
+        if page.title is not None:
+            meta["title"] = html.unescape(page.title).strip()
         
         # RENDER_DATA 추출
-        RENDER_DATA_SCRIPT_JSON = re.compile(
-            r"<script[^>]*id=\"RENDER_DATA\"[^>]*type=\"application/json\"[^>]*>(.*?)</script>",
-            re.S | re.I,
-        )
-        RENDER_DATA_ASSIGNMENT = re.compile(r"RENDER_DATA\s*=\s*\"(.*?)\"\s*;", re.S | re.I)
-        
-        m = RENDER_DATA_SCRIPT_JSON.search(html_text)
-        data_json = None
-        
-        if m:
-            payload = html.unescape(m.group(1))
-            try:
-                data_json = unquote(payload)
-            except Exception:
-                data_json = payload
-        else:
-            m2 = RENDER_DATA_ASSIGNMENT.search(html_text)
-            if m2:
-                data_json = unquote(m2.group(1))
+        data_json = _render_data_json(page)
         
         if data_json:
             try:
                 data = json.loads(data_json)
-                urls = _json_walk_urls(data)
+                urls = VideoExtract._json_walk_urls(data)
                 candidates = [u for u in urls if "douyin" in u]
                 best = Tool.pick_best_url(candidates, platform="douyin")
                 if best:
@@ -551,7 +724,8 @@ def _douyin_extract_from_html(html_text: str, target_height: Optional[int] = Non
             except Exception:
                 pass
         
-        # video_id 추출 시도
+        # video_id 추출 시도 (여기부터는 페이지 전체가 필요)
+        html_text = page.text
         m_vid = re.search(r'"play_addr"\s*:\s*\{[^}]*"uri"\s*:\s*"([a-zA-Z0-9_\-]{8,})"', html_text)
         if not m_vid:
             m_vid = re.search(r'"vid"\s*:\s*"([a-zA-Z0-9_\-]{8,})"', html_text)
@@ -574,10 +748,8 @@ def _douyin_extract_from_html(html_text: str, target_height: Optional[int] = Non
             url_ = url_.replace("playwm", "play")
         return url_, meta
 
-def _download_file( url: str, dest_path: str, referer: str, platform: str = "",
-                      target_height: Optional[int] = None, prefer_small: bool = False) -> None:
-        """두 번째 파일의 download_file 그대로 (HLS 지원 포함)"""
-        # 헤더 설정
+def _media_headers(platform: str, referer: str) -> Dict[str, str]:
+        """미디어 파일 요청 헤더 (플랫폼별 UA + Referer)"""
         if platform == "douyin":
             MOBILE_HEADERS = {
                 "User-Agent": (
@@ -611,16 +783,24 @@ def _download_file( url: str, dest_path: str, referer: str, platform: str = "",
             "Connection": "keep-alive",
         })
         
+        return headers
+
+def _download_file( url: str, dest_path: str, referer: str, platform: str = "",
+                      target_height: Optional[int] = None, prefer_small: bool = False,
+                      progress: Optional[Tool.ProgressCallback] = None) -> None:
+        """두 번째 파일의 download_file 그대로 (HLS 지원 포함)"""
+        headers = _media_headers(platform, referer)
+        
         # HLS 체크
         if platform == "douyin" and _is_m3u8_like(url):
             ts_path = dest_path
             if ts_path.lower().endswith(".mp4"):
                 ts_path = dest_path[:-4] + ".ts"
-            _download_hls_m3u8(url, ts_path, headers, target_height, prefer_small)
+            _download_hls_m3u8(url, ts_path, headers, target_height, prefer_small, progress)
             return
         
         # 일반 다운로드 시도
-        size, ctype, total = _stream_download(url, dest_path, headers)
+        size, ctype, total = _stream_download(url, dest_path, headers, progress)
         
         if platform == "douyin" and _is_m3u8_like(url, ctype):
             try:
@@ -628,7 +808,7 @@ def _download_file( url: str, dest_path: str, referer: str, platform: str = "",
             except OSError:
                 pass
             ts_path = dest_path[:-4] + ".ts" if dest_path.lower().endswith(".mp4") else dest_path + ".ts"
-            _download_hls_m3u8(url, ts_path, headers, target_height, prefer_small)
+            _download_hls_m3u8(url, ts_path, headers, target_height, prefer_small, progress)
             return
         
         suspicious = ("video" not in ctype and "application/octet-stream" not in ctype) or size < 200_000
@@ -648,7 +828,7 @@ def _download_file( url: str, dest_path: str, referer: str, platform: str = "",
                     os.remove(dest_path)
                 except OSError:
                     pass
-                size2, ctype2, _ = _stream_download(final, dest_path, headers)
+                size2, ctype2, _ = _stream_download(final, dest_path, headers, progress)
                 if "video" in ctype2 or size2 >= 200_000:
                     return
             except Exception:
@@ -663,14 +843,14 @@ def _download_file( url: str, dest_path: str, referer: str, platform: str = "",
                         os.remove(dest_path)
                     except OSError:
                         pass
-                    size3, ctype3, _ = _stream_download(alt, dest_path, headers)
+                    size3, ctype3, _ = _stream_download(alt, dest_path, headers, progress)
                     if _is_m3u8_like(alt, ctype3):
                         try:
                             os.remove(dest_path)
                         except OSError:
                             pass
                         ts_path = dest_path[:-4] + ".ts" if dest_path.lower().endswith(".mp4") else dest_path + ".ts"
-                        _download_hls_m3u8(alt, ts_path, headers, target_height, prefer_small)
+                        _download_hls_m3u8(alt, ts_path, headers, target_height, prefer_small, progress)
                         return
                     if "video" in ctype3 or size3 >= 200_000:
                         return
@@ -700,11 +880,11 @@ def _decide_filename(platform: str, meta: Dict[str, str], timestamp: str) -> str
     
 
 def _download_hls_m3u8(m3u8_url: str, dest_path: str, headers: Dict[str, str],
-                           target_height: Optional[int] = None, prefer_small: bool = False) -> None:
+                           target_height: Optional[int] = None, prefer_small: bool = False,
+                           progress: Optional[Tool.ProgressCallback] = None) -> None:
         """두 번째 파일의 download_hls_m3u8 그대로"""
         # M3U8 플레이리스트 가져오기
-        req = Request(m3u8_url, headers=headers)
-        with urlopen(req, timeout=60) as resp:
+        with DriverConfig.pooled_open(m3u8_url, headers=headers, timeout=60) as resp:
             text = resp.read().decode("utf-8", errors="ignore")
         
         lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
@@ -757,7 +937,7 @@ def _download_hls_m3u8(m3u8_url: str, dest_path: str, headers: Dict[str, str],
                     variants.sort(key=lambda x: x[0], reverse=True)
                     chosen = variants[0][1]
             
-            return _download_hls_m3u8(chosen, dest_path, headers, None, False)
+            return _download_hls_m3u8(chosen, dest_path, headers, None, False, progress)
         
         # 미디어 플레이리스트: 세그먼트 다운로드
         segments = [urljoin(m3u8_url, ln) for ln in lines if not ln.startswith("#")]
@@ -766,21 +946,49 @@ def _download_hls_m3u8(m3u8_url: str, dest_path: str, headers: Dict[str, str],
             raise RuntimeError("No segments found in HLS playlist")
         
         total = len(segments)
-        downloaded = 0
-        
-        with open(dest_path, "wb") as out:
-            for idx, seg in enumerate(segments, 1):
-                req_s = Request(seg, headers=headers)
-                with urlopen(req_s, timeout=60) as rseg:
-                    while True:
-                        chunk = rseg.read(1024 * 256)
-                        if not chunk:
-                            break
-                        out.write(chunk)
-                downloaded += 1
-                print(f"  HLS {idx}/{total} segments", end="\r")
+        downloaded_bytes = 0
+        
+        # 세그먼트를 병렬로 받되, 순서대로 기록하고 앞서 받은 세그먼트는
+        # 워커 수의 2배까지만 메모리에 보관한다
+        window = max(HLS_WORKERS * 2, 1)
+        with Tracing.span("transfer", mode="hls", segments=total) as sp, open(dest_path, "wb") as out, \
+                ThreadPoolExecutor(max_workers=HLS_WORKERS, thread_name_prefix="hls") as pool:
+            pending = deque()
+            next_submit = 0
+            try:
+                for idx in range(1, total + 1):
+                    while next_submit < total and len(pending) < window:
+                        pending.append(pool.submit(Tracing.wrap(_fetch_hls_segment), segments[next_submit], headers))
+                        next_submit += 1
+                    data = pending.popleft().result()
+                    out.write(data)
+                    downloaded_bytes += len(data)
+                    sp.add_bytes(len(data))
+                    print(f"  HLS {idx}/{total} segments", end="\r")
+                    # 전체 크기는 평균 세그먼트 크기로 추정
+                    Tool.report_progress(progress, "download", downloaded_bytes,
+                                         downloaded_bytes * total // idx)
+            except Exception:
+                for future in pending:
+                    future.cancel()
+                raise
         
         print(f"  HLS {total}/{total} segments complete        ")
+
+
+def _fetch_hls_segment(seg_url: str, headers: Dict[str, str]) -> bytes:
+        """HLS 세그먼트 하나를 메모리로 받는다 (실패 시 재시도)"""
+        last_error: Optional[Exception] = None
+        for attempt in range(HLS_SEGMENT_RETRIES + 1):
+            try:
+                with DriverConfig.pooled_open(seg_url, headers=headers, timeout=60) as rseg:
+                    return rseg.read()
+            except Exception as e:
+                last_error = e
+                if attempt < HLS_SEGMENT_RETRIES:
+                    print(f"  HLS 세그먼트 재시도 {attempt + 1}/{HLS_SEGMENT_RETRIES}: {e}")
+                    time.sleep(0.5 * (attempt + 1))
+        raise RuntimeError(f"HLS segment failed: {seg_url[:100]} ({last_error})")
         
         
 def _quality_to_ratio(target_height: Optional[int]) -> str:
@@ -822,51 +1030,10 @@ def _rewrite_ratio_in_url( url: str, target_height: Optional[int], prefer_small:
         return url
     
     
-def _json_walk_urls(obj) -> List[str]:
-        urls = []
-        if isinstance(obj, dict):
-            for k, v in obj.items():
-                urls.extend(_json_walk_urls(v))
-        elif isinstance(obj, list):
-            for v in obj:
-                urls.extend(_json_walk_urls(v))
-        elif isinstance(obj, str):
-            if obj.startswith("http"):
-                urls.append(obj)
-        return urls
-    
-    
-def _stream_download(to_url: str, dest_path: str, headers: Dict[str, str]) -> Tuple[int, str, Optional[int]]:
-        req = Request(to_url, headers=headers)
-        with urlopen(req, timeout=60) as resp, open(dest_path, "wb") as f:
-            ct = resp.headers.get("Content-Type") or ""
-            total = resp.headers.get("Content-Length")
-            total_i = int(total) if total and total.isdigit() else None
-            downloaded = 0
-            last_print = time.time()
-            chunk = 1024 * 256
-            
-            while True:
-                buf = resp.read(chunk)
-                if not buf:
-                    break
-                f.write(buf)
-                downloaded += len(buf)
-                now = time.time()
-                if now - last_print >= 0.5:
-                    if total_i and total_i > 0:
-                        pct = downloaded / total_i * 100
-                        print(f"  {_human_size(downloaded)}/{_human_size(total_i)} ({pct:.1f}%)", end="\r")
-                    else:
-                        print(f"  {_human_size(downloaded)} downloaded", end="\r")
-                    last_print = now
-            
-            if total_i and total_i > 0:
-                print(f"  {_human_size(downloaded)}/{_human_size(total_i)} (100.0%)        ")
-            else:
-                print(f"  {_human_size(downloaded)} downloaded        ")
-            
-            return downloaded, ct.lower(), total_i
+def _stream_download(to_url: str, dest_path: str, headers: Dict[str, str],
+                     progress: Optional[Tool.ProgressCallback] = None) -> Tuple[int, str, Optional[int]]:
+        # 구간 병렬 다운로드 + 끊긴 지점부터 이어받기
+        return PartialDownload.stream_download(to_url, dest_path, headers, progress)
         
         
 def _is_m3u8_like( url: str, content_type: str = "") -> bool:
@@ -946,4 +1113,31 @@ def normalize_douyin_modal_url(url: str) -> str:
         return url
     except Exception:
         # 문제가 생기면 원본 유지
-        return url
\ No newline at end of file
+        return url
+
+
+def canonical_douyin_id(url: str) -> Optional[str]:
+    """캐시 키로 쓰는 Douyin 영상 ID (modal_id 포함)"""
+    url = normalize_douyin_modal_url(url)
+    media_id = _extract_douyin_id_from_url(url)
+    if not media_id:
+        m = MODAL_ID_RE.search(url)
+        media_id = m.group(1) if m else None
+    return media_id
+
+
+def download_douyin_video(url: str, output_dir: Optional[str] = None,
+                          progress: Optional[Tool.ProgressCallback] = None) -> str:
+    """download_tiktok_douyin_video 결과를 output_dir에 저장해서 반환"""
+    return download_tiktok_douyin_video(url, progress=progress, output_dir=output_dir)
+
+
+Extractors.register(Extractors.Extractor(
+    "douyin",
+    hosts=("douyin.com", "iesdouyin.com"),
+    short_hosts=("v.douyin.com",),
+    fetch=download_douyin_video,
+    canonical_id=canonical_douyin_id,
+    resolve=resolve_tiktok_douyin,
+    label="Douyin (抖音)",
+))
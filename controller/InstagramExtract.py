@@ -1,85 +1,56 @@
 """
-Instagram video/photo downloader using yt-dlp.
+Instagram video/photo downloader using the in-process yt-dlp engine.
 """
 
-import subprocess
 import os
-import glob
 import re
 
+from common import Extractors, YtDlpEngine
 
-def download_instagram_media(url, output_dir=None):
+FORMAT = "best"
+INSTAGRAM_ID_RE = re.compile(r"/(?:p|reel|reels|tv)/([A-Za-z0-9_\-]+)")
+
+
+def download_instagram_media(url, output_dir=None, progress=None):
     """
     Download Instagram video or photo using yt-dlp
 
     Args:
         url: Instagram post URL (instagram.com)
         output_dir: Directory to save the media
+        progress: Optional callback(stage, downloaded_bytes, total_bytes)
 
     Returns:
         Path to downloaded media file
 
     Raises:
-        Exception: If download fails
+        YtDlpError: If download fails (``kind`` says why, e.g. "private")
     """
     if output_dir is None:
         output_dir = os.getcwd()
+    return resolve_instagram_media(url).download(output_dir, progress)
 
-    os.makedirs(output_dir, exist_ok=True)
-
-    output_template = os.path.join(output_dir, "instagram_%(id)s.%(ext)s")
-
-    try:
-        # yt-dlp command for Instagram
-        cmd = [
-            "yt-dlp",
-            "-f", "best",
-            "-o", output_template,
-            "--no-playlist",
-            "--restrict-filenames",
-            url
-        ]
-
-        print(f"[Instagram] Running: {' '.join(cmd)}")
-
-        result = subprocess.run(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            timeout=300
-        )
-
-        stdout = result.stdout.decode('utf-8', errors='replace')
-        stderr = result.stderr.decode('utf-8', errors='replace')
-
-        print(f"[Instagram] Return code: {result.returncode}")
-        print(f"[Instagram] Output: {stdout[:500]}")
 
-        if result.returncode != 0:
-            error_msg = f"Instagram download failed: {stderr[:200]}"
-            print(f"[Instagram] Error: {error_msg}")
-            raise Exception(error_msg)
+def resolve_instagram_media(url):
+    """Extract a Instagram post once (direct URL if any, plus its download); see ``YtDlpEngine.resolve``"""
+    return YtDlpEngine.resolve(url, FORMAT, "instagram_%(id)s.%(ext)s", "Instagram")
 
-        # Find downloaded file
-        media_files = glob.glob(os.path.join(output_dir, "instagram_*.*"))
-        if not media_files:
-            # Try any file
-            media_files = glob.glob(os.path.join(output_dir, "*.*"))
 
-        if media_files:
-            # Return most recent file
-            latest_file = max(media_files, key=os.path.getctime)
-            print(f"[Instagram] Downloaded: {latest_file}")
-            return os.path.abspath(latest_file)
+def canonical_instagram_id(url):
+    """Return the post shortcode in *url*, or None"""
+    m = INSTAGRAM_ID_RE.search(url)
+    return m.group(1) if m else None
 
-        raise Exception("Instagram media file not found after download")
 
-    except subprocess.TimeoutExpired:
-        raise Exception("Instagram download timeout (300s)")
-    except FileNotFoundError:
-        raise Exception("yt-dlp not installed")
-    except Exception as e:
-        raise Exception(f"Instagram download failed: {str(e)}")
+Extractors.register(Extractors.Extractor(
+    "instagram",
+    hosts=("instagram.com",),
+    fetch=download_instagram_media,
+    canonical_id=canonical_instagram_id,
+    resolve=resolve_instagram_media,
+    label="Instagram",
+    media_types=("videos", "reels", "photos"),
+))
 
 
-__all__ = ["download_instagram_media"]
+__all__ = ["download_instagram_media", "resolve_instagram_media", "canonical_instagram_id"]
@@ -13,12 +13,22 @@ from __future__ import annotations
 import json
 import os
 import re
-from typing import Dict, Iterable, List, Optional, Tuple, Union
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from urllib.parse import urlparse, urlunparse
 
 import requests
+import requests.adapters
 from requests.cookies import CookieConflictError
 
+from common import Extractors, JsonWalk, PartialDownload, Tracing
+from common.BrowserPool import get_pool as get_browser_pool
+from common.Tool import ProgressCallback, report_progress
+
 
 MOBILE_USER_AGENT = (
     "Mozilla/5.0 (Linux; Android 13; Pixel 7) AppleWebKit/537.36 "
@@ -58,16 +68,44 @@ DOC_ID_PATTERNS: Tuple[re.Pattern, ...] = (
     ),
 )
 
+# The first two name the post query explicitly, so a hit there is trusted
+# enough to stop fetching the remaining bundles.  They get their own pass:
+# in a single alternation the generic "threadsRelayOperation ... digits"
+# pattern can start at an earlier module and swallow the named one.
+HIGH_CONFIDENCE_SCAN_RE = re.compile("|".join(f"(?:{p.pattern})" for p in DOC_ID_PATTERNS[:2]))
+GENERIC_SCAN_RE = re.compile("|".join(f"(?:{p.pattern})" for p in DOC_ID_PATTERNS[2:]))
+MAX_DISCOVERED_DOC_IDS = 10
+SCRIPT_WORKERS = int(os.environ.get("THREADS_SCRIPT_WORKERS", 6))
+# Upper bound on waiting for the <video> element in the browser fallback.
+SELENIUM_VIDEO_WAIT = 10
+
+# How long an LSD token scraped for a pooled session is reused.
+TOKEN_TTL = int(os.environ.get("THREADS_TOKEN_TTL", 1800))
+SESSION_POOL_SIZE = int(os.environ.get("THREADS_SESSION_POOL_SIZE", 4))
+# GraphQL statuses that mean the session's LSD/CSRF token is no longer accepted.
+AUTH_ERROR_STATUSES = (400, 401, 403)
+
 SHORTCODE_RE = re.compile(
     r"(?:threads\.net|threads\.com)/(?:@[\w\.\-]+/)?(?:post|status)/([A-Za-z0-9_\-]+)"
 )
 LSD_TOKEN_RE = re.compile(r'"LSD",\s*\[\],\s*\{"token":"([^"]+)"\}')
-STREAM_CHUNK = 1 << 16  # 64 KiB
+
+# How long a doc id that answered GraphQL stays trusted without a new success.
+DOC_ID_TTL = int(os.environ.get("THREADS_DOC_ID_TTL", 6 * 3600))
+# How often the background refresher re-scans the page bundles for doc ids.
+DOC_ID_REFRESH_INTERVAL = int(os.environ.get("THREADS_DOC_ID_REFRESH", 1800))
+# Optional JSON file so that workers and restarts share what was learned.
+DOC_ID_CACHE_PATH = os.environ.get("THREADS_DOC_ID_CACHE", "")
+DOC_ID_MAX_FAILURES = 3
 
 
 class ThreadsDownloadError(RuntimeError):
     """Raised when the Threads extractor cannot obtain or save media."""
 
+    def __init__(self, message: str, status: Optional[int] = None) -> None:
+        super().__init__(message)
+        self.status = status
+
 
 def _extract_shortcode(url: str) -> str:
     match = SHORTCODE_RE.search(url)
@@ -87,6 +125,71 @@ def _get_session() -> requests.Session:
     return session
 
 
+class PooledSession:
+    """A requests session plus the LSD token scraped with its cookies."""
+
+    def __init__(self, session: requests.Session) -> None:
+        self.session = session
+        self.lsd_token: Optional[str] = None
+        self.token_expires_at = 0.0
+
+    def token(self) -> Optional[str]:
+        if self.lsd_token and time.time() < self.token_expires_at:
+            return self.lsd_token
+        return None
+
+    def set_token(self, token: str, ttl: int = TOKEN_TTL) -> str:
+        self.lsd_token = token
+        self.token_expires_at = time.time() + ttl
+        return token
+
+    def invalidate(self) -> None:
+        """Forget the token and the cookies it was issued with."""
+        self.lsd_token = None
+        self.token_expires_at = 0.0
+        self.session.cookies.clear()
+
+
+class SessionPool:
+    """
+    Reuses Threads sessions across requests so cookies (csrftoken) and the
+    LSD token survive until they expire or GraphQL rejects them.  All
+    sessions share one connection pool.
+    """
+
+    def __init__(self, size: int = SESSION_POOL_SIZE) -> None:
+        self.size = size
+        self._lock = threading.Lock()
+        self._idle: List[PooledSession] = []
+        self._adapter = requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=max(size, 1) * 4)
+        self.created = 0
+
+    @contextmanager
+    def session(self) -> Iterator[PooledSession]:
+        with self._lock:
+            pooled = self._idle.pop() if self._idle else None
+        if pooled is None:
+            session = _get_session()
+            session.mount("https://", self._adapter)
+            session.mount("http://", self._adapter)
+            pooled = PooledSession(session)
+            with self._lock:
+                self.created += 1
+        try:
+            yield pooled
+        finally:
+            with self._lock:
+                if len(self._idle) < self.size:
+                    self._idle.append(pooled)
+                    pooled = None
+            if pooled is not None:
+                pooled.session.close()
+
+
+session_pool = SessionPool()
+
+
+@Tracing.timed("threads.page")
 def _fetch_html(session: requests.Session, url: str, max_retries: int = 3) -> str:
     last_error = None
     for attempt in range(max_retries):
@@ -118,6 +221,7 @@ def _iter_scripts(html: str) -> Iterable[str]:
         yield script_match.group(1)
 
 
+@Tracing.timed("threads.bundle")
 def _download_script(session: requests.Session, url: str) -> Optional[str]:
     try:
         resp = session.get(url, timeout=15)
@@ -128,20 +232,196 @@ def _download_script(session: requests.Session, url: str) -> Optional[str]:
         return None
 
 
+def _scan_script(script_body: str) -> List[Tuple[str, bool]]:
+    """Return (doc_id, high_confidence) pairs found in a bundle, high-confidence first."""
+    found: List[Tuple[str, bool]] = [
+        (match.group(match.lastindex), True) for match in HIGH_CONFIDENCE_SCAN_RE.finditer(script_body)
+    ]
+    high = {doc_id for doc_id, _ in found}
+    for match in GENERIC_SCAN_RE.finditer(script_body):
+        doc_id = match.group(match.lastindex)
+        if doc_id not in high:
+            found.append((doc_id, False))
+    return found
+
+
+def _fetch_and_scan(
+    session: requests.Session, script_url: str, cancelled: threading.Event
+) -> List[Tuple[str, bool]]:
+    if cancelled.is_set():
+        return []
+    script_body = _download_script(session, script_url)
+    if not script_body or cancelled.is_set():
+        return []
+    return _scan_script(script_body)
+
+
+_script_pool = ThreadPoolExecutor(max_workers=SCRIPT_WORKERS, thread_name_prefix="threads-scripts")
+
+
+@Tracing.timed("threads.discover")
 def _discover_doc_ids(session: requests.Session, html: str) -> List[str]:
-    discovered: List[str] = []
-    for script_url in _iter_scripts(html):
-        script_body = _download_script(session, script_url)
-        if not script_body:
-            continue
-        for pattern in DOC_ID_PATTERNS:
-            for match in pattern.finditer(script_body):
-                doc_id = match.group(1)
-                if doc_id not in discovered:
-                    discovered.append(doc_id)
-        if discovered:
-            break
-    return discovered
+    """
+    Fetch the page bundles concurrently and scan them for doc ids.  Stops as
+    soon as one bundle yields a high-confidence id; otherwise returns what
+    every bundle yielded, high-confidence ids first.
+    """
+    script_urls = list(dict.fromkeys(_iter_scripts(html)))
+    if not script_urls:
+        return []
+
+    cancelled = threading.Event()
+    futures = {
+        _script_pool.submit(Tracing.wrap(_fetch_and_scan), session, script_url, cancelled): index
+        for index, script_url in enumerate(script_urls)
+    }
+    results: Dict[int, List[Tuple[str, bool]]] = {}
+    pending = set(futures)
+    try:
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[futures[future]] = future.result()
+            if any(high for found in results.values() for _, high in found):
+                break
+    finally:
+        cancelled.set()
+        for future in pending:
+            future.cancel()
+
+    high_ids: List[str] = []
+    other_ids: List[str] = []
+    for index in sorted(results):
+        for doc_id, high in results[index]:
+            bucket = high_ids if high else other_ids
+            if doc_id not in bucket:
+                bucket.append(doc_id)
+    discovered = high_ids + [d for d in other_ids if d not in high_ids]
+    return discovered[:MAX_DISCOVERED_DOC_IDS]
+
+
+class DocIdCache:
+    """
+    Process-wide list of GraphQL doc ids, most recently working first.
+
+    A doc id is promoted to the front when a query with it returns data and
+    demoted to the back when it fails; after ``DOC_ID_MAX_FAILURES``
+    consecutive failures, or ``ttl`` seconds without a success, it is
+    dropped.  With a ``path`` the list is mirrored to a JSON file.
+    """
+
+    def __init__(
+        self,
+        ttl: int = DOC_ID_TTL,
+        path: Optional[str] = None,
+        refresh_interval: int = DOC_ID_REFRESH_INTERVAL,
+    ) -> None:
+        self.ttl = ttl
+        self.path = path
+        self.refresh_interval = refresh_interval
+        self.seed_url: Optional[str] = None
+        self._lock = threading.Lock()
+        # doc_id -> {"expires_at": float, "failures": int, "source": str}
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._refresher: Optional[threading.Thread] = None
+        self._load()
+
+    def candidates(self) -> List[str]:
+        """Unexpired doc ids in the order they should be tried."""
+        now = time.time()
+        with self._lock:
+            for doc_id in [d for d, e in self._entries.items() if e["expires_at"] <= now]:
+                del self._entries[doc_id]
+            return list(self._entries)
+
+    def promote(self, doc_id: str) -> None:
+        with self._lock:
+            first = next(iter(self._entries), None)
+            self._entries[doc_id] = {"expires_at": time.time() + self.ttl, "failures": 0, "source": "graphql"}
+            self._entries.move_to_end(doc_id, last=False)
+        if first != doc_id:
+            self._save()
+
+    def demote(self, doc_id: str) -> None:
+        with self._lock:
+            entry = self._entries.get(doc_id)
+            if entry is None:
+                return
+            entry["failures"] += 1
+            if entry["failures"] >= DOC_ID_MAX_FAILURES:
+                del self._entries[doc_id]
+            else:
+                self._entries.move_to_end(doc_id)
+        self._save()
+
+    def add(self, doc_ids: Iterable[str], source: str = "discovered") -> int:
+        """Append doc ids that are not known yet (untested, so after the proven ones)."""
+        added = 0
+        with self._lock:
+            for doc_id in doc_ids:
+                if doc_id not in self._entries:
+                    self._entries[doc_id] = {"expires_at": time.time() + self.ttl, "failures": 0, "source": source}
+                    added += 1
+        if added:
+            self._save()
+        return added
+
+    def start_refresher(self, refresh: Callable[[str], List[str]]) -> None:
+        """Run *refresh(seed_url)* every ``refresh_interval`` seconds on a daemon thread."""
+        with self._lock:
+            if self._refresher is not None or self.refresh_interval <= 0:
+                return
+            self._refresher = threading.Thread(
+                target=self._refresh_loop, args=(refresh,), name="threads-doc-ids", daemon=True
+            )
+        self._refresher.start()
+
+    def _refresh_loop(self, refresh: Callable[[str], List[str]]) -> None:
+        while True:
+            time.sleep(self.refresh_interval)
+            if not self.seed_url:
+                continue
+            try:
+                added = self.add(refresh(self.seed_url), source="refresh")
+                if added:
+                    print(f"[Threads] Refreshed doc ids: {added} new")
+            except Exception as exc:
+                print(f"[Threads] doc id refresh failed: {exc}")
+
+    def _load(self) -> None:
+        if not self.path:
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return
+        now = time.time()
+        for doc_id, entry in entries:
+            if entry.get("expires_at", 0) > now:
+                self._entries[doc_id] = entry
+
+    def _save(self) -> None:
+        if not self.path:
+            return
+        with self._lock:
+            entries = [[d, e] for d, e in self._entries.items()]
+        tmp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, self.path)
+        except OSError as exc:
+            print(f"[Threads] Could not save doc id cache: {exc}")
+
+
+doc_id_cache = DocIdCache(path=DOC_ID_CACHE_PATH or None)
+
+
+def _refresh_doc_ids(seed_url: str) -> List[str]:
+    """Scan the bundles of *seed_url* for doc ids (used by the background refresher)."""
+    session = _get_session()
+    return _discover_doc_ids(session, _fetch_html(session, seed_url))
 
 
 def _collect_candidate_doc_ids(
@@ -154,6 +434,7 @@ def _collect_candidate_doc_ids(
     return doc_ids
 
 
+@Tracing.timed("threads.graphql")
 def _post_graphql(
     session: requests.Session,
     url: str,
@@ -192,8 +473,12 @@ def _post_graphql(
             )
             if resp.status_code >= 400:
                 last_error = ThreadsDownloadError(
-                    f"GraphQL query failed (doc_id={doc_id}, status={resp.status_code})."
+                    f"GraphQL query failed (doc_id={doc_id}, status={resp.status_code}).",
+                    status=resp.status_code,
                 )
+                if resp.status_code in AUTH_ERROR_STATUSES:
+                    # Retrying with the same token will not help
+                    raise last_error
                 if attempt < max_retries - 1:
                     continue
                 raise last_error
@@ -220,24 +505,14 @@ def _post_graphql(
     raise last_error or ThreadsDownloadError("GraphQL query failed")
 
 
-def _flatten(node: Union[Dict, List]) -> Iterable[Union[Dict, List]]:
-    if isinstance(node, dict):
-        yield node
-        for value in node.values():
-            if isinstance(value, (dict, list)):
-                yield from _flatten(value)
-    elif isinstance(node, list):
-        for item in node:
-            if isinstance(item, (dict, list)):
-                yield from _flatten(item)
-
-
+@Tracing.timed("threads.parse")
 def _pick_best_video_url(payload: Dict[str, Union[dict, list, str]]) -> Optional[str]:
     """Extract the best video URL from GraphQL payload."""
     best_url = None
 
     # Look for video_versions in the payload
-    for node in _flatten(payload):
+    # Depth-first, stops at the first node that carries a video
+    for node in JsonWalk.dicts(payload):
         if isinstance(node, dict):
             # Check for video_versions
             if "video_versions" in node:
@@ -271,29 +546,32 @@ def _pick_best_video_url(payload: Dict[str, Union[dict, list, str]]) -> Optional
     return best_url
 
 
-def _download_binary(session: requests.Session, url: str, target_path: str, max_retries: int = 3) -> str:
-    last_error = None
-    for attempt in range(max_retries):
-        try:
-            with session.get(url, stream=True, timeout=30) as resp:
-                if resp.status_code >= 400:
-                    last_error = ThreadsDownloadError(
-                        f"Failed to download media asset ({resp.status_code})."
-                    )
-                    if attempt < max_retries - 1:
-                        continue
-                    raise last_error
-                with open(target_path, "wb") as handle:
-                    for chunk in resp.iter_content(STREAM_CHUNK):
-                        if chunk:
-                            handle.write(chunk)
-            return target_path
-        except requests.RequestException as exc:
-            last_error = ThreadsDownloadError(f"Download failed: {exc}")
-            if attempt < max_retries - 1:
-                continue
-            raise last_error
-    raise last_error or ThreadsDownloadError("Failed to download media")
+def _download_binary(
+    session: requests.Session,
+    url: str,
+    target_path: str,
+    max_retries: int = 3,
+    progress: Optional[ProgressCallback] = None,
+) -> str:
+    """
+    Stream *url* into *target_path* through ``PartialDownload`` using the
+    session's cookies and headers.
+
+    Interrupted transfers keep the ``.part`` file and its sidecar state, so
+    the next attempt asks only for the remaining bytes.
+    """
+    try:
+        PartialDownload.stream_download(
+            url,
+            target_path,
+            {},
+            progress,
+            retries=max_retries - 1,
+            opener=PartialDownload.session_opener(session),
+        )
+    except (requests.RequestException, OSError) as exc:
+        raise ThreadsDownloadError(f"Download failed: {exc}") from exc
+    return target_path
 
 
 def _clean_media_url(url: str) -> str:
@@ -332,71 +610,80 @@ def _download_and_save(
     output_dir: Optional[str],
     default_extension: str,
     session: Optional[requests.Session] = None,
+    progress: Optional[ProgressCallback] = None,
 ) -> str:
     target_path = _prepare_output_path(shortcode, output_dir, media_url, default_extension)
-    session_to_use = session or requests.Session()
-    session_to_use.headers.setdefault("User-Agent", MOBILE_USER_AGENT)
-    return _download_binary(session_to_use, media_url, target_path)
+    if session is not None:
+        return _download_binary(session, media_url, target_path, progress=progress)
+    with session_pool.session() as pooled:
+        return _download_binary(pooled.session, media_url, target_path, progress=progress)
 
 
+@Tracing.timed("threads.selenium")
 def _download_via_selenium(
     canonical_url: str,
     shortcode: str,
     output_dir: Optional[str],
+    progress: Optional[ProgressCallback] = None,
 ) -> str:
     """Extract video using Selenium (browser automation)"""
     try:
-        from selenium import webdriver
+        from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
         from selenium.webdriver.common.by import By
-        from selenium.webdriver.chrome.options import Options
-        import time
-
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
-
-        driver = webdriver.Chrome(options=chrome_options)
-        driver.set_page_load_timeout(15)  # 15 second timeout
-        driver.get(canonical_url)
-        time.sleep(3)  # Reduced wait time
-
-        # Try to find video element
-        video_elements = driver.find_elements(By.TAG_NAME, "video")
-        if video_elements:
-            for video in video_elements:
-                src = video.get_attribute("src")
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        media_url = None
+        # Borrow a warm driver; it goes back to the pool (or is quit) even on errors
+        with get_browser_pool().driver() as driver:
+            driver.get(canonical_url)
+            try:
+                # A React re-render makes the found <video> stale; the next poll retries
+                WebDriverWait(
+                    driver, SELENIUM_VIDEO_WAIT, ignored_exceptions=(StaleElementReferenceException,)
+                ).until(
+                    lambda d: any(v.get_attribute("src") for v in d.find_elements(By.TAG_NAME, "video"))
+                )
+            except TimeoutException:
+                pass
+
+            # Try to find video element
+            for video in driver.find_elements(By.TAG_NAME, "video"):
+                try:
+                    src = video.get_attribute("src")
+                except StaleElementReferenceException:
+                    continue
                 if src and ("cdninstagram.com" in src or ".mp4" in src):
-                    driver.quit()
-                    return _download_and_save(src, shortcode, output_dir, ".mp4")
+                    media_url = src
+                    break
 
-        # Fallback: search page source for mp4 URLs
-        page_source = driver.page_source
-        mp4_urls = re.findall(r'https://[^\s"\'<>]+\.mp4[^\s"\'<>]*', page_source)
-        driver.quit()
+            if not media_url:
+                # Fallback: search page source for mp4 URLs
+                page_source = driver.page_source
+                for url in re.findall(r'https://[^\s"\'<>]+\.mp4[^\s"\'<>]*', page_source):
+                    # Get the first CDN URL (usually the video)
+                    if "cdninstagram.com" in url:
+                        media_url = _clean_media_url(url)
+                        break
 
-        if mp4_urls:
-            # Get the first CDN URL (usually the video)
-            for url in mp4_urls:
-                if "cdninstagram.com" in url:
-                    clean_url = _clean_media_url(url)
-                    return _download_and_save(clean_url, shortcode, output_dir, ".mp4")
+        if media_url:
+            return _download_and_save(media_url, shortcode, output_dir, ".mp4", progress=progress)
 
         raise ThreadsDownloadError("Selenium: No video found in page")
 
     except ImportError:
         raise ThreadsDownloadError("Selenium not installed. Install with: pip install selenium")
+    except ThreadsDownloadError:
+        raise
     except Exception as exc:
         raise ThreadsDownloadError(f"Selenium extraction failed: {exc}")
 
 
+@Tracing.timed("threads.jina")
 def _download_via_jina(
     canonical_url: str,
     shortcode: str,
     output_dir: Optional[str],
+    progress: Optional[ProgressCallback] = None,
 ) -> str:
     jina_url = f"https://r.jina.ai/{canonical_url}"
     try:
@@ -417,7 +704,7 @@ def _download_via_jina(
 
     if mp4_candidates:
         media_url = _clean_media_url(mp4_candidates[0])
-        return _download_and_save(media_url, shortcode, output_dir, ".mp4")
+        return _download_and_save(media_url, shortcode, output_dir, ".mp4", progress=progress)
 
     image_candidates = re.findall(
         r"\((https://[^)]+\.(?:jpg|jpeg|png)[^)]*)\)", text, flags=re.IGNORECASE
@@ -429,20 +716,14 @@ def _download_via_jina(
 
     if image_candidates:
         media_url = _clean_media_url(image_candidates[0])
-        return _download_and_save(media_url, shortcode, output_dir, ".jpg")
+        return _download_and_save(media_url, shortcode, output_dir, ".jpg", progress=progress)
 
     raise ThreadsDownloadError("Fallback extraction did not locate media.")
 
 
-def download_threads_video(url: str, output_dir: Optional[str] = None) -> str:
-    """
-    Download a Threads post (video) to *output_dir* and return the saved path.
-    Raises ThreadsDownloadError on failure.
-    """
-
-    shortcode = _extract_shortcode(url)
+def _canonical_post_url(url: str) -> str:
     parsed_url = urlparse(url)
-    canonical_url = urlunparse(
+    return urlunparse(
         (
             "https",
             "www.threads.net",
@@ -452,47 +733,170 @@ def download_threads_video(url: str, output_dir: Optional[str] = None) -> str:
             "",
         )
     )
-    session = _get_session()
-
-    html = _fetch_html(session, canonical_url)
-    lsd_token = _extract_lsd_token(html)
 
-    candidate_doc_ids = _collect_candidate_doc_ids(session, html)
-    if not candidate_doc_ids:
-        raise ThreadsDownloadError("Could not locate a usable GraphQL doc id.")
 
-    graph_payload: Optional[Dict[str, Union[dict, list, str]]] = None
+def _query_doc_ids(
+    session: requests.Session,
+    canonical_url: str,
+    lsd_token: str,
+    shortcode: str,
+    doc_ids: Iterable[str],
+    tried: set,
+    raise_on_auth: bool = False,
+) -> Tuple[Optional[Dict[str, Union[dict, list, str]]], Optional[Exception]]:
     last_error: Optional[Exception] = None
-    for doc_id in candidate_doc_ids:
+    for doc_id in doc_ids:
+        if doc_id in tried:
+            continue
+        tried.add(doc_id)
         try:
             graph_payload = _post_graphql(session, canonical_url, lsd_token, doc_id, shortcode)
-            if graph_payload:
-                break
         except ThreadsDownloadError as exc:
+            if raise_on_auth and exc.status in AUTH_ERROR_STATUSES:
+                # The reused token is stale, not the doc id
+                raise
             last_error = exc
+            doc_id_cache.demote(doc_id)
             continue
+        # A stale doc id still answers 200 but with "errors" and no data
+        if isinstance(graph_payload, dict) and graph_payload.get("data"):
+            doc_id_cache.promote(doc_id)
+            return graph_payload, last_error
+        doc_id_cache.demote(doc_id)
+        last_error = ThreadsDownloadError(f"GraphQL returned no data (doc_id={doc_id}).")
+    return None, last_error
 
-    if not graph_payload:
-        # Try Jina first (faster), then Selenium as last resort
+
+def _fetch_graph_payload(
+    pooled: PooledSession,
+    canonical_url: str,
+    shortcode: str,
+) -> Tuple[Optional[Dict[str, Union[dict, list, str]]], Optional[Exception]]:
+    """
+    Query the post through GraphQL; returns (payload, last_error).  The
+    pooled session's LSD token is reused when it has one, so the post page
+    is only fetched for a new token or for doc id discovery.
+    """
+    session = pooled.session
+    page = {"html": None}
+
+    def load_html() -> str:
+        if page["html"] is None:
+            page["html"] = _fetch_html(session, canonical_url)
+        return page["html"]
+
+    lsd_token = pooled.token()
+    reused = lsd_token is not None
+    if not reused:
+        lsd_token = pooled.set_token(_extract_lsd_token(load_html()))
+    doc_id_cache.seed_url = canonical_url
+    doc_id_cache.start_refresher(_refresh_doc_ids)
+
+    while True:
+        tried: set = set()
         try:
-            return _download_via_jina(canonical_url, shortcode, output_dir)
-        except ThreadsDownloadError:
-            try:
-                return _download_via_selenium(canonical_url, shortcode, output_dir)
-            except ThreadsDownloadError:
-                if last_error:
-                    raise ThreadsDownloadError(str(last_error))
+            # Warm path: doc ids that worked recently, no script downloads
+            graph_payload, last_error = _query_doc_ids(
+                session, canonical_url, lsd_token, shortcode, doc_id_cache.candidates(), tried, reused
+            )
+            if graph_payload:
+                return graph_payload, last_error
+
+            candidate_doc_ids = _collect_candidate_doc_ids(session, load_html())
+            if not candidate_doc_ids and not tried:
+                raise ThreadsDownloadError("Could not locate a usable GraphQL doc id.")
+
+            graph_payload, cold_error = _query_doc_ids(
+                session, canonical_url, lsd_token, shortcode, candidate_doc_ids, tried, reused
+            )
+            return graph_payload, cold_error or last_error
+        except ThreadsDownloadError as exc:
+            if not reused or exc.status not in AUTH_ERROR_STATUSES:
                 raise
+            # Lazy refresh: the cached token was rejected, scrape a new one once
+            print(f"[Threads] Reused token rejected ({exc.status}), refreshing session")
+            pooled.invalidate()
+            page["html"] = None
+            lsd_token = pooled.set_token(_extract_lsd_token(load_html()))
+            reused = False
+
+
+def resolve_threads_post(url: str) -> Extractors.Resolution:
+    """
+    Query a Threads post through GraphQL once.  The resolution's target is
+    the direct video URL with the headers to fetch it; when GraphQL gives no
+    video, its download goes straight to the Jina/Selenium fallbacks instead
+    of querying the post again.
+    """
+    shortcode = _extract_shortcode(url)
+    canonical_url = _canonical_post_url(url)
+    with session_pool.session() as pooled:
+        graph_payload, last_error = _fetch_graph_payload(pooled, canonical_url, shortcode)
+        user_agent = pooled.session.headers.get("User-Agent")
+    video_url = _pick_best_video_url(graph_payload) if graph_payload else None
 
-    video_url = _pick_best_video_url(graph_payload)
     if not video_url:
-        # Try Jina first (faster), then Selenium as last resort
-        try:
-            return _download_via_jina(canonical_url, shortcode, output_dir)
-        except ThreadsDownloadError:
-            return _download_via_selenium(canonical_url, shortcode, output_dir)
+        def download_fallback(output_dir: Optional[str], progress: Optional[ProgressCallback] = None) -> str:
+            # Try Jina first (faster), then Selenium as last resort
+            try:
+                return _download_via_jina(canonical_url, shortcode, output_dir, progress)
+            except ThreadsDownloadError:
+                try:
+                    return _download_via_selenium(canonical_url, shortcode, output_dir, progress)
+                except ThreadsDownloadError:
+                    if not graph_payload and last_error:
+                        raise ThreadsDownloadError(str(last_error))
+                    raise
+
+        return Extractors.Resolution(None, download_fallback)
+
+    def download(output_dir: Optional[str], progress: Optional[ProgressCallback] = None) -> str:
+        return _download_and_save(video_url, shortcode, output_dir, ".mp4", progress=progress)
 
-    return _download_and_save(video_url, shortcode, output_dir, ".mp4", session=session)
+    ext = os.path.splitext(urlparse(video_url).path)[1]
+    if not ext or len(ext) > 5:
+        ext = ".mp4"
+    headers = {"User-Agent": user_agent or MOBILE_USER_AGENT}
+    return Extractors.Resolution((video_url, f"threads_{shortcode}{ext}", headers), download)
+
+
+def download_threads_video(
+    url: str,
+    output_dir: Optional[str] = None,
+    progress: Optional[ProgressCallback] = None,
+) -> str:
+    """
+    Download a Threads post (video) to *output_dir* and return the saved path.
+    *progress* is called as ``progress(stage, downloaded_bytes, total_bytes)``.
+    Raises ThreadsDownloadError on failure.
+    """
+
+    report_progress(progress, "resolve")
+    return resolve_threads_post(url).download(output_dir, progress)
+
+
+def canonical_threads_id(url: str) -> Optional[str]:
+    """Return the post shortcode used as the cache key, or None."""
+    match = SHORTCODE_RE.search(url)
+    return match.group(1) if match else None
+
+
+Extractors.register(
+    Extractors.Extractor(
+        "threads",
+        hosts=("threads.net", "threads.com"),
+        fetch=download_threads_video,
+        canonical_id=canonical_threads_id,
+        resolve=resolve_threads_post,
+        label="Threads",
+        media_types=("videos", "images"),
+    )
+)
 
 
-__all__ = ["download_threads_video", "ThreadsDownloadError"]
+__all__ = [
+    "download_threads_video",
+    "resolve_threads_post",
+    "canonical_threads_id",
+    "ThreadsDownloadError",
+]
@@ -1,23 +1,21 @@
 import re
 import json
 import html
-from typing import Dict, List, Optional, Tuple, Iterable
+from typing import Dict, List, Optional, Tuple, Iterable, Union
 
 from common import DriverConfig
+from common import HtmlScan
 from common import Tool
 
-SIGI_RE = re.compile(r"<script id=\"SIGI_STATE\"[^>]*>(.*?)</script>", re.S)
-
-def tiktok_extract_from_html(html_text: str) -> Tuple[Optional[str], Dict[str, str]]:
+def tiktok_extract_from_html(html_text: Union[str, HtmlScan.Page]) -> Tuple[Optional[str], Dict[str, str]]:
+    page = html_text if isinstance(html_text, HtmlScan.Page) else HtmlScan.Page(html_text, [HtmlScan.SIGI_STATE])
     meta = {}
-    m_title = re.search(r"<title>(.*?)</title>", html_text, re.S | re.I)
-    if m_title:
-        meta["title"] = html.unescape(m_title.group(1)).strip()
+    if page.title is not None:
+        meta["title"] = html.unescape(page.title).strip()
 
-    m = SIGI_RE.search(html_text)
-    if m:
+    if page.found == HtmlScan.SIGI_STATE.name:
         try:
-            data = json.loads(m.group(1))
+            data = json.loads(page.data)
             item_mod = data.get("ItemModule") or {}
             item = None
             if isinstance(item_mod, dict) and item_mod:
@@ -58,12 +56,13 @@ def tiktok_extract_from_html(html_text: str) -> Tuple[Optional[str], Dict[str, s
         except Exception:
             pass
 
-    candidates = re.findall(r"https?://[^\"'<>\s]+", html_text)
+    candidates = re.findall(r"https?://[^\"'<>\s]+", page.text)
     url_ = Tool.pick_best_url(candidates, platform="tiktok")
     return url_, meta
 
 def fetch_tiktok_video(url: str) -> Tuple[Optional[str], Dict[str, str]]:
     final = DriverConfig.resolve_redirect(url, headers={"Referer": "https://www.tiktok.com/"})
-    with DriverConfig.http_open(final, headers={"Referer": "https://www.tiktok.com/"}) as resp:
-        html_text = resp.read().decode("utf-8", errors="ignore")
-    return tiktok_extract_from_html(html_text)
\ No newline at end of file
+    # SIGI_STATE 스크립트까지만 읽고, 실패했을 때만 나머지를 읽는다
+    with HtmlScan.Page(DriverConfig.http_open(final, headers={"Referer": "https://www.tiktok.com/"}),
+                       [HtmlScan.SIGI_STATE]) as page:
+        return tiktok_extract_from_html(page)
\ No newline at end of file
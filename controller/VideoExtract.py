@@ -2,6 +2,7 @@ import re
 from typing import Dict, List, Optional, Tuple, Iterable
 
 from common import DriverConfig
+from common import JsonWalk
 from common import Tool
 
 VIDEO_DATA_PATTERNS = [
@@ -13,6 +14,12 @@ VIDEO_DATA_PATTERNS = [
     re.compile(r'/video/(\d{10,})', re.S),
 ]
 
+# 재생 URL이 들어 있는 JSON 키 (아바타/음악/공유 링크 등은 건너뛴다)
+MEDIA_KEYS = (
+    "video", "play_addr", "play_addr_h264", "play_addr_265", "download_addr",
+    "bit_rate", "playAddr", "downloadAddr", "bitRateList", "video_versions",
+)
+
 URL_PATTERNS = [
     re.compile(r'https://[^"\'<>\s]*douyin[^"\'<>\s]*play[^"\'<>\s]*', re.S),
     re.compile(r'https://[^"\'<>\s]*aweme[^"\'<>\s]*play[^"\'<>\s]*', re.S),
@@ -53,15 +60,30 @@ def extract_direct_urls(html_text: str) -> List[str]:
     return urls
     
     
-def _json_walk_urls(obj) -> List[str]:
+# 이 정도 재생 주소를 찾으면 JSON의 나머지는 보지 않는다 (1080p 이상 또는 br=2000kbps 이상)
+GOOD_ENOUGH_HEIGHT = 1080
+GOOD_ENOUGH_BITRATE = 2000
+
+
+def _is_good_enough(url: str) -> bool:
+    """워터마크 없는 고화질 재생 주소인지 (pick_best_url이 더 나은 후보를 찾을 여지가 거의 없다)"""
+    if "play" not in url or "playwm" in url:
+        return False
+    height, _, bitrate = Tool._extract_quality_metrics(url)
+    return height >= GOOD_ENOUGH_HEIGHT or bitrate >= GOOD_ENOUGH_BITRATE
+
+
+def _json_walk_urls(obj, under: Optional[Iterable[str]] = MEDIA_KEYS) -> List[str]:
+    """
+    JSON 안의 Douyin 미디어 URL. 재생 주소가 들어 있는 키(*under*) 아래만 보고,
+    거기서 하나도 없으면 문서 전체를 본다. 충분히 좋은 재생 주소가 나오면 거기서 멈춘다.
+    """
     urls = []
-    if isinstance(obj, dict):
-        for k, v in obj.items():
-            urls.extend(_json_walk_urls(v))
-    elif isinstance(obj, list):
-        for v in obj:
-            urls.extend(_json_walk_urls(v))
-    elif isinstance(obj, str):
-        if obj.startswith("http") and ("douyin" in obj or "aweme" in obj):
-            urls.append(obj)
-    return urls
\ No newline at end of file
+    for s in JsonWalk.strings(obj, under):
+        if s.startswith("http") and ("douyin" in s or "aweme" in s):
+            urls.append(s)
+            if _is_good_enough(s):
+                break
+    if not urls and under:
+        return _json_walk_urls(obj, None)
+    return urls
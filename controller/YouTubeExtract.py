@@ -0,0 +1,69 @@
+"""
+YouTube video downloader using the in-process yt-dlp engine.
+"""
+
+import datetime
+import os
+
+from common import Extractors, YtDlpEngine
+
+FORMAT = "best[ext=mp4]/best"
+
+
+def youtube_video_id(url):
+    """Extract the YouTube video id from watch, shorts and youtu.be URLs"""
+    video_id = ""
+    if "youtu.be/" in url:
+        video_id = url.split("youtu.be/")[1].split("?")[0]
+    elif "youtube.com" in url:
+        if "v=" in url:
+            video_id = url.split("v=")[1].split("&")[0]
+        elif "/shorts/" in url:
+            video_id = url.split("/shorts/")[1].split("?")[0]
+    return video_id
+
+
+def download_youtube_video(url, output_dir=None, progress=None):
+    """
+    Download YouTube video using yt-dlp
+
+    Args:
+        url: YouTube watch, shorts or youtu.be URL
+        output_dir: Directory to save the video
+        progress: Optional callback(stage, downloaded_bytes, total_bytes)
+
+    Returns:
+        Path to downloaded video file (youtube_<id>_<timestamp>.<ext>)
+
+    Raises:
+        YtDlpError: If download fails (``kind`` says why, e.g. "private")
+    """
+    if output_dir is None:
+        output_dir = os.getcwd()
+    return resolve_youtube_video(url).download(output_dir, progress)
+
+
+def resolve_youtube_video(url):
+    """Extract a YouTube video once (direct URL if any, plus its download); see ``YtDlpEngine.resolve``"""
+    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    # Extract video ID from URL for safer filename
+    video_id = youtube_video_id(url)
+    # Download to a fixed template (pooled yt-dlp instance), then rename
+    return YtDlpEngine.resolve(
+        url, FORMAT, "temp_youtube.%(ext)s", "YouTube",
+        rename=lambda media_id, ext: f"youtube_{video_id or media_id}_{timestamp}.{ext}",
+    )
+
+
+Extractors.register(Extractors.Extractor(
+    "youtube",
+    hosts=("youtube.com", "youtu.be"),
+    fetch=download_youtube_video,
+    canonical_id=lambda url: youtube_video_id(url) or None,
+    resolve=resolve_youtube_video,
+    label="YouTube",
+    media_types=("videos", "shorts"),
+))
+
+
+__all__ = ["download_youtube_video", "resolve_youtube_video", "youtube_video_id"]
@@ -29,7 +29,7 @@ def test_download(platform_name, url, retry_count=3):
                 timeout=300
             )
 
-            if response.status_code != 200:
+            if response.status_code != 202:
                 print(f"[ERROR] Download request failed: {response.status_code}")
                 print(f"Response: {response.text}")
                 if attempt < retry_count - 1:
@@ -38,7 +38,25 @@ def test_download(platform_name, url, retry_count=3):
                     continue
                 return False
 
-            data = response.json()
+            status_url = f"{BASE_URL}{response.json().get('status_url')}"
+            print(f"[1/3] Job queued, polling: {status_url}")
+
+            data = {}
+            deadline = time.time() + 300
+            while time.time() < deadline:
+                data = requests.get(status_url, timeout=10).json()
+                if data.get('state') in ('done', 'error'):
+                    break
+                time.sleep(1)
+
+            if data.get('state') != 'done':
+                print(f"[ERROR] Download job failed: {data.get('error') or data.get('state')}")
+                if attempt < retry_count - 1:
+                    print("Retrying...")
+                    time.sleep(2)
+                    continue
+                return False
+
             print(f"[SUCCESS] Download info received")
             print(f"Platform: {data.get('platform')}")
             print(f"Filename: {data.get('filename')}")
@@ -0,0 +1,45 @@
+import unittest
+
+from common import Extractors
+
+
+def _fetch(url, output_dir=None, progress=None):
+    return ""
+
+
+class ForUrlTest(unittest.TestCase):
+    def setUp(self):
+        self._saved = (dict(Extractors._extractors), dict(Extractors._host_table))
+        Extractors.register(Extractors.Extractor("vid", hosts=("vid.example", "vid-cdn.example"), fetch=_fetch))
+        Extractors.register(Extractors.Extractor("sub", hosts=("m.vid.example",), fetch=_fetch))
+
+    def tearDown(self):
+        extractors, hosts = self._saved
+        Extractors._extractors.clear()
+        Extractors._extractors.update(extractors)
+        Extractors._host_table.clear()
+        Extractors._host_table.update(hosts)
+
+    def test_matches_domain_suffix(self):
+        self.assertEqual(Extractors.for_url("https://vid.example/v/1").name, "vid")
+        self.assertEqual(Extractors.for_url("https://www.vid.example/v/1").name, "vid")
+        self.assertEqual(Extractors.for_url("HTTPS://WWW.VID-CDN.EXAMPLE./v").name, "vid")
+        self.assertEqual(Extractors.detect_platform("vid.example/v/1"), "vid")
+
+    def test_longest_registered_suffix_wins(self):
+        self.assertEqual(Extractors.for_url("https://m.vid.example/v/1").name, "sub")
+        self.assertEqual(Extractors.for_url("https://a.m.vid.example/v/1").name, "sub")
+
+    def test_unrelated_hosts(self):
+        self.assertIsNone(Extractors.for_url("https://notvid.example/v/1"))
+        self.assertIsNone(Extractors.for_url("https://example/v/1"))
+        self.assertIsNone(Extractors.for_url("not a url"))
+        self.assertIsNone(Extractors.for_url(""))
+
+    def test_reregistering_replaces_hosts(self):
+        Extractors.register(Extractors.Extractor("vid", hosts=("vid.example",), fetch=_fetch))
+        self.assertIsNone(Extractors.for_url("https://vid-cdn.example/v"))
+
+
+if __name__ == "__main__":
+    unittest.main()
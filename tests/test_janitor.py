@@ -0,0 +1,105 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from common.Janitor import Janitor
+from common.JobQueue import JobQueue
+from common.ResultCache import ResultCache
+
+
+class JanitorTest(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.root, "_cache")
+        self.cache = ResultCache(self.cache_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def _job(self, job_id, state, size, age=0):
+        job_dir = os.path.join(self.root, job_id)
+        os.makedirs(job_dir)
+        path = os.path.join(job_dir, "v.mp4")
+        with open(path, "wb") as f:
+            f.write(b"x" * size)
+        with open(os.path.join(self.root, f"{job_id}.json"), "w", encoding="utf-8") as f:
+            json.dump({"id": job_id, "state": state, "updated_at": time.time() - age}, f)
+        past = time.time() - age
+        os.utime(job_dir, (past, past))
+        return path
+
+    def _janitor(self, max_bytes):
+        return Janitor(self.root, max_bytes=max_bytes, job_timeout=1800, skip=(self.cache_dir,),
+                       shrink=self.cache.shrink)
+
+    def test_stale_unfinished_job_is_reclaimed_and_failed(self):
+        self._job("stale", "running", 10, age=4000)
+        self._job("busy", "running", 10, age=10)
+
+        result = self._janitor(10 ** 9).sweep()
+
+        self.assertEqual(result["stale"], 1)
+        self.assertFalse(os.path.exists(os.path.join(self.root, "stale")))
+        self.assertTrue(os.path.exists(os.path.join(self.root, "busy")))
+        with open(os.path.join(self.root, "stale.json"), encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["state"], "error")
+
+    def test_hard_links_are_counted_once(self):
+        path = self._job("cached", "done", 1000, age=20)
+        self.cache.put(("tiktok", "cached"), path)
+        self._job("plain", "done", 1000, age=10)
+
+        janitor = self._janitor(1500)
+        result = janitor.sweep()
+
+        # 캐시와 하드링크된 작업을 지워도 공간이 생기지 않으므로 다음 작업까지 지운다
+        self.assertEqual(result["quota"], 2)
+        self.assertEqual(result["bytes"], 1000)
+        self.assertLess(janitor.stats()["usage_bytes"], 1500)
+        self.assertIsNotNone(self.cache.get(("tiktok", "cached")))
+
+    def test_cache_is_shrunk_when_jobs_are_not_enough(self):
+        path = self._job("cached", "done", 1000, age=20)
+        self.cache.put(("tiktok", "cached"), path)
+        self._job("busy", "running", 1000, age=10)
+
+        result = self._janitor(1500).sweep()
+
+        self.assertEqual(result["bytes"], 1000)
+        self.assertIsNone(self.cache.get(("tiktok", "cached")))
+        self.assertTrue(os.path.exists(os.path.join(self.root, "busy")))
+
+    def test_owning_queue_reports_a_failed_stale_job(self):
+        release = threading.Event()
+        started = threading.Event()
+        queue = JobQueue(self.root, max_workers=1)
+        self.addCleanup(release.set)
+
+        def stuck(url, platform, download_dir, progress):
+            started.set()
+            release.wait(5)
+            return None
+
+        job_id = queue.submit("https://example.com/v", "tiktok", stuck)["id"]
+        self.assertTrue(started.wait(5))
+        # 워커가 멈춘 지 오래된 작업처럼 만든다
+        with queue._lock:
+            queue._jobs[job_id]["updated_at"] -= 4000
+            snapshot = dict(queue._jobs[job_id])
+        queue._save(snapshot)
+        past = time.time() - 4000
+        os.utime(os.path.join(self.root, job_id), (past, past))
+
+        self.assertEqual(self._janitor(10 ** 9).sweep()["stale"], 1)
+
+        self.assertEqual(queue.get(job_id)["state"], "error")
+        self.assertEqual(queue.get(job_id)["error_kind"], "timeout")
+        self.assertEqual(queue.pending_count(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from common import PartialDownload as PD
+
+
+class RangeMathTest(unittest.TestCase):
+    def test_add_range_merges_overlaps_and_neighbours(self):
+        ranges = PD.add_range([], 10, 20)
+        ranges = PD.add_range(ranges, 0, 5)
+        ranges = PD.add_range(ranges, 5, 10)
+        self.assertEqual(ranges, [[0, 20]])
+        self.assertEqual(PD.add_range([[0, 10]], 30, 40), [[0, 10], [30, 40]])
+        self.assertEqual(PD.add_range([[0, 10]], 5, 5), [[0, 10]])
+
+    def test_missing_ranges(self):
+        state = {"ranges": [[0, 10], [20, 30]]}
+        self.assertEqual(PD.missing_ranges(state, 40), [(10, 20), (30, 40)])
+        self.assertEqual(PD.missing_ranges({"ranges": []}, 5), [(0, 5)])
+        self.assertEqual(PD.missing_ranges({"ranges": [[0, 5]]}, 5), [])
+        self.assertEqual(PD.completed_bytes(state), 20)
+
+    def test_resume_headers(self):
+        self.assertEqual(PD.resume_headers({"etag": '"abc"'}, 100),
+                         {"Range": "bytes=100-", "If-Range": '"abc"'})
+        self.assertEqual(PD.resume_headers({"last_modified": "Mon"}, 0, 99),
+                         {"Range": "bytes=0-99", "If-Range": "Mon"})
+        self.assertEqual(PD.resume_headers({}, 5), {"Range": "bytes=5-"})
+
+    def test_new_state_reads_total(self):
+        self.assertEqual(PD.new_state("u", {"Content-Range": "bytes 0-0/1234"})["total"], 1234)
+        self.assertEqual(PD.new_state("u", {"Content-Length": "99"})["total"], 99)
+        self.assertIsNone(PD.new_state("u", {"Content-Range": "bytes 0-0/*"})["total"])
+        self.assertEqual(PD.content_range_start({"Content-Range": "bytes 512-1023/2048"}), 512)
+
+    def test_validators_match(self):
+        state = {"url": "u", "etag": '"a"', "last_modified": None, "total": 100}
+        self.assertTrue(PD.validators_match(state, {"ETag": '"a"', "Content-Range": "bytes 50-99/100"}))
+        self.assertFalse(PD.validators_match(state, {"ETag": '"b"'}))
+        self.assertFalse(PD.validators_match(state, {"Content-Range": "bytes 50-99/200"}))
+
+
+class ContiguousEndTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.dest = os.path.join(self.tmp, "v.mp4")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_bounded_by_part_file(self):
+        with open(PD.part_path(self.dest), "wb") as f:
+            f.write(b"x" * 50)
+        self.assertEqual(PD.contiguous_end({"ranges": [[0, 80]]}, self.dest), 50)
+        self.assertEqual(PD.contiguous_end({"ranges": [[0, 30]]}, self.dest), 30)
+        self.assertEqual(PD.contiguous_end({"ranges": [[10, 30]]}, self.dest), 0)
+
+    def test_open_part_drops_unsaved_tail(self):
+        with open(PD.part_path(self.dest), "wb") as f:
+            f.write(b"a" * 10 + b"junk")
+        with PD.open_part(self.dest, 10) as f:
+            f.write(b"b" * 5)
+        with open(PD.part_path(self.dest), "rb") as f:
+            self.assertEqual(f.read(), b"a" * 10 + b"b" * 5)
+
+        with PD.open_part(self.dest, 0) as f:
+            f.write(b"c")
+        self.assertEqual(os.path.getsize(PD.part_path(self.dest)), 1)
+
+    def test_state_round_trip(self):
+        with open(PD.part_path(self.dest), "wb"):
+            pass
+        PD.save_state(self.dest, {"url": "u", "ranges": [[0, 1]]})
+        self.assertEqual(PD.load_state(self.dest, "u")["ranges"], [[0, 1]])
+        self.assertIsNone(PD.load_state(self.dest, "other"))
+        PD.discard(self.dest)
+        self.assertIsNone(PD.load_state(self.dest, "u"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import shutil
+import tempfile
+import time
+import unittest
+
+from common.ResolveCache import EXPIRY_MARGIN, ResolveCache, make_entry, url_expiry
+
+
+class UrlExpiryTest(unittest.TestCase):
+    def test_decimal_seconds(self):
+        self.assertEqual(url_expiry("https://v16-webapp.tiktok.com/v.mp4?x-expires=1700000000&sig=a"), 1700000000.0)
+        self.assertEqual(url_expiry("https://rr1.googlevideo.com/videoplayback?expire=1700000001"), 1700000001.0)
+
+    def test_milliseconds_are_converted(self):
+        self.assertEqual(url_expiry("https://v.douyinvod.com/v.mp4?Expires=1700000000123"), 1700000000.123)
+
+    def test_hex_oe(self):
+        self.assertEqual(url_expiry("https://scontent.cdninstagram.com/v.mp4?oe=6553F100&_nc_ht=x"),
+                         float(0x6553F100))
+
+    def test_unknown_or_malformed(self):
+        self.assertIsNone(url_expiry("https://example.com/v.mp4"))
+        self.assertIsNone(url_expiry("https://example.com/v.mp4?expires=soon"))
+        self.assertIsNone(url_expiry("https://example.com/v.mp4?oe=zz"))
+
+
+class MakeEntryTest(unittest.TestCase):
+    def test_signed_url_expires_before_signature(self):
+        signed = int(time.time()) + 600
+        entry = make_entry("tiktok", (f"https://cdn/v.mp4?x-expires={signed}", "a.mp4", {}), ttl=60, max_ttl=3600)
+        self.assertEqual(entry["expires_at"], signed - EXPIRY_MARGIN)
+
+    def test_signature_is_capped_by_max_ttl(self):
+        signed = int(time.time()) + 10 ** 6
+        entry = make_entry("tiktok", (f"https://cdn/v.mp4?x-expires={signed}", "a.mp4", {}), ttl=60, max_ttl=3600)
+        self.assertLessEqual(entry["expires_at"], time.time() + 3600)
+
+    def test_unsigned_url_uses_ttl(self):
+        entry = make_entry("twitter", ("https://video.twimg.com/v.mp4", "a.mp4", {"Referer": "x"}), ttl=60, max_ttl=3600)
+        self.assertAlmostEqual(entry["expires_at"], time.time() + 60, delta=5)
+        self.assertEqual(entry["headers"], {"Referer": "x"})
+
+
+class ResolveCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.cache = ResolveCache(self.tmp, ttl=60)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_round_trip_and_expiry(self):
+        entry = self.cache.entry("twitter", ("https://video.twimg.com/v.mp4", "a.mp4", {}))
+        self.assertTrue(self.cache.put(("twitter", "1"), entry))
+        self.assertEqual(self.cache.get(("twitter", "1"))["url"], "https://video.twimg.com/v.mp4")
+
+        expired = make_entry("tiktok", (f"https://cdn/v.mp4?x-expires={int(time.time())}", "a.mp4", {}),
+                             ttl=60, max_ttl=3600)
+        self.assertFalse(self.cache.put(("tiktok", "2"), expired))
+        self.assertIsNone(self.cache.get(("tiktok", "2")))
+        self.assertEqual(self.cache.stats(), {"hits": 1, "misses": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
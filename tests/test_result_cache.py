@@ -0,0 +1,93 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from common.ResultCache import ResultCache
+
+
+class ResultCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.root = os.path.join(self.tmp, "_cache")
+        self.cache = ResultCache(self.root, ttl=3600, max_bytes=1000)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _file(self, name, size):
+        path = os.path.join(self.tmp, name)
+        with open(path, "wb") as f:
+            f.write(b"x" * size)
+        return path
+
+    def test_put_then_fetch_into_links_file(self):
+        self.cache.put(("tiktok", "123"), self._file("a.mp4", 10))
+        job_dir = os.path.join(self.tmp, "job")
+        os.makedirs(job_dir)
+
+        path = self.cache.fetch_into(("tiktok", "123"), job_dir)
+
+        self.assertEqual(path, os.path.join(job_dir, "a.mp4"))
+        self.assertEqual(os.path.getsize(path), 10)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 0))
+
+    def test_missing_and_unsafe_keys_miss(self):
+        self.assertIsNone(self.cache.get(("tiktok", "nope")))
+        self.assertIsNone(self.cache.get(("tiktok", "../etc")))
+        self.assertIsNone(self.cache.put(("tiktok", "../etc"), self._file("a.mp4", 10)))
+        self.assertEqual(self.cache.misses, 2)
+
+    def test_expired_entry_is_dropped(self):
+        self.cache.put(("tiktok", "old"), self._file("a.mp4", 10))
+        cached = self.cache.get(("tiktok", "old"))
+        past = time.time() - 7200
+        os.utime(cached, (past, past))
+
+        self.assertIsNone(self.cache.get(("tiktok", "old")))
+        self.assertFalse(os.path.exists(os.path.dirname(cached)))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        self.cache.put(("tiktok", "a"), self._file("a.mp4", 400))
+        self.cache.put(("tiktok", "b"), self._file("b.mp4", 400))
+        past = time.time() - 60
+        os.utime(os.path.join(self.root, "tiktok", "b"), (past, past))
+        self.cache.get(("tiktok", "a"))
+
+        self.cache.put(("tiktok", "c"), self._file("c.mp4", 400))
+
+        self.assertIsNotNone(self.cache.get(("tiktok", "a")))
+        self.assertIsNone(self.cache.get(("tiktok", "b")))
+        self.assertIsNotNone(self.cache.get(("tiktok", "c")))
+
+    def test_oversized_file_is_not_stored(self):
+        self.assertIsNone(self.cache.put(("tiktok", "big"), self._file("big.mp4", 2000)))
+        self.assertEqual(self.cache.stats()["entries"], 0)
+
+    def test_aliases(self):
+        self.cache.remember("https://vt.tiktok.com/x", ("tiktok", "1"))
+        self.assertEqual(self.cache.lookup_alias("https://vt.tiktok.com/x"), ("tiktok", "1"))
+        self.assertIsNone(self.cache.lookup_alias("https://vt.tiktok.com/y"))
+
+    def test_counters_are_exact_under_concurrency(self):
+        self.cache.put(("tiktok", "hot"), self._file("hot.mp4", 10))
+
+        def hammer():
+            for _ in range(200):
+                self.cache.get(("tiktok", "hot"))
+                self.cache.get(("tiktok", "cold"))
+
+        threads = [threading.Thread(target=hammer) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        stats = self.cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1600, 1600))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import threading
+import unittest
+
+from common.SingleFlight import SingleFlight
+
+
+class SingleFlightTest(unittest.TestCase):
+    def setUp(self):
+        self.flight = SingleFlight()
+        self.release = threading.Event()
+        self.waiting = threading.Semaphore(0)
+
+    def _followers(self, count, fn, results):
+        def follow():
+            try:
+                results.append(self.flight.do("k", fn, timeout=5, on_wait=self.waiting.release))
+            except Exception as e:
+                results.append(e)
+
+        threads = [threading.Thread(target=follow) for _ in range(count)]
+        for t in threads:
+            t.start()
+        for _ in threads:
+            self.assertTrue(self.waiting.acquire(timeout=5))
+        return threads
+
+    def test_waiters_share_the_leader_result(self):
+        calls = []
+
+        def fn():
+            calls.append(1)
+            self.release.wait(5)
+            return "file.mp4"
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(self.flight.do("k", fn)))
+        leader.start()
+        while self.flight.in_flight() == 0:
+            pass
+        followers = self._followers(3, fn, results)
+        self.release.set()
+        for t in [leader] + followers:
+            t.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(sorted(results), [("file.mp4", False)] + [("file.mp4", True)] * 3)
+        self.assertEqual(self.flight.coalesced, 3)
+        self.assertEqual(self.flight.in_flight(), 0)
+
+    def test_leader_error_is_raised_in_waiters(self):
+        def fn():
+            self.release.wait(5)
+            raise ValueError("boom")
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(self._call(fn)))
+        leader.start()
+        while self.flight.in_flight() == 0:
+            pass
+        followers = self._followers(2, fn, results)
+        self.release.set()
+        for t in [leader] + followers:
+            t.join()
+
+        self.assertEqual(len(results), 3)
+        self.assertTrue(all(isinstance(r, ValueError) for r in results))
+        self.assertEqual(self.flight.in_flight(), 0)
+
+    def _call(self, fn):
+        try:
+            return self.flight.do("k", fn)
+        except Exception as e:
+            return e
+
+    def test_waiter_times_out(self):
+        leader = threading.Thread(target=lambda: self.flight.do("k", lambda: self.release.wait(5)))
+        leader.start()
+        while self.flight.in_flight() == 0:
+            pass
+        with self.assertRaises(TimeoutError):
+            self.flight.do("k", lambda: None, timeout=0.05)
+        self.release.set()
+        leader.join()
+
+    def test_follow_does_not_block(self):
+        results = []
+        leader = threading.Thread(target=lambda: results.append(
+            self.flight.follow("k", lambda: self.release.wait(5) and "file.mp4", None)))
+        leader.start()
+        while self.flight.in_flight() == 0:
+            pass
+        shared = []
+        self.assertEqual(self.flight.follow("k", lambda: "again", lambda r, e: shared.append((r, e))), (None, True))
+        self.assertEqual(shared, [])
+        self.release.set()
+        leader.join()
+
+        self.assertEqual(results, [("file.mp4", False)])
+        self.assertEqual(shared, [("file.mp4", None)])
+        self.assertEqual(self.flight.in_flight(), 0)
+
+    def test_sequential_calls_run_again(self):
+        self.assertEqual(self.flight.do("k", lambda: 1), (1, False))
+        self.assertEqual(self.flight.do("k", lambda: 2), (2, False))
+
+
+if __name__ == "__main__":
+    unittest.main()
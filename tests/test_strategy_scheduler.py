@@ -0,0 +1,31 @@
+import unittest
+from unittest import mock
+
+from common.StrategyScheduler import StrategyScheduler
+
+
+class StrategySchedulerTest(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = StrategyScheduler("test", ["a", "b", "c"], min_samples=3, state_path="")
+        for _ in range(3):
+            self.scheduler.record("a", True, 0.1)
+            self.scheduler.record("b", True, 0.2)
+            self.scheduler.record("c", False, 0.1)
+
+    def test_demoted_strategy_is_skipped(self):
+        with mock.patch("common.StrategyScheduler.random.random", return_value=0.99):
+            self.assertEqual(self.scheduler.order(), ["a", "b"])
+
+    def test_exploring_tries_a_demoted_strategy_first(self):
+        with mock.patch("common.StrategyScheduler.random.random", return_value=0.0):
+            self.assertEqual(self.scheduler.order(), ["c", "a", "b"])
+
+    def test_all_demoted_are_still_tried(self):
+        scheduler = StrategyScheduler("test", ["a", "b"], min_samples=1, state_path="")
+        scheduler.record("a", False, 0.1)
+        scheduler.record("b", False, 0.2)
+        self.assertEqual(scheduler.order(), ["a", "b"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,28 @@
+import unittest
+
+from controller.ThreadsExtract import _scan_script
+
+DOC_ID = "2222222222222222"
+
+
+class ScanScriptTest(unittest.TestCase):
+    def test_named_query_is_not_swallowed_by_generic_pattern(self):
+        body = ('__d("X_threadsRelayOperation",[],function(a,b,c,d,e,f){e.exports="abc"});'
+                f'__d("BarcelonaPostPageQuery_threadsRelayOperation",[],function(a,b,c,d,e,f){{e.exports="{DOC_ID}"}})')
+        self.assertEqual(_scan_script(body), [(DOC_ID, True)])
+
+    def test_generic_ids_are_low_confidence(self):
+        body = '__d("Y_threadsRelayOperation",[],function(a,b,c,d,e,f){e.exports="3333333333333333"});'
+        self.assertEqual(_scan_script(body), [("3333333333333333", False)])
+
+    def test_named_before_generic(self):
+        body = ('{"doc_id":"4444444444444444"};'
+                f'__d("PostAppThreadQuery_threadsRelayOperation",[],function(){{e.exports="{DOC_ID}"}})')
+        self.assertEqual(_scan_script(body), [(DOC_ID, True), ("4444444444444444", False)])
+
+    def test_nothing_found(self):
+        self.assertEqual(_scan_script("var x = 1;"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
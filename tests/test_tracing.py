@@ -0,0 +1,46 @@
+import unittest
+from concurrent.futures import Future
+from unittest import mock
+
+from common import Tracing
+
+
+class FinishWithTest(unittest.TestCase):
+    def setUp(self):
+        self.finished = []
+
+        def listener(kind, span, attrs):
+            if kind == "trace":
+                self.finished.append(span)
+
+        patcher = mock.patch.object(Tracing, "_listeners", [listener])
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(Tracing, "TRACE_LOG", False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_trace_ends_when_future_is_done(self):
+        future = Future()
+        with Tracing.trace("job"):
+            Tracing.finish_with(future)
+        self.assertEqual(self.finished, [])
+        future.set_exception(TimeoutError("leader timed out"))
+        self.assertEqual([s.error for s in self.finished], ["TimeoutError"])
+
+    def test_trace_ends_immediately_without_future(self):
+        with Tracing.trace("job"):
+            pass
+        self.assertEqual(len(self.finished), 1)
+        self.assertIsNone(self.finished[0].error)
+
+    def test_error_in_block_is_not_deferred(self):
+        with self.assertRaises(ValueError):
+            with Tracing.trace("job"):
+                Tracing.finish_with(Future())
+                raise ValueError("boom")
+        self.assertEqual([s.error for s in self.finished], ["ValueError"])
+
+
+if __name__ == "__main__":
+    unittest.main()
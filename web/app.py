@@ -9,20 +9,37 @@ import sys
 import uuid
 import json
 import shutil
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError
 from typing import Optional
 from pathlib import Path
+from urllib.parse import quote
 from flask import Flask, render_template, request, jsonify, send_file, session, Response
 from werkzeug.utils import secure_filename
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from controller.DouyinExtract import download_tiktok_douyin_video
-from controller.TikTokExtractYTDLP import download_tiktok_video
-from controller.ThreadsExtract import download_threads_video, ThreadsDownloadError
-from controller.TwitterExtract import download_twitter_video
-from controller.InstagramExtract import download_instagram_media
-import subprocess
+# Importing the controllers registers their extractors (in /api/platforms order)
+from controller import (  # noqa: F401
+    TikTokExtractYTDLP,
+    DouyinExtract,
+    ThreadsExtract,
+    TwitterExtract,
+    InstagramExtract,
+    YouTubeExtract,
+)
+from common.JobQueue import JobQueue, QueueFullError, JOB_DONE, JOB_ERROR
+from common.ResultCache import ResultCache, link_or_copy
+from common.SingleFlight import SingleFlight
+from common.StreamProxy import StreamTargets
+from common.ResolveCache import ResolveCache
+from common.Janitor import Janitor, mark_served
+from common.YtDlpEngine import get_engine
+from common.BrowserPool import get_pool as get_browser_pool
+from common import Extractors, Metrics, PartialDownload, StreamProxy, Tool, Tracing
+import re
 
 app = Flask(__name__)
 app.config['MAX_CONTENT_LENGTH'] = 500 * 1024 * 1024  # 500MB max
@@ -31,9 +48,131 @@ app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'dev-secret-key-change-i
 app.config['LOCALES_FOLDER'] = os.path.join(os.path.dirname(__file__), 'locales')
 app.config['CONFIG_FOLDER'] = os.path.join(os.path.dirname(__file__), 'config')
 
+app.config['DOWNLOAD_WORKERS'] = int(os.environ.get('DOWNLOAD_WORKERS', 4))
+app.config['DOWNLOAD_QUEUE_SIZE'] = int(os.environ.get('DOWNLOAD_QUEUE_SIZE', 64))
+# How long a job attached to another job's download of the same media waits for it
+app.config['COALESCE_TIMEOUT'] = int(os.environ.get('COALESCE_TIMEOUT', 900))
+# An SSE response holds a server thread; end it after this long and let EventSource reconnect
+app.config['JOB_EVENTS_MAX_STREAM'] = int(os.environ.get('JOB_EVENTS_MAX_STREAM', 60))
+app.config['JOB_EVENTS_RETRY_MS'] = int(os.environ.get('JOB_EVENTS_RETRY_MS', 1000))
+app.config['CACHE_FOLDER'] = os.path.join(app.config['DOWNLOAD_FOLDER'], '_cache')
+app.config['RESULT_CACHE_TTL'] = int(os.environ.get('RESULT_CACHE_TTL', 6 * 3600))
+app.config['RESULT_CACHE_MAX_BYTES'] = int(os.environ.get('RESULT_CACHE_MAX_BYTES', 1024 * 1024 * 1024))
+# 'file' = download to disk then serve, 'stream' = pipe the CDN response straight to the client
+app.config['DOWNLOAD_MODE'] = os.environ.get('DOWNLOAD_MODE', 'file')
+app.config['STREAM_FOLDER'] = os.path.join(app.config['DOWNLOAD_FOLDER'], '_streams')
+app.config['STREAM_TARGET_TTL'] = int(os.environ.get('STREAM_TARGET_TTL', 600))
+app.config['RESOLVE_FOLDER'] = os.path.join(app.config['DOWNLOAD_FOLDER'], '_resolved')
+# Used for direct URLs whose signature does not carry an expiry time
+app.config['RESOLVE_CACHE_TTL'] = int(os.environ.get('RESOLVE_CACHE_TTL', 900))
+app.config['RESOLVE_CACHE_MAX_TTL'] = int(os.environ.get('RESOLVE_CACHE_MAX_TTL', 6 * 3600))
+app.config['DOWNLOAD_TTL'] = int(os.environ.get('DOWNLOAD_TTL', 3600))
+app.config['DOWNLOAD_MAX_BYTES'] = int(os.environ.get('DOWNLOAD_MAX_BYTES', 2 * 1024 * 1024 * 1024))
+app.config['SERVED_GRACE'] = int(os.environ.get('SERVED_GRACE', 300))
+app.config['JANITOR_INTERVAL'] = int(os.environ.get('JANITOR_INTERVAL', 60))
+# A queued/running job whose state has not changed for this long is treated as dead
+app.config['JOB_TIMEOUT'] = int(os.environ.get('JOB_TIMEOUT', 1800))
+# Per-worker metric snapshots, summed by /metrics so a scrape covers every worker
+app.config['METRICS_FOLDER'] = os.path.join(app.config['DOWNLOAD_FOLDER'], '_metrics')
+app.config['METRICS_INTERVAL'] = int(os.environ.get('METRICS_INTERVAL', 10))
+
 # Create download folder
 os.makedirs(app.config['DOWNLOAD_FOLDER'], exist_ok=True)
 
+# Background download jobs (sized independently of the HTTP worker threads)
+job_queue = JobQueue(
+    app.config['DOWNLOAD_FOLDER'],
+    max_workers=app.config['DOWNLOAD_WORKERS'],
+    max_pending=app.config['DOWNLOAD_QUEUE_SIZE'],
+)
+
+# Finished downloads keyed by (platform, canonical media id)
+result_cache = ResultCache(
+    app.config['CACHE_FOLDER'],
+    ttl=app.config['RESULT_CACHE_TTL'],
+    max_bytes=app.config['RESULT_CACHE_MAX_BYTES'],
+)
+
+# Coalesces concurrent downloads of the same media within this worker
+downloads_in_flight = SingleFlight()
+
+# Resolved direct media URLs for stream mode (shared across workers)
+stream_targets = StreamTargets(app.config['STREAM_FOLDER'], ttl=app.config['STREAM_TARGET_TTL'])
+
+# Resolved direct media URLs keyed by (platform, canonical media id), valid until they expire
+resolve_cache = ResolveCache(
+    app.config['RESOLVE_FOLDER'],
+    ttl=app.config['RESOLVE_CACHE_TTL'],
+    max_ttl=app.config['RESOLVE_CACHE_MAX_TTL'],
+)
+
+# Shared in-process yt-dlp instances; extractors are loaded off the request path
+ytdlp_engine = get_engine()
+threading.Thread(
+    target=ytdlp_engine.warm,
+    args=(("TikTok", "Twitter", "Instagram", "Youtube"),),
+    name="ytdlp-warm",
+    daemon=True,
+).start()
+
+# Warm headless Chrome drivers for the Threads browser fallback (started on first use)
+browser_pool = get_browser_pool()
+
+# Background cleanup of job directories (TTL, size quota, delete after serve)
+janitor = Janitor(
+    app.config['DOWNLOAD_FOLDER'],
+    ttl=app.config['DOWNLOAD_TTL'],
+    max_bytes=app.config['DOWNLOAD_MAX_BYTES'],
+    served_grace=app.config['SERVED_GRACE'],
+    interval=app.config['JANITOR_INTERVAL'],
+    skip=(app.config['CACHE_FOLDER'], app.config['STREAM_FOLDER'], app.config['RESOLVE_FOLDER'],
+          app.config['METRICS_FOLDER']),
+    hooks=(result_cache.evict, stream_targets.prune, resolve_cache.prune, job_queue.prune, browser_pool.reap),
+    job_timeout=app.config['JOB_TIMEOUT'],
+    shrink=result_cache.shrink,
+).start()
+
+# Prometheus metrics: traced stages feed the histograms, the rest is read at scrape time
+metrics = Metrics.REGISTRY
+metrics.interval = app.config['METRICS_INTERVAL']
+metrics.share(app.config['METRICS_FOLDER'])
+Tracing.add_listener(Metrics.observe_span)
+
+def _download_disk_usage():
+    usage = shutil.disk_usage(app.config['DOWNLOAD_FOLDER'])
+    return {'used': usage.used, 'free': usage.free, 'total': usage.total}
+
+metrics.gauge('jobs', 'Download jobs by state', ('state',), fn=job_queue.state_counts)
+metrics.gauge('queue_capacity', 'Maximum number of pending download jobs',
+              fn=lambda: job_queue.max_pending)
+metrics.counter_callback('cache_hits_total', 'Cache hits by cache', ('cache',), fn=lambda: {
+    'result': result_cache.hits, 'resolve': resolve_cache.stats()['hits']})
+metrics.counter_callback('cache_misses_total', 'Cache misses by cache', ('cache',), fn=lambda: {
+    'result': result_cache.misses, 'resolve': resolve_cache.stats()['misses']})
+metrics.gauge('result_cache_bytes', 'Bytes held by the result cache', fn=lambda: result_cache.stats()['bytes'],
+              shared=True)
+metrics.gauge('download_fs_bytes', 'Usage of the filesystem holding the download folder', ('kind',),
+              fn=_download_disk_usage, shared=True)
+metrics.counter_callback('janitor_reclaimed_bytes_total', 'Bytes deleted from the download folder by the janitor',
+                         fn=lambda: janitor.stats()['bytes_reclaimed'])
+metrics.gauge('ytdlp_instances', 'Pooled yt-dlp instances by state', ('state',),
+              fn=lambda: {k: v for k, v in ytdlp_engine.stats().items() if k != 'created'})
+metrics.gauge('browser_drivers', 'Headless Chrome drivers by state', ('state',),
+              fn=lambda: {k: browser_pool.stats()[k] for k in ('active', 'idle')})
+
+@app.before_request
+def start_request_timer():
+    request.environ['metrics.start'] = time.monotonic()
+
+@app.after_request
+def record_request_metrics(response):
+    started = request.environ.get('metrics.start')
+    if started is not None:
+        Metrics.observe_request(request.endpoint or 'unmatched', request.method,
+                                response.status_code, time.monotonic() - started,
+                                streamed=response.is_streamed)
+    return response
+
 # Language configuration
 SUPPORTED_LANGUAGES = [
     {'code': 'ko', 'name': '한국어', 'flag': '🇰🇷'},
@@ -176,21 +315,19 @@ def get_user_language():
 
 def detect_platform(url):
     """Detect video platform from URL"""
-    url_lower = url.lower()
-
-    if "tiktok.com" in url_lower:
-        return "tiktok"
-    elif "douyin.com" in url_lower:
-        return "douyin"
-    elif "threads.net" in url_lower or "threads.com" in url_lower:
-        return "threads"
-    elif "twitter.com" in url_lower or "x.com" in url_lower:
-        return "twitter"
-    elif "instagram.com" in url_lower:
-        return "instagram"
-    elif "youtube.com" in url_lower or "youtu.be" in url_lower:
-        return "youtube"
-    else:
+    return Extractors.detect_platform(url)
+
+YTDLP_FILENAME_ID_RE = re.compile(r'^(?:tiktok|twitter|instagram)_([A-Za-z0-9_\-]+)\.\w+$')
+
+# A fetched file smaller than this that is not served as video is an error page
+MIN_DIRECT_VIDEO_BYTES = 200_000
+
+def canonical_media_id(url, platform):
+    """Return the (platform, media id) cache key for *url*, or None if unknown"""
+    try:
+        return Extractors.canonical_key(url, platform)
+    except Exception as e:
+        print(f"[Cache] 미디어 ID 추출 실패: {e}")
         return None
 
 
@@ -231,9 +368,293 @@ def get_translations(lang_code):
     translations = load_translation(lang_code)
     return jsonify(translations)
 
+def run_platform_download(url, platform, download_dir, progress=None):
+    """Run the registered extractor for *platform* and return the downloaded file path"""
+    extractor = Extractors.get(platform)
+    if extractor is None:
+        raise Exception(f"Unsupported platform: {platform}")
+
+    with Tracing.span('extract', extractor=extractor.name):
+        filepath = extractor.fetch(url, download_dir, progress)
+    print(f"[{extractor.label}] Downloaded: {filepath}")
+    return filepath
+
+def resolve_media(url, platform, key=None):
+    """
+    Resolve phase: return (entry, resolution, cached) for *url*.
+
+    *entry* is a ResolveCache entry (url, filename, headers, expires_at) or
+    None when the media has no direct URL (HLS, formats that need merging).
+    Unexpired resolutions are reused (*cached*, no *resolution*), so a
+    popular video skips scraping entirely.  Otherwise the extractor scrapes
+    the post once and *resolution* can finish the download from that data.
+    """
+    key = key or result_cache.lookup_alias(url) or canonical_media_id(url, platform)
+    if key:
+        entry = resolve_cache.get(key)
+        if entry:
+            print(f"[Resolve] Cache hit: {key[0]}/{key[1]}")
+            Tracing.annotate(resolve_cache='hit')
+            return entry, None, True
+    entry, resolution = resolve_fresh(url, platform, key)
+    return entry, resolution, False
+
+def resolve_fresh(url, platform, key=None):
+    """Scrape *url* with its extractor: (entry or None, resolution or None)"""
+    extractor = Extractors.get(platform)
+    if extractor is None or extractor.resolve is None:
+        return None, None
+    Tracing.annotate(resolve_cache='miss')
+    with Tracing.span('resolve', extractor=extractor.name):
+        resolution = extractor.resolve(url)
+    if not resolution.target:
+        return None, resolution
+
+    entry = resolve_cache.entry(platform, resolution.target)
+    if not key:
+        m = YTDLP_FILENAME_ID_RE.match(resolution.target[1])
+        key = (platform, m.group(1)) if m else None
+    if key:
+        resolve_cache.put(key, entry)
+        result_cache.remember(url, key)
+    return entry, resolution
+
+def fetch_resolved(url, platform, key, download_dir, progress=None, resolution=None):
+    """
+    Fetch phase: download *url* into *download_dir* and return the file path.
+
+    An unexpired cached direct URL is fetched as is; when the CDN no longer
+    serves it the entry is dropped and the post is resolved again.  A fresh
+    resolution (or the given *resolution*) is downloaded by the extractor
+    itself, which handles HLS, merged formats and the platform's file
+    names, so a job scrapes the post at most once.  Extractors without
+    ``resolve`` run their own download.
+    """
+    Tool.report_progress(progress, "resolve")
+    if resolution is None:
+        entry = resolve_cache.get(key) if key else None
+        if entry:
+            print(f"[Resolve] Cache hit: {key[0]}/{key[1]}")
+            Tracing.annotate(resolve_cache='hit')
+            filepath = fetch_direct(entry, platform, download_dir, progress)
+            if filepath:
+                return filepath
+            resolve_cache.invalidate(key)
+        _, resolution = resolve_fresh(url, platform, key)
+        if resolution is None:
+            return run_platform_download(url, platform, download_dir, progress)
+
+    with Tracing.span('extract', extractor=platform):
+        filepath = resolution.download(download_dir, progress)
+    print(f"[Resolve] Downloaded {platform}: {os.path.basename(filepath)}")
+    return filepath
+
+def fetch_direct(entry, platform, download_dir, progress=None):
+    """Download a cached resolution's direct URL; None when the CDN no longer serves it"""
+    filepath = os.path.join(download_dir, Tool.sanitize_filename(entry['filename']) or f"{platform}.mp4")
+    headers = dict(entry['headers'], **{'Accept-Encoding': 'identity'})
+    try:
+        # A stale cached URL fails fast instead of being retried
+        size, ctype, _ = PartialDownload.stream_download(entry['url'], filepath, headers, progress, retries=0)
+        if size < MIN_DIRECT_VIDEO_BYTES and 'video' not in ctype and 'octet-stream' not in ctype:
+            raise Exception(f"unexpected response ({ctype or 'no content type'}, {size} bytes)")
+    except Exception as e:
+        print(f"[Resolve] Direct fetch failed (cached URL): {e}")
+        for path in (filepath, PartialDownload.part_path(filepath), PartialDownload.state_path(filepath)):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        return None
+
+    print(f"[Resolve] Fetched {platform} directly: {os.path.basename(filepath)}")
+    return filepath
+
+def download_with_cache(url, platform, download_dir, progress=None):
+    """Job entry point: run the download and log its stage timings as one trace"""
+    with Tracing.trace('job', platform=platform, job_id=os.path.basename(download_dir)):
+        return _download_with_cache(url, platform, download_dir, progress)
+
+def _download_with_cache(url, platform, download_dir, progress=None, resolution=None):
+    """
+    Serve *url* from the result cache, downloading and caching it on a miss.
+    *resolution* is an extractor resolution of *url* the caller already has.
+    """
+    with Tracing.span('cache.lookup') as sp:
+        key = result_cache.lookup_alias(url) or canonical_media_id(url, platform)
+        cached = result_cache.fetch_into(key, download_dir) if key else None
+        sp.set(hit=bool(cached))
+    if cached:
+        size = os.path.getsize(cached)
+        print(f"[Cache] Hit: {key[0]}/{key[1]}")
+        Tracing.annotate(cache='hit', bytes=size)
+        Tool.report_progress(progress, "cache", size, size)
+        return cached
+
+    def fetch():
+        filepath = fetch_resolved(url, platform, key, download_dir, progress, resolution)
+
+        if filepath and os.path.exists(filepath):
+            cache_key = key
+            if not cache_key:
+                # yt-dlp names files <platform>_<id>.<ext>, so the id is known now
+                m = YTDLP_FILENAME_ID_RE.match(os.path.basename(filepath))
+                cache_key = (platform, m.group(1)) if m else None
+            if cache_key:
+                with Tracing.span('cache.store'):
+                    result_cache.put(cache_key, filepath)
+                result_cache.remember(url, cache_key)
+
+        return filepath
+
+    # Concurrent requests for the same media share a single download. A follower
+    # does not hold a worker: its job finishes from the leader's callback.
+    follower = Future()
+    timeout = app.config['COALESCE_TIMEOUT']
+
+    def settle(setter, value):
+        timer.cancel()
+        try:
+            setter(value)
+        except InvalidStateError:
+            pass  # Already timed out
+
+    def attach(filepath, error):
+        try:
+            if error is not None:
+                raise error
+            if not filepath or not os.path.exists(filepath):
+                raise Exception("Download failed - no file created")
+            new_path = os.path.join(download_dir, os.path.basename(filepath))
+            link_or_copy(filepath, new_path)
+            size = os.path.getsize(new_path)
+            print(f"[Download] Shared in-flight result: {os.path.basename(filepath)}")
+            Tool.report_progress(progress, "shared", size, size)
+            settle(follower.set_result, new_path)
+        except Exception as e:
+            settle(follower.set_exception, e)
+
+    timer = threading.Timer(timeout, settle, (follower.set_exception, TimeoutError(
+        f"Timed out after {timeout}s waiting for the in-flight download of {url}")))
+    timer.daemon = True
+
+    filepath, shared = downloads_in_flight.follow(key or (platform, url), fetch, attach)
+    if not shared:
+        Tracing.annotate(cache='miss')
+        return filepath
+
+    Tracing.annotate(cache='shared')
+    # The job trace ends with the leader's result, not when this returns
+    Tracing.finish_with(follower)
+    Tool.report_progress(progress, "waiting")
+    timer.start()
+    return follower
+
+def stream_or_download(url, platform, download_dir, progress=None):
+    """
+    Stream-mode job: hand out an /api/stream link for the resolved media URL,
+    or download the file as usual when it cannot be streamed directly.
+    """
+    with Tracing.trace('job', platform=platform, mode='stream', job_id=os.path.basename(download_dir)):
+        Tool.report_progress(progress, "resolve")
+        target, resolution = resolve_stream_target(url, platform)
+        if not target:
+            # The download reuses what the resolve scraped
+            return _download_with_cache(url, platform, download_dir, progress, resolution)
+
+        media_url, filename, headers = target
+        token = stream_targets.put(platform, media_url, filename, headers)
+        print(f"[Download] Streaming {platform} via token {token}")
+        return {
+            'mode': 'stream',
+            'filename': filename,
+            'download_url': f"/api/stream/{token}/{filename}",
+        }
+
+def resolve_stream_target(url, platform):
+    """
+    Resolve *url* for stream mode: ((media_url, filename, headers), resolution),
+    with no target when it has to be downloaded (already cached, HLS, merging)
+    """
+    key = result_cache.lookup_alias(url) or canonical_media_id(url, platform)
+    if key and result_cache.get(key):
+        # Already on disk - the job path serves it without touching the network
+        return None, None
+
+    entry, resolution, _ = resolve_media(url, platform, key)
+    if not entry:
+        return None, resolution
+    return (entry['url'], entry['filename'], entry['headers']), resolution
+
+@app.route('/api/resolve', methods=['POST'])
+def resolve():
+    """Resolve a post URL to its direct media URL without downloading it"""
+    with Tracing.trace('api.resolve'):
+        return _resolve_request()
+
+def _resolve_request():
+    try:
+        data = request.get_json() or {}
+        url = data.get('url', '').strip()
+        if not url or not url.startswith('http'):
+            return jsonify({'error': 'Invalid URL'}), 400
+
+        platform = detect_platform(url)
+        if not platform:
+            return jsonify({'error': 'Unsupported platform'}), 400
+        Tracing.annotate(platform=platform)
+
+        # Scraping can take seconds, so it runs on the job queue like downloads
+        try:
+            job = job_queue.submit(url, platform, resolve_job)
+        except QueueFullError as e:
+            return jsonify({'error': str(e)}), 503
+        return jsonify(queued_job_response(job)), 202
+
+    except Exception as e:
+        print(f"[Resolve Error] {str(e)}")
+        return jsonify({'error': str(e), 'error_kind': getattr(e, 'kind', None)}), 502
+
+class NotResolvableError(Exception):
+    """The media has no direct URL (HLS, formats that need merging)"""
+    kind = 'unsupported'
+
+def resolve_job(url, platform, download_dir, progress=None):
+    """Resolve job: the direct media URL of *url*, stored as the job result"""
+    with Tracing.trace('job', platform=platform, mode='resolve', job_id=os.path.basename(download_dir)):
+        Tool.report_progress(progress, "resolve")
+        key = result_cache.lookup_alias(url) or canonical_media_id(url, platform)
+        entry, _, cached = resolve_media(url, platform, key)
+        if not entry:
+            raise NotResolvableError('This media can only be downloaded through /api/download')
+        key = key or result_cache.lookup_alias(url)
+        return {
+            'media_id': key[1] if key else None,
+            'direct_url': entry['url'],
+            'filename': entry['filename'],
+            'expires_at': int(entry['expires_at']),
+            'cached': cached,
+        }
+
+def queued_job_response(job, **extra):
+    """202 body for a queued job: its id and where to follow it"""
+    return dict({
+        'success': True,
+        'job_id': job['id'],
+        'download_id': job['id'],
+        'platform': job['platform'],
+        'state': job['state'],
+        'status_url': f"/api/jobs/{job['id']}",
+        'events_url': f"/api/jobs/{job['id']}/events"
+    }, **extra)
+
 @app.route('/api/download', methods=['POST'])
 def download():
-    """Download video endpoint"""
+    """Queue a download job and return its id immediately"""
+    with Tracing.trace('api.download'):
+        return _start_download()
+
+def _start_download():
     try:
         data = request.get_json()
         url = data.get('url', '').strip()
@@ -256,128 +677,16 @@ def download():
             print(f"[Download Error] Unsupported platform for URL: {url}")
             return jsonify({'error': 'Unsupported platform'}), 400
 
-        # Create unique download directory
-        download_id = str(uuid.uuid4())
-        download_dir = os.path.join(app.config['DOWNLOAD_FOLDER'], download_id)
-        os.makedirs(download_dir, exist_ok=True)
-
-        filepath = None
-
+        mode = data.get('mode') or app.config['DOWNLOAD_MODE']
+        Tracing.annotate(platform=platform, mode=mode)
         try:
-            if platform == "tiktok":
-                # Use yt-dlp based downloader for TikTok
-                filepath = download_tiktok_video(url, download_dir)
-                print(f"[TikTok] Downloaded: {filepath}")
-
-            elif platform == "douyin":
-                # Use original downloader for Douyin (Chinese TikTok)
-                filepath = download_tiktok_douyin_video(url)
-                if filepath and os.path.exists(filepath):
-                    # Move to download dir
-                    new_path = os.path.join(download_dir, os.path.basename(filepath))
-                    shutil.move(filepath, new_path)
-                    filepath = new_path
-
-            elif platform == "threads":
-                filepath = download_threads_video(url, download_dir)
-                print(f"[Threads] Returned filepath: {filepath}")
-                print(f"[Threads] File exists: {os.path.exists(filepath) if filepath else 'None'}")
-                if filepath:
-                    print(f"[Threads] File size: {os.path.getsize(filepath) if os.path.exists(filepath) else 'N/A'}")
-                    print(f"[Threads] Download dir contents: {os.listdir(download_dir) if os.path.exists(download_dir) else 'Dir not found'}")
-
-            elif platform == "twitter":
-                filepath = download_twitter_video(url, download_dir)
-                print(f"[Twitter] Downloaded: {filepath}")
-
-            elif platform == "instagram":
-                filepath = download_instagram_media(url, download_dir)
-                print(f"[Instagram] Downloaded: {filepath}")
-
-            elif platform == "youtube":
-                # Use yt-dlp for YouTube with safe filename
-                import datetime
-                import re
-                timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-
-                # Extract video ID from URL for safer filename
-                video_id = ""
-                if "youtu.be/" in url:
-                    video_id = url.split("youtu.be/")[1].split("?")[0]
-                elif "youtube.com" in url:
-                    if "v=" in url:
-                        video_id = url.split("v=")[1].split("&")[0]
-                    elif "/shorts/" in url:
-                        video_id = url.split("/shorts/")[1].split("?")[0]
-
-                # Download to temp name first, then rename
-                temp_output = os.path.join(download_dir, "temp_youtube.%(ext)s")
-
-                cmd = [
-                    "yt-dlp",
-                    "-f", "best[ext=mp4]/best",
-                    "-o", temp_output,
-                    "--restrict-filenames",
-                    url
-                ]
-                print(f"[YouTube] Running: {' '.join(cmd)}")
-
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
-
-                if result.returncode == 0:
-                    # Find the downloaded file
-                    temp_file = None
-                    for file in os.listdir(download_dir):
-                        if file.startswith("temp_youtube."):
-                            temp_file = os.path.join(download_dir, file)
-                            break
-
-                    if temp_file and os.path.exists(temp_file):
-                        # Get file extension
-                        ext = os.path.splitext(temp_file)[1]
-                        # Create safe filename
-                        safe_filename = f"youtube_{video_id}_{timestamp}{ext}"
-                        final_path = os.path.join(download_dir, safe_filename)
-
-                        # Rename to safe filename
-                        os.rename(temp_file, final_path)
-                        filepath = final_path
-                        print(f"[YouTube] Downloaded and renamed: {filepath}")
-                    else:
-                        raise Exception("YouTube download completed but file not found")
-                else:
-                    raise Exception(f"yt-dlp failed: {result.stderr}")
-
-                print(f"[YouTube] Final path: {filepath}")
-
-            if not filepath or not os.path.exists(filepath):
-                raise Exception("Download failed - no file created")
+            # Stream mode resolves on the queue too; the link is in the job result
+            job = job_queue.submit(url, platform, stream_or_download if mode == 'stream' else download_with_cache)
+        except QueueFullError as e:
+            print(f"[Download Error] {str(e)}")
+            return jsonify({'error': str(e)}), 503
 
-            filename = os.path.basename(filepath)
-            file_size = os.path.getsize(filepath)
-
-            return jsonify({
-                'success': True,
-                'platform': platform,
-                'filename': filename,
-                'size': file_size,
-                'download_id': download_id,
-                'download_url': f'/api/file/{download_id}/{filename}'
-            })
-
-        except ThreadsDownloadError as e:
-            print(f"[Download Error] Threads error: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            shutil.rmtree(download_dir, ignore_errors=True)
-            return jsonify({'error': f'Threads error: {str(e)}'}), 500
-
-        except Exception as e:
-            print(f"[Download Error] Platform download failed: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            shutil.rmtree(download_dir, ignore_errors=True)
-            raise e
+        return jsonify(queued_job_response(job, mode=mode)), 202
 
     except Exception as e:
         print(f"[Download Error] Unexpected error: {str(e)}")
@@ -385,6 +694,88 @@ def download():
         traceback.print_exc()
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/jobs/<job_id>')
+def job_status(job_id):
+    """Report the state of a queued download job"""
+    job = job_queue.get(job_id)
+    if not job:
+        return jsonify({'error': 'Job not found'}), 404
+
+    return jsonify({
+        'job_id': job['id'],
+        'download_id': job['id'],
+        'platform': job['platform'],
+        'state': job['state'],
+        'filename': job.get('filename'),
+        'size': job.get('size'),
+        'download_url': job.get('download_url'),
+        'error': job.get('error'),
+        'error_kind': job.get('error_kind'),
+        'progress': job.get('progress'),
+        'result': job.get('result'),
+        'success': job['state'] == JOB_DONE,
+    })
+
+@app.route('/api/jobs/<job_id>/events')
+def job_events(job_id):
+    """
+    Stream job progress as Server-Sent Events.
+
+    A response lasts at most JOB_EVENTS_MAX_STREAM seconds so it does not
+    pin a worker thread for the whole job; the browser's EventSource then
+    reconnects after the ``retry:`` delay and gets the current state again.
+    A failed job is sent as a ``failed`` event (``error`` is EventSource's
+    own connection-error event).
+    """
+
+    if not job_queue.get(job_id):
+        return jsonify({'error': 'Job not found'}), 404
+
+    def generate():
+        last_sent = None
+        last_write = time.monotonic()
+        deadline = last_write + app.config['JOB_EVENTS_MAX_STREAM']
+        yield f"retry: {app.config['JOB_EVENTS_RETRY_MS']}\n\n"
+
+        while time.monotonic() < deadline:
+            job = job_queue.get(job_id)
+            if not job:
+                yield 'event: failed\ndata: {"state": "error", "error": "Job not found"}\n\n'
+                return
+
+            event = {
+                'job_id': job['id'],
+                'platform': job['platform'],
+                'state': job['state'],
+                'progress': job.get('progress'),
+            }
+            if job['state'] == JOB_DONE:
+                event.update(filename=job.get('filename'), size=job.get('size'),
+                             download_url=job.get('download_url'), result=job.get('result'))
+            elif job['state'] == JOB_ERROR:
+                event['error'] = job.get('error')
+                event['error_kind'] = job.get('error_kind')
+
+            payload = json.dumps(event)
+            if payload != last_sent:
+                last_sent = payload
+                last_write = time.monotonic()
+                name = 'failed' if job['state'] == JOB_ERROR else job['state']
+                yield f"event: {name}\ndata: {payload}\n\n"
+            elif time.monotonic() - last_write >= 15:
+                # Keep-alive comment so proxies do not close the idle stream
+                last_write = time.monotonic()
+                yield ': keep-alive\n\n'
+
+            if job['state'] in (JOB_DONE, JOB_ERROR):
+                return
+            time.sleep(0.5)
+
+    return Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no',
+    })
+
 @app.route('/api/file/<download_id>/<filename>')
 def download_file(download_id, filename):
     """Download file endpoint"""
@@ -398,14 +789,6 @@ def download_file(download_id, filename):
         if not os.path.exists(filepath):
             return jsonify({'error': 'File not found'}), 404
 
-        # Send file and cleanup after
-        def cleanup():
-            try:
-                shutil.rmtree(download_dir, ignore_errors=True)
-            except:
-                pass
-
-        # Schedule cleanup (will happen after file is sent)
         response = send_file(
             filepath,
             as_attachment=True,
@@ -413,23 +796,77 @@ def download_file(download_id, filename):
             mimetype='video/mp4'
         )
 
-        # Note: In production, use a background task to cleanup
-        # For now, files will be cleaned up manually or via cron
+        # The janitor deletes the directory once the grace period has passed
+        # (retries and range requests can still fetch it until then)
+        mark_served(download_dir)
 
         return response
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+def traced_stream(upstream, platform):
+    """Relay the upstream body, timing the transfer as an ``api.stream`` trace"""
+    with Tracing.trace('api.stream', platform=platform), Tracing.span('transfer') as sp:
+        for chunk in StreamProxy.iter_body(upstream):
+            sp.add_bytes(len(chunk))
+            yield chunk
+
+@app.route('/api/stream/<token>/<filename>')
+def stream_file(token, filename):
+    """Pipe a resolved media URL to the client without writing it to disk"""
+    target = stream_targets.get(token)
+    if not target:
+        return jsonify({'error': 'Stream link expired, please download again'}), 404
+
+    try:
+        upstream = StreamProxy.open_upstream(target, request.headers.get('Range'))
+    except Exception as e:
+        print(f"[Stream Error] Upstream request failed: {e}")
+        return jsonify({'error': f'Upstream request failed: {e}'}), 502
+
+    try:
+        headers = StreamProxy.response_headers(upstream)
+        name = target['filename']
+        headers['Content-Disposition'] = (
+            f"attachment; filename=\"{secure_filename(name) or 'video.mp4'}\"; filename*=UTF-8''{quote(name)}"
+        )
+        headers['Cache-Control'] = 'no-store'
+        headers['X-Accel-Buffering'] = 'no'
+        mimetype = upstream.headers.get('Content-Type') or 'video/mp4'
+
+        response = Response(
+            traced_stream(upstream, target.get('platform')),
+            status=upstream.status,
+            headers=headers,
+            mimetype=mimetype,
+            direct_passthrough=True,
+        )
+    except Exception:
+        upstream.close()
+        raise
+    # The body generator only closes upstream once it has started; a response
+    # dropped before the first chunk must still return the connection
+    response.call_on_close(upstream.close)
+    return response
+
 @app.route('/api/health')
 def health():
     """Health check endpoint"""
     return jsonify({
         'status': 'healthy',
         'service': 'video-downloader',
-        'languages': len(SUPPORTED_LANGUAGES)
+        'languages': len(SUPPORTED_LANGUAGES),
+        'janitor': janitor.stats(),
+        'resolve_cache': resolve_cache.stats(),
+        'browser_pool': browser_pool.stats()
     })
 
+@app.route('/metrics')
+def metrics_endpoint():
+    """Prometheus scrape endpoint"""
+    return Response(metrics.render(), content_type=Metrics.CONTENT_TYPE)
+
 @app.route('/api/languages')
 def languages():
     """List supported languages"""
@@ -499,12 +936,8 @@ def platforms():
     """List supported platforms"""
     return jsonify({
         'platforms': [
-            {'id': 'tiktok', 'name': 'TikTok', 'types': ['videos']},
-            {'id': 'douyin', 'name': 'Douyin (抖音)', 'types': ['videos']},
-            {'id': 'threads', 'name': 'Threads', 'types': ['videos', 'images']},
-            {'id': 'twitter', 'name': 'Twitter/X', 'types': ['videos']},
-            {'id': 'instagram', 'name': 'Instagram', 'types': ['videos', 'reels', 'photos']},
-            {'id': 'youtube', 'name': 'YouTube', 'types': ['videos', 'shorts']},
+            {'id': e.name, 'name': e.label, 'types': list(e.media_types)}
+            for e in Extractors.all_extractors()
         ]
     })
 
@@ -604,22 +1037,10 @@ def sitemap():
     response.headers['Content-Type'] = 'application/xml; charset=utf-8'
     return response
 
-# Cleanup old files (run periodically in production)
+# Cleanup old files (the janitor also runs this every JANITOR_INTERVAL seconds)
 def cleanup_old_downloads():
-    """Remove downloads older than 1 hour"""
-    import time
-    download_folder = app.config['DOWNLOAD_FOLDER']
-
-    if not os.path.exists(download_folder):
-        return
-
-    current_time = time.time()
-    for item in os.listdir(download_folder):
-        item_path = os.path.join(download_folder, item)
-        if os.path.isdir(item_path):
-            # Check if folder is older than 1 hour
-            if current_time - os.path.getctime(item_path) > 3600:
-                shutil.rmtree(item_path, ignore_errors=True)
+    """Remove served, expired and over-quota downloads"""
+    return janitor.sweep()
 
 if __name__ == '__main__':
     # Run cleanup before starting